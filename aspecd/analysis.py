@@ -220,10 +220,12 @@ Module documentation
 
 """
 
+import concurrent.futures
 import copy
+import itertools
+import math
 
 import numpy as np
-import scipy.signal
 
 import aspecd.dataset
 import aspecd.exceptions
@@ -231,6 +233,8 @@ import aspecd.history
 import aspecd.utils
 from aspecd.history import AnalysisHistoryRecord
 
+scipy = aspecd.utils.LazyModule("scipy")
+
 
 class AnalysisStep(aspecd.utils.ToDictMixin):
     """
@@ -624,13 +628,16 @@ class SingleAnalysisStep(AnalysisStep):
         history_record : :class:`aspecd.history.AnalysisHistoryRecord`
             history record for analysis step
 
+
+        .. versionchanged:: 0.12
+            The records of the preprocessing are shared with the history
+            of the dataset rather than deep copies
+
         """
         history_record = AnalysisHistoryRecord(
             analysis_step=self, package=self.dataset.package_name
         )
-        history_record.analysis.preprocessing = copy.deepcopy(
-            self.dataset.history
-        )
+        history_record.analysis.preprocessing = list(self.dataset.history)
         return history_record
 
 
@@ -716,6 +723,12 @@ class AggregatedAnalysisStep(AnalysisStep):
     on a series of datasets and aggregate the results in a single
     (calculated) dataset for further display, be it graphically or tabularly.
 
+    The results are collected and the data of the resulting dataset set
+    only once, hence aggregating the results of even thousands of datasets
+    is fast. Each dataset gets its own analysis step created, as would be
+    the case with :meth:`aspecd.dataset.Dataset.analyse`, and the analysis
+    recorded in its :attr:`aspecd.dataset.Dataset.analyses`.
+
     Attributes
     ----------
     datasets : :class:`list`
@@ -731,6 +744,18 @@ class AggregatedAnalysisStep(AnalysisStep):
     result : :class:`aspecd.dataset.CalculatedDataset`
         Result of the aggregated analysis
 
+    jobs : :class:`int`
+        Number of processes analysing the datasets in parallel.
+
+        The datasets are passed to the processes and the results and
+        history records passed back, what takes time as well. Hence,
+        this only pays off for analysis steps taking considerably longer
+        than passing the datasets.
+
+        Default: 1
+
+        .. versionadded:: 0.12
+
     Raises
     ------
     aspecd.exceptions.MissingDatasetError
@@ -780,6 +805,9 @@ class AggregatedAnalysisStep(AnalysisStep):
 
     .. versionadded:: 0.5
 
+    .. versionchanged:: 0.12
+        Results are aggregated at once; new attribute :attr:`jobs`
+
     """
 
     def __init__(self):
@@ -788,7 +816,9 @@ class AggregatedAnalysisStep(AnalysisStep):
         self.analysis_step = ""
         self.description = "Aggregated analysis step for multiple datasets"
         self.result = self.create_dataset()
+        self.jobs = 1
         self._analysis_object = None
+        self._analysis_class = None
         self.__kind__ = "aggregatedanalysis"
         self._exclude_from_to_dict.extend(["datasets", "result"])
 
@@ -804,20 +834,38 @@ class AggregatedAnalysisStep(AnalysisStep):
 
         """
         self._check_and_prepare()
-        index = []
-        for dataset in self.datasets:
-            analysis_done = dataset.analyse(self._analysis_object)
-            self.result.data.data = np.append(
-                self.result.data.data, analysis_done.result
-            )
-            index.append(dataset.label)
-        n_datasets = len(self.datasets)
-        # noinspection PyUnboundLocalVariable
-        if isinstance(analysis_done.result, list):
-            self.result.data.data = np.reshape(
-                self.result.data.data, (n_datasets, -1)
-            )
-        self.result.data.axes[0].index = index
+        analysis_steps = [
+            self._create_analysis_object() for _ in self.datasets
+        ]
+        if self.jobs > 1:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.jobs
+            ) as executor:
+                analyses = list(
+                    executor.map(
+                        _analyse_dataset,
+                        analysis_steps,
+                        self.datasets,
+                        chunksize=math.ceil(len(self.datasets) / self.jobs),
+                    )
+                )
+        else:
+            analyses = map(_analyse_dataset, analysis_steps, self.datasets)
+        results = []
+        for dataset, (result, history_record) in zip(self.datasets, analyses):
+            history_record.analysis.preprocessing = list(dataset.history)
+            dataset.append_analysis_record(history_record)
+            results.append(result)
+        # Same as appending each result to the data, but at once
+        data = np.concatenate(
+            [self.result.data.data] + [np.ravel(result) for result in results]
+        )
+        if isinstance(results[-1], list):
+            data = np.reshape(data, (len(self.datasets), -1))
+        self.result.data.data = data
+        self.result.data.axes[0].index = [
+            dataset.label for dataset in self.datasets
+        ]
         self._assign_origdata_in_dataset()
 
     def _check_and_prepare(self):
@@ -833,16 +881,23 @@ class AggregatedAnalysisStep(AnalysisStep):
 
     def _get_analysis_object(self):
         try:
-            self._analysis_object = aspecd.utils.object_from_class_name(
+            self._analysis_class = aspecd.utils.class_from_name(
                 self.analysis_step
             )
         except ValueError:
-            self._analysis_object = aspecd.utils.object_from_class_name(
+            self._analysis_class = aspecd.utils.class_from_name(
                 ".".join(["aspecd.analysis", self.analysis_step])
             )
+        self._analysis_object = self._create_analysis_object()
+
+    def _create_analysis_object(self):
+        # Creating is faster than deep-copying, and the parameters are the
+        # only difference to a newly created analysis step
+        analysis_object = self._analysis_class()
         for key, value in self.parameters.items():
             # noinspection PyUnresolvedReferences
-            self._analysis_object.parameters[key] = value
+            analysis_object.parameters[key] = copy.deepcopy(value)
+        return analysis_object
 
 
 class BasicCharacteristics(SingleAnalysisStep):
@@ -1345,12 +1400,26 @@ class PeakFinding(SingleAnalysisStep):
     details of the parameters, see as well the SciPy documentation.
 
     .. important::
-        Peak finding can only be applied to 1D datasets, due to the
-        underlying algorithm.
+        Peak finding can only be applied to 1D and 2D datasets, due to the
+        underlying algorithm. For 2D datasets, peaks are searched for in
+        each slice along the given axis, all in one analysis step. As the
+        number of peaks differs between slices, the results are "indexed",
+        *i.e.* each row contains the position of the slice and the
+        position of a peak found in this slice (see below).
 
 
     Attributes
     ----------
+    jobs : :class:`int`
+        Number of processes finding peaks in parallel.
+
+        Only relevant for 2D datasets with many slices, as starting the
+        processes and passing the data to them takes time as well.
+
+        Default: 1
+
+        .. versionadded:: 0.12
+
     parameters : :class:`dict`
         All parameters necessary for this step.
 
@@ -1438,6 +1507,35 @@ class PeakFinding(SingleAnalysisStep):
 
             Default: None
 
+        axis : :class:`int`
+            Axis along which to find peaks.
+
+            Only necessary in case of 2D data.
+
+            Default: 0
+
+            .. versionadded:: 0.12
+
+
+    For 2D datasets, the different results are as follows:
+
+    * By default, a 2D numpy array with the positions of the slices
+      (*i.e.*, axis values of the other axis) in the first and the peak
+      positions in the second column, one row per peak.
+
+    * If ``return_intensities`` is set, a third column with the peak
+      intensities.
+
+    * If ``return_properties`` is set, a tuple with a 2D numpy array with
+      the indices of the slices in the first and the indices of the peaks
+      in the second column, and a dictionary with the peak properties for
+      all rows of this array.
+
+    * If ``return_dataset`` is set, a calculated dataset with the same
+      axes and shape as the analysed dataset, with the data containing the
+      peak intensities and NaN elsewhere. Thus, this can be used to plot
+      the peaks on top of the original data.
+
 
     Examples
     --------
@@ -1519,13 +1617,38 @@ class PeakFinding(SingleAnalysisStep):
     peaks as well, this option will silently be ignored and only the peak
     positions returned.
 
+    For 2D datasets, peaks are searched for in each slice along the given
+    axis, here for each slice along the second axis (index 1), *i.e.* in
+    the rows of the data, using four processes:
+
+    .. code-block:: yaml
+
+       - kind: singleanalysis
+         type: PeakFinding
+         properties:
+           parameters:
+             prominence: 0.2
+             axis: 1
+           jobs: 4
+         result: peaks
+
+    The result, here stored in the variable "peaks", will be a 2D array
+    with the positions of the slices (*i.e.*, the values of the first
+    axis) in the first and the peak positions in the second column.
+
+
     .. versionadded:: 0.2
 
+    .. versionchanged:: 0.12
+        Applicable to 2D datasets; new parameter ``axis``, new attribute
+        :attr:`jobs`
+
     """
 
     def __init__(self):
         super().__init__()
-        self.description = "Peak finding in 1D"
+        self.description = "Peak finding in 1D and 2D"
+        self.jobs = 1
         self.parameters["negative_peaks"] = False
         self.parameters["return_properties"] = False
         self.parameters["return_dataset"] = False
@@ -1535,13 +1658,14 @@ class PeakFinding(SingleAnalysisStep):
         self.parameters["distance"] = None
         self.parameters["prominence"] = None
         self.parameters["width"] = None
+        self.parameters["axis"] = 0
 
     @staticmethod
     def applicable(dataset):
         """
         Check whether analysis step is applicable to the given dataset.
 
-        Peak finding can only be applied to 1D datasets.
+        Peak finding can only be applied to 1D and 2D datasets.
 
         Parameters
         ----------
@@ -1554,27 +1678,22 @@ class PeakFinding(SingleAnalysisStep):
             Whether dataset is applicable
 
         """
-        return dataset.data.data.ndim == 1
+        return dataset.data.data.ndim in (1, 2)
+
+    def _sanitise_parameters(self):
+        if self.parameters["axis"] not in (0, 1):
+            raise IndexError(f"Axis {self.parameters['axis']} out of bounds")
 
     def _perform_task(self):
-        peaks, properties = scipy.signal.find_peaks(
-            self.dataset.data.data,
-            height=self.parameters["height"],
-            threshold=self.parameters["threshold"],
-            distance=self.parameters["distance"],
-            prominence=self.parameters["prominence"],
-            width=self.parameters["width"],
+        if self.dataset.data.data.ndim == 1:
+            self._find_peaks_in_data()
+        else:
+            self._find_peaks_in_slices()
+
+    def _find_peaks_in_data(self):
+        peaks, properties = _find_peaks(
+            self.dataset.data.data, self.parameters
         )
-        if self.parameters["negative_peaks"]:
-            negative, _ = scipy.signal.find_peaks(
-                -self.dataset.data.data,
-                height=self.parameters["height"],
-                threshold=self.parameters["threshold"],
-                distance=self.parameters["distance"],
-                prominence=self.parameters["prominence"],
-                width=self.parameters["width"],
-            )
-            peaks = np.sort(np.concatenate((peaks, negative)))
         if self.parameters["return_dataset"]:
             dataset = self.create_dataset()
             dataset.data.data = self.dataset.data.data[peaks]
@@ -1600,6 +1719,53 @@ class PeakFinding(SingleAnalysisStep):
         else:
             self.result = self.dataset.data.axes[0].values[peaks]
 
+    def _find_peaks_in_slices(self):
+        axis = self.parameters["axis"]
+        # One slice per row
+        data = np.moveaxis(self.dataset.data.data, axis, -1)
+        if self.jobs > 1:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.jobs
+            ) as executor:
+                results = [
+                    result
+                    for results in executor.map(
+                        _find_peaks_in_rows,
+                        np.array_split(data, self.jobs),
+                        itertools.repeat(self.parameters),
+                    )
+                    for result in results
+                ]
+        else:
+            results = _find_peaks_in_rows(data, self.parameters)
+        peaks = [result[0] for result in results]
+        slices = np.repeat(np.arange(len(peaks)), [len(row) for row in peaks])
+        peaks = np.concatenate(peaks).astype(int)
+        if self.parameters["return_dataset"]:
+            dataset = self.create_dataset()
+            intensities = np.full(data.shape, np.nan)
+            intensities[slices, peaks] = data[slices, peaks]
+            dataset.data.data = np.moveaxis(intensities, -1, axis)
+            dataset.data.axes = copy.deepcopy(self.dataset.data.axes)
+            self.result = dataset
+        elif (
+            self.parameters["return_properties"]
+            and not self.parameters["negative_peaks"]
+        ):
+            properties = {
+                key: np.concatenate([result[1][key] for result in results])
+                for key in results[0][1]
+            }
+            self.result = (np.stack((slices, peaks), axis=1), properties)
+        else:
+            columns = [
+                self.dataset.data.axes[1 - axis].values[slices],
+                self.dataset.data.axes[axis].values[peaks],
+            ]
+            if self.parameters["return_intensities"]:
+                columns.append(data[slices, peaks])
+            self.result = np.stack(columns, axis=1)
+
 
 class PowerDensitySpectrum(SingleAnalysisStep):
     # noinspection PyUnresolvedReferences
@@ -2253,3 +2419,36 @@ class CentreOfMass(SingleAnalysisStep):
             for axis_values in axes_values
         ]
         self.result = np.array(coordinates)
+
+
+def _find_peaks(data, parameters):
+    peaks, properties = scipy.signal.find_peaks(
+        data,
+        height=parameters["height"],
+        threshold=parameters["threshold"],
+        distance=parameters["distance"],
+        prominence=parameters["prominence"],
+        width=parameters["width"],
+    )
+    if parameters["negative_peaks"]:
+        negative, _ = scipy.signal.find_peaks(
+            -data,
+            height=parameters["height"],
+            threshold=parameters["threshold"],
+            distance=parameters["distance"],
+            prominence=parameters["prominence"],
+            width=parameters["width"],
+        )
+        peaks = np.sort(np.concatenate((peaks, negative)))
+    return peaks, properties
+
+
+def _find_peaks_in_rows(data, parameters):
+    # Module-level function, as it needs to be pickled for process pools
+    return [_find_peaks(row, parameters) for row in data]
+
+
+def _analyse_dataset(analysis_step, dataset):
+    # Module-level function, as it needs to be pickled for process pools
+    analysis_step.analyse(dataset, from_dataset=True)
+    return analysis_step.result, analysis_step.create_history_record()
@@ -111,15 +111,17 @@ Module documentation
 
 """
 
-import matplotlib
 import numpy as np
 
 import aspecd.dataset
 import aspecd.exceptions
 import aspecd.history
 import aspecd.plotting
+import aspecd.utils
 from aspecd.utils import ToDictMixin
 
+matplotlib = aspecd.utils.LazyModule("matplotlib")
+
 
 class DatasetAnnotation(ToDictMixin):
     """
@@ -60,6 +60,13 @@ framework, are:
     in many cases, parallel to these actual data, other data are recorded
     as well, be it readouts from monitors or alike.
 
+  * :class:`aspecd.dataset.Checkpoints`
+
+    Snapshots of the data of a dataset at given positions in its history.
+
+    Used internally to speed up undo and redo, as only the processing steps
+    following the nearest snapshot need to be replayed.
+
   * :class:`aspecd.dataset.DatasetReference`
 
     Reference to a dataset.
@@ -124,7 +131,10 @@ Module documentation
 
 """
 
+import collections
 import copy
+import mmap
+import os
 
 import numpy as np
 
@@ -232,6 +242,18 @@ class Dataset(aspecd.utils.ToDictMixin):
         of steps performed on a dataset are of relevance, regardless of
         their particular type, *e.g.*, in context of reports.
 
+    checkpoints : :class:`aspecd.dataset.Checkpoints`
+        Snapshots of the data at given positions in the history
+
+        Used by :meth:`undo` and :meth:`redo` to only replay the processing
+        steps following the nearest snapshot. See
+        :class:`aspecd.dataset.Checkpoints` for how to control when
+        snapshots are taken and how much memory they may occupy.
+
+        The value is set automatically and is read-only.
+
+        .. versionadded:: 0.12
+
     Raises
     ------
     aspecd.exceptions.UndoWithEmptyHistoryError
@@ -251,6 +273,7 @@ class Dataset(aspecd.utils.ToDictMixin):
         super().__init__()
         self.data = Data()
         self._origdata = Data()
+        self._origdata_position = -1
         self.device_data = {}
         self.metadata = aspecd.metadata.DatasetMetadata()
         self.history = []
@@ -262,6 +285,7 @@ class Dataset(aspecd.utils.ToDictMixin):
         self.label = ""
         self.references = []
         self.tasks = []
+        self._checkpoints = Checkpoints()
         # Package name is used to store the package version in history records
         self._package_name = aspecd.utils.package_name(self)
         self._include_in_to_dict = [
@@ -281,6 +305,18 @@ class Dataset(aspecd.utils.ToDictMixin):
         """
         return self._package_name
 
+    @property
+    def checkpoints(self):
+        """Return checkpoints used for undo and redo.
+
+        Snapshots of the data at given positions in the history. For
+        details, see :class:`aspecd.dataset.Checkpoints`.
+
+        .. versionadded:: 0.12
+
+        """
+        return self._checkpoints
+
     def process(self, processing_step=None):
         """Apply processing step to dataset.
 
@@ -318,11 +354,14 @@ class Dataset(aspecd.utils.ToDictMixin):
         self._check_processing_prerequisites(processing_step=processing_step)
         # Important: Need a copy, not the reference to the original object
         processing_step = copy.deepcopy(processing_step)
+        if not self.history:
+            self._checkpoints.add(position=-1, data=self.data)
         processing_step.process(self, from_dataset=True)
         history_record = processing_step.create_history_record()
         self.append_history_record(history_record)
         self._append_task(kind="processing", task=history_record)
         self._handle_not_undoable(processing_step=processing_step)
+        self._add_checkpoint_if_due()
         return processing_step
 
     def _check_processing_prerequisites(self, processing_step=None):
@@ -333,22 +372,34 @@ class Dataset(aspecd.utils.ToDictMixin):
 
     def _handle_not_undoable(self, processing_step=None):
         if not processing_step.undoable:
-            self._origdata = copy.deepcopy(self.data)
+            self._reset_origdata()
             self.representations = []
 
+    def _reset_origdata(self):
+        self._origdata = copy.deepcopy(self.data)
+        self._origdata_position = self._history_pointer
+
     def undo(self):
         """Revert last processing step.
 
         Actually, the history pointer is decremented and starting from the
-        ``_origdata``, all processing steps are reapplied to the data up to
-        this point in history.
+        nearest checkpoint (see :attr:`checkpoints`), all processing steps
+        are reapplied to the data up to this point in history. If the
+        ``_origdata`` correspond to a later position in history than the
+        nearest checkpoint, but not after the new position of the history
+        pointer, they are used as a starting point instead.
+
+        Hence, the cost of undoing a step does not grow with the length of
+        the history, but only depends on the interval between checkpoints.
 
         Raises
         ------
         aspecd.exceptions.UndoWithEmptyHistoryError
             Raised when trying to undo with empty history
         aspecd.exceptions.UndoAtBeginningOfHistoryError
-            Raised when trying to undo with history pointer at zero
+            Raised when trying to undo with history pointer at zero or
+            before the earliest data available, *e.g.* for datasets
+            imported together with their history
         aspecd.exceptions.UndoStepUndoableError
             Raised when trying to undo an undoable step of history
 
@@ -362,6 +413,8 @@ class Dataset(aspecd.utils.ToDictMixin):
             raise aspecd.exceptions.UndoWithEmptyHistoryError
         if self._history_pointer == -1:
             raise aspecd.exceptions.UndoAtBeginningOfHistoryError
+        if not self._can_replay_to(self._history_pointer - 1):
+            raise aspecd.exceptions.UndoAtBeginningOfHistoryError
         if self.history[self._history_pointer].undoable:
             raise aspecd.exceptions.UndoStepUndoableError
 
@@ -376,12 +429,9 @@ class Dataset(aspecd.utils.ToDictMixin):
         """
         if self._at_tip_of_history():
             raise aspecd.exceptions.RedoAlreadyAtLatestChangeError
-        processing_step_record = self.history[
-            self._history_pointer + 1
-        ].processing
-        processing_step = processing_step_record.create_processing_step()
-        processing_step.process(self, from_dataset=True)
+        self._apply_history_record(self.history[self._history_pointer + 1])
         self._increment_history_pointer()
+        self._add_checkpoint_if_due()
 
     def _at_tip_of_history(self):
         return self._history_pointer == len(self.history) - 1
@@ -423,10 +473,33 @@ class Dataset(aspecd.utils.ToDictMixin):
     def _decrement_history_pointer(self):
         self._history_pointer -= 1
 
+    def _can_replay_to(self, position):
+        return self._origdata_position <= position or any(
+            key <= position for key in self._checkpoints.positions
+        )
+
     def _replay_history(self):
-        self.data = self._origdata
-        for history_entry in self.history[: self._history_pointer]:
-            history_entry.replay(self)
+        position, data = self._checkpoints.nearest(self._history_pointer)
+        if (
+            position is None or position < self._origdata_position
+        ) and self._origdata_position <= self._history_pointer:
+            position = self._origdata_position
+            data = copy.deepcopy(self._origdata)
+        self.data = data
+        for history_record in self.history[
+            position + 1 : self._history_pointer + 1
+        ]:
+            self._apply_history_record(history_record)
+
+    def _apply_history_record(self, history_record):
+        processing_step = history_record.processing.create_processing_step()
+        processing_step.process(self, from_dataset=True)
+
+    def _add_checkpoint_if_due(self):
+        if self._checkpoints.due(self._history_pointer):
+            self._checkpoints.add(
+                position=self._history_pointer, data=self.data
+            )
 
     def strip_history(self):
         """Remove leading history, if any.
@@ -441,6 +514,9 @@ class Dataset(aspecd.utils.ToDictMixin):
         if not self._has_leading_history():
             return
         del self.history[self._history_pointer + 1 :]
+        self._checkpoints.discard_after(self._history_pointer)
+        if self._origdata_position > self._history_pointer:
+            self._reset_origdata()
 
     def analyse(self, analysis_step=None):
         """Apply analysis to dataset.
@@ -469,9 +545,7 @@ class Dataset(aspecd.utils.ToDictMixin):
         # Important: Need a copy, not the reference to the original object
         analysis_step = copy.deepcopy(analysis_step)
         analysis_step.analyse(self, from_dataset=True)
-        history_record = analysis_step.create_history_record()
-        self.analyses.append(history_record)
-        self._append_task(kind="analysis", task=history_record)
+        self.append_analysis_record(analysis_step.create_history_record())
         return analysis_step
 
     def analyze(self, analysis_step=None):
@@ -484,6 +558,25 @@ class Dataset(aspecd.utils.ToDictMixin):
         analysis_step = self.analyse(analysis_step)
         return analysis_step
 
+    def append_analysis_record(self, history_record):
+        """Append history record of an analysis to the analyses.
+
+        This method should never be called manually, but only from within
+        classes of the ASpecD framework.
+
+        Parameters
+        ----------
+        history_record : :class:`aspecd.history.AnalysisHistoryRecord`
+            History record (of an analysis step) to be appended.
+
+
+        .. versionadded:: 0.12
+            Due to needs of :class:`aspecd.analysis.AggregatedAnalysisStep`
+
+        """
+        self.analyses.append(history_record)
+        self._append_task(kind="analysis", task=history_record)
+
     def delete_analysis(self, index=None):
         """Remove analysis step record from dataset.
 
@@ -556,11 +649,28 @@ class Dataset(aspecd.utils.ToDictMixin):
         if not plotter:
             raise aspecd.exceptions.MissingPlotterError
         plotter.plot(dataset=self, from_dataset=True)
-        plot_record = plotter.create_history_record()
-        self.representations.append(plot_record)
-        self._append_task(kind="representation", task=plot_record)
+        self.append_plot_record(plotter.create_history_record())
         return plotter
 
+    def append_plot_record(self, history_record):
+        """Append history record of a plot to the representations.
+
+        This method should never be called manually, but only from within
+        classes of the ASpecD framework.
+
+        Parameters
+        ----------
+        history_record : :class:`aspecd.history.PlotHistoryRecord`
+            History record (of a plot) to be appended.
+
+
+        .. versionadded:: 0.12
+            Due to needs of :class:`aspecd.tasks.SingleplotTask`
+
+        """
+        self.representations.append(history_record)
+        self._append_task(kind="representation", task=history_record)
+
     def tabulate(self, table=None):
         """Create table from data of current dataset.
 
@@ -656,7 +766,8 @@ class Dataset(aspecd.utils.ToDictMixin):
                 "No importer provided"
             )
         importer.import_into(self)
-        self._origdata = copy.deepcopy(self.data)
+        self._reset_origdata()
+        self._checkpoints.clear()
 
     def export_to(self, exporter=None):
         """Export data and metadata.
@@ -739,6 +850,63 @@ class Dataset(aspecd.utils.ToDictMixin):
                 del self.references[index]
                 break
 
+    def to_dict(self, remove_empty=False):
+        """
+        Create dictionary containing public attributes of the dataset.
+
+        History records occur more than once in a dataset: Records of
+        analyses and plots contain the processing history of the dataset
+        at that time (as preprocessing), and all analyses, annotations,
+        and plots are contained in :attr:`tasks` as well. The dictionaries
+        of these records are the same objects. Hence, when written to YAML
+        (or ASDF) files, each record is stored only once, with all further
+        occurrences referring to it (as YAML alias).
+
+        Parameters
+        ----------
+        remove_empty : :class:`bool`
+            Whether to remove empty fields
+
+            Default: False
+
+        Returns
+        -------
+        public_attributes : :class:`collections.OrderedDict`
+            Ordered dictionary containing the public attributes of the object
+
+
+        .. versionadded:: 0.12
+
+        """
+        dict_ = super().to_dict(remove_empty=remove_empty)
+        record_dicts = {}
+        for key in ["history", "analyses", "annotations", "representations"]:
+            for record, record_dict in zip(
+                getattr(self, key), dict_.get(key, [])
+            ):
+                record_dicts[id(record)] = record_dict
+        for record, record_dict in zip(
+            self.analyses + self.representations,
+            dict_.get("analyses", []) + dict_.get("representations", []),
+        ):
+            for key in ["analysis", "plot"]:
+                if hasattr(record, key) and key in record_dict:
+                    self._share_preprocessing(
+                        getattr(record, key), record_dict[key], record_dicts
+                    )
+        for task, task_dict in zip(self.tasks, dict_.get("tasks", [])):
+            if id(task["task"]) in record_dicts:
+                task_dict["task"] = record_dicts[id(task["task"])]
+        return dict_
+
+    @staticmethod
+    def _share_preprocessing(record, record_dict, record_dicts):
+        if not hasattr(record, "preprocessing"):
+            return
+        for index, step in enumerate(record.preprocessing):
+            if id(step) in record_dicts:
+                record_dict["preprocessing"][index] = record_dicts[id(step)]
+
     def from_dict(self, dict_=None):  # noqa: MC0001
         """
         Set properties from dictionary.
@@ -757,7 +925,15 @@ class Dataset(aspecd.utils.ToDictMixin):
         dict_ : :class:`dict`
             Dictionary containing properties to set
 
+
+        .. versionchanged:: 0.12
+            Tasks referring to the same dictionaries as the history,
+            analyses, annotations, or representations share their records,
+            as do the preprocessing of analyses and representations and
+            the history
+
         """
+        records = {}
         for key in dict_:
             if hasattr(self, key):
                 attribute = getattr(self, key)
@@ -766,21 +942,31 @@ class Dataset(aspecd.utils.ToDictMixin):
                         record = aspecd.history.ProcessingHistoryRecord()
                         record.from_dict(element)
                         self.history.append(record)
+                        records[id(element)] = record
                 elif key == "analyses":
                     for element in dict_[key]:
                         record = aspecd.history.AnalysisHistoryRecord()
                         record.from_dict(element)
+                        record.analysis.preprocessing = _shared_records(
+                            record.analysis.preprocessing, records
+                        )
                         self.analyses.append(record)
+                        records[id(element)] = record
                 elif key == "annotations":
                     for element in dict_[key]:
                         record = aspecd.history.AnnotationHistoryRecord()
                         record.from_dict(element)
                         self.annotations.append(record)
+                        records[id(element)] = record
                 elif key == "representations":
                     for element in dict_[key]:
                         record = aspecd.history.PlotHistoryRecord()
                         record.from_dict(element)
+                        record.plot.preprocessing = _shared_records(
+                            record.plot.preprocessing, records
+                        )
                         self.representations.append(record)
+                        records[id(element)] = record
                 elif key == "references":
                     for element in dict_[key]:
                         record = DatasetReference()
@@ -788,6 +974,14 @@ class Dataset(aspecd.utils.ToDictMixin):
                         self.references.append(record)
                 elif key == "tasks":
                     for element in dict_[key]:
+                        if id(element["task"]) in records:
+                            self.tasks.append(
+                                {
+                                    "kind": element["kind"],
+                                    "task": records[id(element["task"])],
+                                }
+                            )
+                            continue
                         if element["kind"] == "representation":
                             record_class_name = (
                                 "aspecd.history.PlotHistoryRecord"
@@ -815,6 +1009,84 @@ class Dataset(aspecd.utils.ToDictMixin):
                 else:
                     setattr(self, key, dict_[key])
 
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Apply NumPy universal function to the data of the dataset(s).
+
+        Allows to use NumPy universal functions (ufuncs) directly with
+        datasets, returning a new dataset whose data have been operated
+        upon:
+
+        .. code-block::
+
+            result = np.sqrt(dataset)
+            result = np.add(dataset1, dataset2)
+
+        Only the new data array is allocated, all other information of the
+        dataset (such as the history) is shared with the original dataset,
+        see :meth:`__add__` for details. Providing datasets as ``out``
+        argument operates in place on their data.
+
+        Returns
+        -------
+        result : :class:`aspecd.dataset.Dataset`
+            New dataset whose data have been operated upon, or the dataset(s)
+            given as ``out`` argument.
+
+
+        .. versionadded:: 0.12
+
+        """
+        if method != "__call__":
+            return NotImplemented
+        arrays = [
+            (
+                _shared_array(input_.data)
+                if isinstance(input_, Dataset)
+                else input_
+            )
+            for input_ in inputs
+        ]
+        outputs = kwargs.get("out", ())
+        if outputs:
+            kwargs["out"] = tuple(
+                output.data.data if isinstance(output, Dataset) else output
+                for output in outputs
+            )
+        results = getattr(ufunc, method)(*arrays, **kwargs)
+        if outputs:
+            return outputs[0] if ufunc.nout == 1 else outputs
+        if ufunc.nout == 1:
+            return self._copy_with_data(results)
+        return tuple(self._copy_with_data(result) for result in results)
+
+    def _copy_with_data(self, data):
+        # Copy the dataset sharing everything but the numeric data. History
+        # records are immutable and the lists only ever get appended to or
+        # truncated, hence copying the lists suffices. Data objects share
+        # their arrays until accessed (copy-on-write).
+        # pylint: disable=protected-access
+        result = copy.copy(self)
+        result.__dict__["__odict__"] = collections.OrderedDict(self.__odict__)
+        for attribute in (
+            "history",
+            "analyses",
+            "annotations",
+            "representations",
+            "references",
+            "tasks",
+            "_include_in_to_dict",
+        ):
+            setattr(result, attribute, list(getattr(self, attribute)))
+        # Providing the new array via the memo avoids copying the old one
+        result.data = copy.deepcopy(self.data, {id(self.data._data): data})
+        result.data.data = data
+        result._origdata = copy.deepcopy(self._origdata)
+        result.device_data = copy.deepcopy(self.device_data)
+        result.metadata = copy.deepcopy(self.metadata)
+        result._checkpoints = copy.copy(self._checkpoints)
+        return result
+
     def __add__(self, other):
         """
         Arithmetic addition
@@ -829,6 +1101,13 @@ class Dataset(aspecd.utils.ToDictMixin):
 
         In case of two datasets, an element-wise addition will be performed.
 
+        .. note::
+            Only the data array of the new dataset is newly allocated. All
+            other information, such as metadata and history, is not copied,
+            but shared with the original dataset until modified. Hence,
+            operating on many datasets is cheap. To operate on the data of
+            the dataset in place, use the operator ``+=``.
+
         Parameters
         ----------
         other : scalar | :class:`aspecd.dataset.Dataset`
@@ -843,12 +1122,7 @@ class Dataset(aspecd.utils.ToDictMixin):
         .. versionadded:: 0.12
 
         """
-        result = copy.deepcopy(self)
-        if isinstance(other, type(self)):
-            result.data.data += other.data.data
-        else:
-            result.data.data += other
-        return result
+        return np.add(self, other)
 
     def __sub__(self, other):
         """
@@ -879,12 +1153,7 @@ class Dataset(aspecd.utils.ToDictMixin):
         .. versionadded:: 0.12
 
         """
-        result = copy.deepcopy(self)
-        if isinstance(other, type(self)):
-            result.data.data -= other.data.data
-        else:
-            result.data.data -= other
-        return result
+        return np.subtract(self, other)
 
     def __mul__(self, other):
         """
@@ -915,12 +1184,7 @@ class Dataset(aspecd.utils.ToDictMixin):
         .. versionadded:: 0.12
 
         """
-        result = copy.deepcopy(self)
-        if isinstance(other, type(self)):
-            result.data.data *= other.data.data
-        else:
-            result.data.data *= other
-        return result
+        return np.multiply(self, other)
 
     def __truediv__(self, other):
         """
@@ -951,12 +1215,141 @@ class Dataset(aspecd.utils.ToDictMixin):
         .. versionadded:: 0.12
 
         """
-        result = copy.deepcopy(self)
-        if isinstance(other, type(self)):
-            result.data.data /= other.data.data
-        else:
-            result.data.data /= other
-        return result
+        return np.divide(self, other)
+
+    def __iadd__(self, other):
+        """
+        In-place arithmetic addition.
+
+        Add a scalar or a dataset to the data of the given dataset in place,
+        *i.e.* without creating a new dataset. Allows to use the operator
+        ``+=`` in code:
+
+        .. code-block::
+
+            dataset += 1
+            dataset1 += dataset2
+
+        Parameters
+        ----------
+        other : scalar | :class:`aspecd.dataset.Dataset`
+            Summand
+
+        Returns
+        -------
+        dataset : :class:`aspecd.dataset.Dataset`
+            Dataset whose data have been arithmetically operated upon.
+
+
+        .. versionadded:: 0.12
+
+        """
+        return np.add(self, other, out=(self,))
+
+    def __isub__(self, other):
+        """
+        In-place arithmetic subtraction.
+
+        Subtract a scalar or a dataset from the data of the given dataset in
+        place, *i.e.* without creating a new dataset. Allows to use the
+        operator ``-=`` in code:
+
+        .. code-block::
+
+            dataset -= 1
+            dataset1 -= dataset2
+
+        Parameters
+        ----------
+        other : scalar | :class:`aspecd.dataset.Dataset`
+            Subtrahend
+
+        Returns
+        -------
+        dataset : :class:`aspecd.dataset.Dataset`
+            Dataset whose data have been arithmetically operated upon.
+
+
+        .. versionadded:: 0.12
+
+        """
+        return np.subtract(self, other, out=(self,))
+
+    def __imul__(self, other):
+        """
+        In-place arithmetic multiplication.
+
+        Multiply the data of the given dataset with a scalar or a dataset in
+        place, *i.e.* without creating a new dataset. Allows to use the
+        operator ``*=`` in code:
+
+        .. code-block::
+
+            dataset *= 42
+            dataset1 *= dataset2
+
+        Parameters
+        ----------
+        other : scalar | :class:`aspecd.dataset.Dataset`
+            Factor
+
+        Returns
+        -------
+        dataset : :class:`aspecd.dataset.Dataset`
+            Dataset whose data have been arithmetically operated upon.
+
+
+        .. versionadded:: 0.12
+
+        """
+        return np.multiply(self, other, out=(self,))
+
+    def __itruediv__(self, other):
+        """
+        In-place arithmetic division.
+
+        Divide the data of the given dataset by a scalar or a dataset in
+        place, *i.e.* without creating a new dataset. Allows to use the
+        operator ``/=`` in code:
+
+        .. code-block::
+
+            dataset /= 42
+            dataset1 /= dataset2
+
+        Note that the data of the dataset need to be of floating point type.
+
+        Parameters
+        ----------
+        other : scalar | :class:`aspecd.dataset.Dataset`
+            Denominator
+
+        Returns
+        -------
+        dataset : :class:`aspecd.dataset.Dataset`
+            Dataset whose data have been arithmetically operated upon.
+
+
+        .. versionadded:: 0.12
+
+        """
+        return np.divide(self, other, out=(self,))
+
+    def __radd__(self, other):
+        """Reflected arithmetic addition, see :meth:`__add__`."""
+        return np.add(other, self)
+
+    def __rsub__(self, other):
+        """Reflected arithmetic subtraction, see :meth:`__sub__`."""
+        return np.subtract(other, self)
+
+    def __rmul__(self, other):
+        """Reflected arithmetic multiplication, see :meth:`__mul__`."""
+        return np.multiply(other, self)
+
+    def __rtruediv__(self, other):
+        """Reflected arithmetic division, see :meth:`__truediv__`."""
+        return np.divide(other, self)
 
 
 class ExperimentalDataset(Dataset):
@@ -1005,6 +1398,216 @@ class CalculatedDataset(Dataset):
         self.metadata = aspecd.metadata.CalculatedDatasetMetadata()
 
 
+class Checkpoints:
+    """
+    Snapshots of the data of a dataset at given positions in its history.
+
+    Undoing a processing step requires the data to be reset to an earlier
+    state and all processing steps up to the new position in the history to
+    be replayed. Starting always from the original data, the cost of undo
+    would grow linearly with the length of the history. Hence, the dataset
+    takes snapshots of its data (objects of class
+    :class:`aspecd.dataset.Data`) every :attr:`interval` processing steps,
+    and only the processing steps following the nearest snapshot need to be
+    replayed.
+
+    Snapshots are kept in least-recently-used (LRU) order. If a
+    :attr:`memory_limit` and/or a :attr:`maximum_number` is set,
+    the least recently used snapshots are discarded first. The snapshot of
+    the data prior to the first processing step (position -1) is never
+    discarded, as otherwise the data could not be restored to an earlier
+    state than the most recent snapshot.
+
+    Usually, you will not interact with objects of this class directly,
+    besides perhaps adjusting its attributes via the
+    :attr:`aspecd.dataset.Dataset.checkpoints` property of a dataset.
+
+    Attributes
+    ----------
+    interval : :class:`int`
+        Number of processing steps between two snapshots
+
+        If set to zero, no snapshots will be taken automatically,
+        besides the one of the data prior to the first processing step.
+
+        Default: 10
+
+    memory_limit : :class:`int`
+        Maximum memory (in bytes) all snapshots together may occupy
+
+        If set to zero, there is no limit.
+
+        Default: 0
+
+    maximum_number : :class:`int`
+        Maximum number of snapshots kept
+
+        If set to zero, there is no limit.
+
+        Default: 0
+
+    Examples
+    --------
+    To take a snapshot every five processing steps and restrict the memory
+    used by the snapshots to 100 MB:
+
+    .. code-block::
+
+        dataset.checkpoints.interval = 5
+        dataset.checkpoints.memory_limit = 100 * 1024**2
+
+
+    .. versionadded:: 0.12
+
+    """
+
+    def __init__(self):
+        self.interval = 10
+        self.memory_limit = 0
+        self.maximum_number = 0
+        self._snapshots = collections.OrderedDict()
+
+    def __copy__(self):
+        """Return copy sharing the snapshots of the data."""
+        # Snapshots are never modified, hence share them between copies
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
+        result._snapshots = collections.OrderedDict(self._snapshots)
+        return result
+
+    def __len__(self):
+        """Return number of snapshots."""
+        return len(self._snapshots)
+
+    def __contains__(self, position):
+        """Return whether a snapshot exists for the given position."""
+        return position in self._snapshots
+
+    @property
+    def positions(self):
+        """Positions in the history snapshots exist for, in ascending order.
+
+        Position -1 refers to the data prior to the first processing step.
+
+        """
+        return sorted(self._snapshots.keys())
+
+    @property
+    def size(self):
+        """Memory (in bytes) currently occupied by all snapshots."""
+        return sum(self._data_size(data) for data in self._snapshots.values())
+
+    def due(self, position=None):
+        """
+        Check whether a snapshot should be taken at the given position.
+
+        Parameters
+        ----------
+        position : :class:`int`
+            Position in the history (*i.e.*, the history pointer)
+
+        Returns
+        -------
+        due : :class:`bool`
+            Whether a snapshot should be taken
+
+        """
+        if not self.interval or position in self._snapshots:
+            return False
+        return (position + 1) % self.interval == 0
+
+    def add(self, position=None, data=None):
+        """
+        Add a snapshot of the data for the given position in the history.
+
+        The data are (deep) copied. If a limit for the number of snapshots
+        or the memory occupied is set, least recently used snapshots get
+        discarded afterwards.
+
+        Parameters
+        ----------
+        position : :class:`int`
+            Position in the history (*i.e.*, the history pointer)
+
+        data : :class:`aspecd.dataset.Data`
+            Data at the given position in the history
+
+        """
+        self._snapshots[position] = copy.deepcopy(data)
+        self._snapshots.move_to_end(position)
+        self._evict()
+
+    def nearest(self, position=None):
+        """
+        Return the snapshot nearest to but not after the given position.
+
+        Parameters
+        ----------
+        position : :class:`int`
+            Position in the history (*i.e.*, the history pointer)
+
+        Returns
+        -------
+        position : :class:`int`
+            Position in the history of the snapshot returned
+
+            None if no appropriate snapshot exists.
+
+        data : :class:`aspecd.dataset.Data`
+            (Deep) copy of the data of the snapshot
+
+            None if no appropriate snapshot exists.
+
+        """
+        candidates = [key for key in self._snapshots if key <= position]
+        if not candidates:
+            return None, None
+        nearest_position = max(candidates)
+        self._snapshots.move_to_end(nearest_position)
+        return nearest_position, copy.deepcopy(
+            self._snapshots[nearest_position]
+        )
+
+    def discard_after(self, position=None):
+        """
+        Discard all snapshots after the given position in the history.
+
+        Parameters
+        ----------
+        position : :class:`int`
+            Position in the history (*i.e.*, the history pointer)
+
+        """
+        for key in [key for key in self._snapshots if key > position]:
+            del self._snapshots[key]
+
+    def clear(self):
+        """Discard all snapshots."""
+        self._snapshots.clear()
+
+    def _evict(self):
+        evictable = [key for key in self._snapshots if key != -1]
+        while (
+            evictable
+            and self.maximum_number
+            and len(self) > self.maximum_number
+        ):
+            del self._snapshots[evictable.pop(0)]
+        while (
+            evictable and self.memory_limit and self.size > self.memory_limit
+        ):
+            del self._snapshots[evictable.pop(0)]
+
+    @staticmethod
+    def _data_size(data):
+        # Accessing the properties would copy arrays shared with the data
+        # pylint: disable=protected-access
+        size = data._data.nbytes
+        for axis in data.axes:
+            size += axis._values.nbytes
+        return size
+
+
 class DatasetReference(aspecd.utils.ToDictMixin):
     """
     Reference to a given dataset.
@@ -1269,11 +1872,28 @@ class Data(aspecd.utils.ToDictMixin):
     aspecd.exceptions.AxesValuesInconsistentWithDataError
         Raised if axes values are inconsistent with data
 
+
+    .. note::
+        (Deep) copies of data objects share the underlying NumPy array
+        (copy-on-write): The array gets copied only upon accessing the
+        :attr:`data` property of one of the copies. Hence, copies that
+        are never accessed, such as the ``_origdata`` of a dataset or the
+        datasets referenced from within copies of processing steps, do not
+        occupy additional memory. Arrays already handed out via the
+        :attr:`data` property are copied right away, though, as they may
+        be modified in place via references held elsewhere.
+
+
+    .. versionchanged:: 0.12
+        Copies share the underlying array until accessed (copy-on-write)
+
     """
 
     def __init__(self, data=np.zeros(0), axes=None, calculated=False):
         super().__init__()
         self._data = data
+        self._data_buffer = None
+        self._data_accessed = False
         self._axes = []
         if axes is None:
             self._create_axes()
@@ -1295,12 +1915,33 @@ class Data(aspecd.utils.ToDictMixin):
             information stored in the axis object will be retained, namely
             quantity, unit, and label.
 
+        .. note::
+            If the data are shared with (deep) copies of this object,
+            accessing this property creates a private copy of the array
+            first, as the caller may modify the data in place.
+
+            Similarly, data set to a :class:`aspecd.utils.LazyArray`,
+            *e.g.* by importing a dataset lazily, are only read upon first
+            accessing this property.
+
         """
+        if isinstance(self._data, aspecd.utils.LazyArray):
+            self._data = self._data.load()
+        if self._data_buffer is not None:
+            self._data = _materialise(
+                self._data, self._data_buffer, self._data_accessed
+            )
+            self._data_buffer = None
+        # Bypass ToDictMixin, as the property is accessed from to_dict()
+        object.__setattr__(self, "_data_accessed", True)
         return self._data
 
     @data.setter
     def data(self, data):
         old_shape = self._data.shape
+        _release(self._data_buffer)
+        self._data_buffer = None
+        self._data_accessed = False
         self._data = data
         if old_shape != data.shape:
             if self.axes[0].values.size == 0:
@@ -1349,20 +1990,56 @@ class Data(aspecd.utils.ToDictMixin):
             is responsible to adjust the axes as well (*i.e.*, remove the
             *correct* axis object from the list).
         """
-        data_shape = self.data.shape
-        if len(self.axes) < self.data.ndim + 1:
+        data_shape = self._data.shape
+        if len(self.axes) < self._data.ndim + 1:
             self._axes.append(Axis())
-        for index in range(self.data.ndim):
+        for index in range(self._data.ndim):
             if len(self.axes[index].values) != data_shape[index]:
                 self.axes[index].values = np.arange(
                     data_shape[index], dtype=np.float64
                 )
 
+    def __deepcopy__(self, memo):
+        """Return deep copy sharing the data until accessed."""
+        return _deepcopy_sharing_array(
+            self, memo, "_data", "_data_buffer", "_data_accessed"
+        )
+
+    def to_dict(self, remove_empty=False):
+        """
+        Create dictionary containing public attributes of an object.
+
+        In contrast to accessing the :attr:`data` property, the data
+        contained in the dictionary are *not* copied if they are shared
+        with copies of this object. Hence, do not modify them in place.
+
+        Parameters
+        ----------
+        remove_empty : :class:`bool`
+            Whether to remove keys with empty values
+
+            Default: False
+
+        Returns
+        -------
+        public_attributes : :class:`collections.OrderedDict`
+            Ordered dictionary containing the public attributes of the object
+
+        """
+        buffer, self._data_buffer = self._data_buffer, None
+        accessed = self._data_accessed
+        try:
+            dict_ = super().to_dict(remove_empty=remove_empty)
+        finally:
+            self._data_buffer = buffer
+            object.__setattr__(self, "_data_accessed", accessed)
+        return dict_
+
     def _check_axes(self):
-        if len(self._axes) > self.data.ndim + 1:
+        if len(self._axes) > self._data.ndim + 1:
             raise aspecd.exceptions.AxesCountError
-        data_shape = self.data.shape
-        for index in range(self.data.ndim):
+        data_shape = self._data.shape
+        for index in range(self._data.ndim):
             if len(self.axes[index].values) != data_shape[index]:
                 raise aspecd.exceptions.AxesValuesInconsistentWithDataError
 
@@ -1430,11 +2107,18 @@ class Axis(aspecd.utils.ToDictMixin):
         dimension.
         Raised if index does not have the same length as values.
 
+
+    .. versionchanged:: 0.12
+        Copies share the underlying array until accessed (copy-on-write),
+        see :class:`aspecd.dataset.Data` for details.
+
     """
 
     def __init__(self):
         super().__init__()
         self._values = np.zeros(0)
+        self._values_buffer = None
+        self._values_accessed = False
         self._index = []
         self._equidistant = None
         self.quantity = ""
@@ -1461,22 +2145,29 @@ class Axis(aspecd.utils.ToDictMixin):
             Raised if axis values are of wrong dimension, i.e. not a vector
 
         """
+        if self._values_buffer is not None:
+            self._values = _materialise(
+                self._values, self._values_buffer, self._values_accessed
+            )
+            self._values_buffer = None
+        # Bypass ToDictMixin, as the property is accessed from to_dict()
+        object.__setattr__(self, "_values_accessed", True)
         return self._values
 
     @values.setter
     def values(self, values):
-        if not isinstance(values, type(self._values)):
+        if not isinstance(values, np.ndarray):
             values = np.asarray(values)
-            if (
-                not isinstance(values, type(self._values))
-                or values.dtype != self._values.dtype
-            ):
+            if values.dtype != self._values.dtype:
                 raise ValueError(
                     f"Wrong type: expected {self._values.dtype}, "
                     f"got {values.dtype}"
                 )
         if values.ndim > 1:
             raise IndexError("Values need to be one-dimensional")
+        _release(self._values_buffer)
+        self._values_buffer = None
+        self._values_accessed = False
         self._values = values
         self._set_equidistant_property()
         self._set_index()
@@ -1513,7 +2204,7 @@ class Axis(aspecd.utils.ToDictMixin):
         self._index = index
 
     def _set_index(self):
-        self._index = ["" for _ in self.values]
+        self._index = ["" for _ in self._values]
 
     @property
     def equidistant(self):
@@ -1534,11 +2225,49 @@ class Axis(aspecd.utils.ToDictMixin):
         return self._equidistant
 
     def _set_equidistant_property(self):
-        if not self.values.size or not self.values.all():
+        if self._values.size < 2 or not self._values.all():
             return
-        differences = self.values[1:] - self.values[0:-1]
+        differences = self._values[1:] - self._values[0:-1]
         self._equidistant = np.isclose(differences.max(), differences.min())
 
+    def __deepcopy__(self, memo):
+        """Return deep copy sharing the axis values until accessed."""
+        # Index entries are (immutable) labels, hence copy the list only
+        memo[id(self._index)] = list(self._index)
+        return _deepcopy_sharing_array(
+            self, memo, "_values", "_values_buffer", "_values_accessed"
+        )
+
+    def to_dict(self, remove_empty=False):
+        """
+        Create dictionary containing public attributes of an object.
+
+        In contrast to accessing the :attr:`values` property, the values
+        contained in the dictionary are *not* copied if they are shared
+        with copies of this object. Hence, do not modify them in place.
+
+        Parameters
+        ----------
+        remove_empty : :class:`bool`
+            Whether to remove keys with empty values
+
+            Default: False
+
+        Returns
+        -------
+        public_attributes : :class:`collections.OrderedDict`
+            Ordered dictionary containing the public attributes of the object
+
+        """
+        buffer, self._values_buffer = self._values_buffer, None
+        accessed = self._values_accessed
+        try:
+            dict_ = super().to_dict(remove_empty=remove_empty)
+        finally:
+            self._values_buffer = buffer
+            object.__setattr__(self, "_values_accessed", accessed)
+        return dict_
+
     def from_dict(self, dict_=None):
         """
         Set properties from dictionary, e.g., from serialised dataset.
@@ -1627,3 +2356,105 @@ class DeviceData(Data):
         super().__init__()
         self.metadata = aspecd.metadata.Device()
         self.calculated = False
+
+
+class _SharedBuffer:
+    """Bookkeeping for an array shared by (deep) copies of an object.
+
+    Used by :class:`Data` and :class:`Axis` to implement copy-on-write:
+    All objects sharing an array hold a reference to the same buffer
+    object, and the last remaining owner can use the array without copying.
+
+    """
+
+    def __init__(self):
+        self.owners = 1
+
+    def acquire(self):
+        """Register an additional owner of the array."""
+        self.owners += 1
+
+    def release(self):
+        """Unregister an owner and return whether the array is still shared."""
+        self.owners -= 1
+        return bool(self.owners)
+
+
+def _materialise(array, buffer, accessed=True):
+    if buffer.release():
+        array = _copy_array(array, unmodified=not accessed)
+    return array
+
+
+def _can_remap(array, unmodified=False):
+    # Memory-mapped arrays can be mapped anew rather than read into memory,
+    # as long as they cannot have been modified in memory nor in the file.
+    return (
+        isinstance(array, np.memmap)
+        and isinstance(array.base, mmap.mmap)
+        and (array.mode == "r" or (unmodified and array.mode == "c"))
+        and os.path.exists(array.filename)
+    )
+
+
+def _copy_array(array, unmodified=False):
+    if _can_remap(array, unmodified=unmodified):
+        return np.memmap(
+            array.filename,
+            dtype=array.dtype,
+            mode=array.mode,
+            offset=array.offset,
+            shape=array.shape,
+            order="F" if np.isfortran(array) else "C",
+        )
+    return array.copy()
+
+
+def _release(buffer):
+    if buffer is not None:
+        buffer.release()
+
+
+def _shared_records(elements, records):
+    # Replace dicts already converted into records by these records
+    return [records.get(id(element), element) for element in elements]
+
+
+def _shared_array(data):
+    # Return the array of the data object without creating a private copy
+    # of an array shared with (deep) copies, as only reading it.
+    # pylint: disable=protected-access
+    if isinstance(data._data, aspecd.utils.LazyArray):
+        data._data = data._data.load()
+    return data._data
+
+
+def _deepcopy_sharing_array(
+    object_, memo, array_name, buffer_name, accessed_name
+):
+    array = getattr(object_, array_name)
+    if id(array) in memo:
+        # The caller provided the array of the copy via the memo, e.g. the
+        # result of a calculation, hence there is nothing to share
+        memo[id(getattr(object_, buffer_name))] = None
+    elif getattr(object_, accessed_name):
+        # The array has been handed out via the property, and references to
+        # it may be used to modify it in place. Hence, it cannot be shared.
+        memo[id(array)] = _copy_array(array)
+    else:
+        if getattr(object_, buffer_name) is None:
+            setattr(object_, buffer_name, _SharedBuffer())
+        buffer = getattr(object_, buffer_name)
+        buffer.acquire()
+        memo[id(buffer)] = buffer
+        memo[id(array)] = array
+    # ToDictMixin keeps the array last set via the property, possibly
+    # outdated, that must not be copied either
+    if array_name[1:] in object_.__odict__:
+        object_.__odict__[array_name[1:]] = array
+    result = object_.__class__.__new__(object_.__class__)
+    memo[id(object_)] = result
+    for key, value in object_.__dict__.items():
+        object.__setattr__(result, key, copy.deepcopy(value, memo))
+    object.__setattr__(result, accessed_name, False)
+    return result
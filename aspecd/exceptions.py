@@ -91,7 +91,7 @@ class MissingFilenameError(Error):
 
 
 class MissingPlotError(Error):
-    """Exception raised when no plot exists to save.
+    """Exception raised when no plot exists to save or update.
 
     Attributes
     ----------
@@ -583,3 +583,33 @@ class MissingDatasetIdentifierError(Error):
     def __init__(self, message=""):
         super().__init__(message)
         self.message = message
+
+
+class MissingBlobStoreError(Error):
+    """Exception raised when arrays reside in a blob store not provided.
+
+    Attributes
+    ----------
+    message : :class:`str`
+        explanation of the error
+
+    """
+
+    def __init__(self, message=""):
+        super().__init__(message)
+        self.message = message
+
+
+class UpdateNotSupportedError(Error):
+    """Exception raised when a plotter does not support updating plots.
+
+    Attributes
+    ----------
+    message : :class:`str`
+        explanation of the error
+
+    """
+
+    def __init__(self, message=""):
+        super().__init__(message)
+        self.message = message
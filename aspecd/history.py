@@ -478,6 +478,10 @@ class SingleAnalysisStepRecord(AnalysisStepRecord):
         The actual processing steps are objects of the class
         :class:`aspecd.processing.ProcessingStepRecord`.
 
+        As history records are never modified once created, the records
+        are shared with the history of the dataset rather than copied.
+        Hence, do not modify them in place.
+
     Parameters
     ----------
     analysis_step : :class:`aspecd.analysis.SingleAnalysisStep`
@@ -792,7 +796,9 @@ class SinglePlotRecord(PlotRecord):
         List of processing steps
 
         The actual processing steps are objects of the class
-        :class:`aspecd.processing.ProcessingStepRecord`.
+        :class:`aspecd.processing.ProcessingStepRecord`, shared with the
+        history of the dataset, see
+        :attr:`aspecd.history.SingleAnalysisStepRecord.preprocessing`.
 
     Parameters
     ----------
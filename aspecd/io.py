@@ -205,6 +205,25 @@ only be used as last resort:
     why).
 
 
+Sharing arrays between ADF files
+--------------------------------
+
+Datasets of a series of measurements often share (large) arrays, *e.g.*
+the values of their axes. Exporting them to ADF files with a blob store
+(see :class:`aspecd.utils.BlobStore`) writes each of these arrays only
+once to a directory shared by all ADF files. For details, see the
+``blob_store`` attribute of the :class:`aspecd.io.AdfExporter` and the
+corresponding parameter of the :class:`aspecd.io.AdfImporter`.
+
+Arrays no longer needed are removed from the store using the function
+:func:`aspecd.io.collect_blob_garbage` or the ``adfgc`` command that is
+available on the command line after installing the ASpecD framework:
+
+.. code-block:: bash
+
+    adfgc /path/to/blobs /path/to/adf/files
+
+
 Writing importers for data
 --------------------------
 
@@ -338,21 +357,25 @@ Module documentation
 
 """
 
+import argparse
 import copy
+import inspect
 import io
 import logging
+import mmap
 import os
-import tempfile
 import zipfile
 
-import asdf
 import numpy as np
 
 import aspecd.exceptions
 import aspecd.history
 import aspecd.metadata
+import aspecd.system
 import aspecd.utils
 
+asdf = aspecd.utils.LazyModule("asdf")
+
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
@@ -457,10 +480,11 @@ class DatasetImporter:
         else:
             self.dataset = dataset
         self._import()
-        if self.dataset.data.data.size == 0:
-            logger.warning('Could not read data from "%s"', self.source)
         # pylint: disable=protected-access
+        if self.dataset.data._data.size == 0:
+            logger.warning('Could not read data from "%s"', self.source)
         self.dataset._origdata = copy.deepcopy(self.dataset.data)
+        self.dataset._origdata_position = self.dataset._history_pointer
         self.dataset.id = self.source
         if self.source and not self.dataset.label:
             self.dataset.label = os.path.split(self.source)[-1]
@@ -1062,74 +1086,173 @@ class AdfExporter(DatasetExporter):
     representation for larger numerical arrays, the format should be more
     memory-efficient than other formats.
 
+    All contents are written directly into the archive, without creating
+    any temporary files. Arrays stored in binary form are hashed in
+    parallel (see :meth:`aspecd.utils.Yaml.serialise_numpy_arrays`) and
+    streamed into the archive.
+
+    Attributes
+    ----------
+    compression : :class:`str`
+        Compression used for the members of the archive
+
+        Valid values are "stored" (no compression), "deflate", and "lzma".
+        Compressing results in smaller files, but takes (considerably)
+        longer, both, for exporting and importing. Furthermore, only arrays
+        stored uncompressed can be memory-mapped when importing lazily
+        (see :class:`aspecd.io.AdfImporter`).
+
+        Default: "stored"
+
+    array_compression : :class:`str`
+        Compression used for the arrays stored in binary form
+
+        Arrays make up most of the archive and are costly to compress,
+        while the metadata (YAML) compress well. Hence, you may want to
+        compress the metadata, but store the arrays uncompressed, *e.g.*
+        for memory-mapping them when importing. Valid values are the same
+        as for :attr:`compression`. If empty, :attr:`compression` is used
+        for the arrays as well.
+
+        Default: ''
+
+    blob_store : :class:`str`
+        Directory of a blob store arrays should be written to
+
+        If set, arrays stored in binary form are not contained in the
+        archive, but written to a content-addressed store (see
+        :class:`aspecd.utils.BlobStore`) that can be shared by many
+        archives. Identical arrays, *e.g.* the axes of a series of
+        measurements, are thus stored only once.
+
+        Note that the archive is no longer self-contained, and the
+        :class:`aspecd.io.AdfImporter` needs to know about the blob store.
+        Unused arrays can be removed from the store using
+        :func:`aspecd.io.collect_blob_garbage`.
+
+        Default: ''
+
+    Raises
+    ------
+    aspecd.exceptions.MissingTargetError
+        Raised if no target is given
+
+    ValueError
+        Raised if the compression (of the arrays) is not supported
+
+
+    Examples
+    --------
+    For convenience, a series of examples in recipe style (for details of
+    the recipe-driven data analysis, see :mod:`aspecd.tasks`) is given below
+    for how to make use of this class.
+
+    Exporting a dataset to a compressed ADF file is straightforward:
+
+    .. code-block:: yaml
+
+        - kind: export
+          type: AdfExporter
+          properties:
+            target: dataset
+            compression: deflate
+
+    To compress only the metadata, but keep the arrays uncompressed, set
+    the compression of the arrays explicitly:
+
+    .. code-block:: yaml
+
+        - kind: export
+          type: AdfExporter
+          properties:
+            target: dataset
+            compression: deflate
+            array_compression: stored
+
+    To share arrays between many datasets, write them to a blob store:
+
+    .. code-block:: yaml
+
+        - kind: export
+          type: AdfExporter
+          properties:
+            target: dataset
+            blob_store: /path/to/blobs
+
+
+    .. versionchanged:: 0.12
+        Contents are written directly into the archive; new attributes
+        :attr:`compression`, :attr:`array_compression`, and
+        :attr:`blob_store`
+
     """
 
     def __init__(self, target=None):
         super().__init__(target=target)
         self.extension = ".adf"
+        self.compression = "stored"
+        self.array_compression = ""
+        self.blob_store = ""
         self._filenames = {
             "dataset": "dataset.yaml",
             "version": "VERSION",
             "readme": "README",
         }
         self._bin_dir = "binaryData"
-        self._tempdir_name = ""
         self._version = "1.0.0"
+        self._compression_types = {
+            "stored": zipfile.ZIP_STORED,
+            "deflate": zipfile.ZIP_DEFLATED,
+            "lzma": zipfile.ZIP_LZMA,
+        }
 
     def _export(self):
         if not self.target:
             raise aspecd.exceptions.MissingTargetError
-        with tempfile.TemporaryDirectory() as tempdir:
-            self._tempdir_name = tempdir
-            self._create_files()
-            self._create_zip_archive()
-
-    def _create_zip_archive(self):
-        with zipfile.ZipFile(
-            self.target + self.extension, "w"
-        ) as zipped_file:
-            for filename in self._filenames.values():
-                zipped_file.write(
-                    filename=os.path.join(self._tempdir_name, filename),
-                    arcname=filename,
+        for compression in (self.compression, self.array_compression):
+            if compression and compression not in self._compression_types:
+                raise ValueError(
+                    f"Unknown compression '{compression}', valid values "
+                    f"are {', '.join(self._compression_types)}"
                 )
-            bin_dir_path = os.path.join(self._tempdir_name, self._bin_dir)
-            zipped_file.write(
-                filename=os.path.join(bin_dir_path), arcname=self._bin_dir
+        yaml = self._serialise_dataset()
+        with zipfile.ZipFile(
+            self.target + self.extension,
+            "w",
+            compression=self._compression_types[self.compression],
+        ) as archive:
+            archive.writestr(self._filenames["dataset"], yaml.write_stream())
+            archive.writestr(self._filenames["version"], self._version)
+            archive.writestr(
+                self._filenames["readme"], self._create_readme_file()
             )
-            for filename in os.listdir(bin_dir_path):
-                zipped_file.write(
-                    filename=os.path.join(bin_dir_path, filename),
-                    arcname=os.path.join(self._bin_dir, filename),
-                )
-
-    def _create_files(self):
-        self._create_dataset_yaml()
-        self._create_version_file()
-        self._create_readme_file()
+            self._write_binary_files(archive, yaml.binary_arrays)
 
-    def _create_dataset_yaml(self):
-        bin_dir_path = os.path.join(self._tempdir_name, self._bin_dir)
-        os.mkdir(bin_dir_path)
+    def _serialise_dataset(self):
         yaml = aspecd.utils.Yaml()
-        yaml.binary_directory = bin_dir_path
-        yaml.dict = self.dataset.to_dict()
-        yaml.serialise_numpy_arrays()
-        yaml.write_to(
-            filename=os.path.join(
-                self._tempdir_name, self._filenames["dataset"]
+        yaml.write_binary_files = False
+        if self.blob_store:
+            yaml.blob_store = aspecd.utils.BlobStore(
+                directory=self.blob_store
             )
-        )
-
-    def _create_version_file(self):
-        with open(
-            os.path.join(self._tempdir_name, self._filenames["version"]),
-            "w+",
-            encoding="utf8",
-        ) as file:
-            file.write(self._version)
-
-    def _create_readme_file(self):
+        yaml.dict = aspecd.system.intern_system_info(self.dataset.to_dict())
+        yaml.serialise_numpy_arrays()
+        return yaml
+
+    def _write_binary_files(self, archive=None, arrays=None):
+        archive.writestr(zipfile.ZipInfo(self._bin_dir + "/"), "")
+        compression = self.array_compression or self.compression
+        for filename, array in arrays.items():
+            # Members opened by name get the compression of the archive
+            info = zipfile.ZipInfo("/".join([self._bin_dir, filename]))
+            info.compress_type = self._compression_types[compression]
+            # The size written, including header and compression, is not
+            # known beforehand, hence always allow for large members
+            with archive.open(info, "w", force_zip64=True) as file:
+                np.lib.format.write_array(file, array, allow_pickle=False)
+
+    @staticmethod
+    def _create_readme_file():
         readme_contents = (
             "Readme\n"
             "======\n\n"
@@ -1161,12 +1284,7 @@ class AdfExporter(DatasetExporter):
             "ASpecD package documentation:\n\n"
             "https://docs.aspecd.de/adf.html\n"
         )
-        with open(
-            os.path.join(self._tempdir_name, self._filenames["readme"]),
-            "w+",
-            encoding="utf8",
-        ) as file:
-            file.write(readme_contents)
+        return readme_contents
 
 
 class AdfImporter(DatasetImporter):
@@ -1176,28 +1294,140 @@ class AdfImporter(DatasetImporter):
     For more details of the ASpecD dataset format, see the
     :class:`aspecd.io.AdfExporter` class.
 
+    The archive is not extracted, but all contents are read directly from
+    the archive. If you are only interested in the metadata or the
+    history of a dataset, or if the data are large, you can defer reading
+    the numerical data by setting the parameter ``lazy``.
+
+    Attributes
+    ----------
+    parameters : :class:`dict`
+        Additional parameters to control import options.
+
+        lazy : :class:`bool`
+            Whether to defer reading the numerical data of the dataset
+
+            Arrays stored uncompressed in the archive (the default of the
+            :class:`aspecd.io.AdfExporter`) are memory-mapped directly
+            from the archive, compressed arrays are only read upon first
+            accessing :attr:`aspecd.dataset.Data.data`. See
+            :func:`aspecd.utils.array_from_zip` for details.
+
+            Deferring the decompression only applies to the data and
+            original data of the dataset. All other compressed arrays,
+            *e.g.* axes values, are read upon import.
+
+            Default: False
+
+            .. versionadded:: 0.12
+
+        mmap_mode : :class:`str`
+            Mode for memory-mapping the arrays of the dataset
+
+            If set, arrays stored uncompressed in the archive (or in a
+            blob store) are memory-mapped, allowing to handle datasets not
+            fitting into memory. Valid modes are "r" (read-only) and "c"
+            (copy-on-write, *i.e.* the data can be modified in memory,
+            but the archive is not changed). See
+            :func:`aspecd.utils.array_from_zip` for details.
+
+            In contrast to ``lazy``, all arrays are memory-mapped,
+            including axes values. Processing steps only reading the data,
+            *e.g.* :class:`aspecd.processing.SliceExtraction`, work without
+            reading the whole array into memory.
+
+            Default: None
+
+            .. versionadded:: 0.12
+
+        blob_store : :class:`str`
+            Directory of the blob store shared arrays are read from
+
+            Required if the dataset has been exported with a blob store,
+            see :class:`aspecd.io.AdfExporter` for details.
+
+            Default: ''
+
+            .. versionadded:: 0.12
+
+    Raises
+    ------
+    aspecd.exceptions.MissingBlobStoreError
+        Raised if arrays reside in a blob store, but no blob store is given
+
+
+    Examples
+    --------
+    To only have a look at the metadata of a dataset stored in ADF format,
+    without reading its (potentially large) data:
+
+    .. code-block::
+
+        importer = aspecd.io.AdfImporter(source="dataset")
+        importer.parameters["lazy"] = True
+        dataset = aspecd.dataset.Dataset()
+        dataset.import_from(importer)
+
+    To work with a dataset too large to fit into memory, memory-map its
+    arrays:
+
+    .. code-block::
+
+        importer = aspecd.io.AdfImporter(source="dataset")
+        importer.parameters["mmap_mode"] = "c"
+        dataset = aspecd.dataset.Dataset()
+        dataset.import_from(importer)
+
+
+    .. versionchanged:: 0.12
+        Contents are read directly from the archive; new parameters
+        ``lazy``, ``mmap_mode``, and ``blob_store``
+
     """
 
     def __init__(self, source=None):
         super().__init__(source=source)
         self.extension = ".adf"
+        self.parameters["lazy"] = False
+        self.parameters["mmap_mode"] = None
+        self.parameters["blob_store"] = ""
         self._dataset_yaml_filename = "dataset.yaml"
         self._bin_dir = "binaryData"
 
     def _import(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            with zipfile.ZipFile(
-                self.source + self.extension, "r"
-            ) as zipped_file:
-                zipped_file.extractall(path=tempdir)
-                yaml = aspecd.utils.Yaml()
-                yaml.binary_directory = os.path.join(tempdir, self._bin_dir)
-                yaml.read_from(
-                    os.path.join(tempdir, self._dataset_yaml_filename)
-                )
-                yaml.deserialise_numpy_arrays()
+        filename = self.source + self.extension
+        with zipfile.ZipFile(filename, "r") as zipped_file:
+            yaml = aspecd.utils.Yaml()
+            yaml.read_stream(zipped_file.read(self._dataset_yaml_filename))
+        yaml.binary_archive = filename
+        yaml.binary_directory = self._bin_dir
+        yaml.lazy = self.parameters.get("lazy", False)
+        yaml.mmap_mode = self.parameters.get("mmap_mode", None)
+        if self.parameters.get("blob_store", ""):
+            yaml.blob_store = aspecd.utils.BlobStore(
+                directory=self.parameters["blob_store"]
+            )
+        yaml.deserialise_numpy_arrays()
+        if yaml.lazy:
+            self._load_lazy_arrays(yaml.dict)
         self.dataset.from_dict(yaml.dict)
 
+    def _load_lazy_arrays(self, dict_=None, top_level=True):
+        for key, value in dict_.items():
+            if isinstance(value, aspecd.utils.LazyArray):
+                dict_[key] = value.load()
+            elif isinstance(value, dict):
+                if top_level and key in ("data", "_origdata"):
+                    data = value.get("data", None)
+                    self._load_lazy_arrays(value, top_level=False)
+                    value["data"] = data
+                else:
+                    self._load_lazy_arrays(value, top_level=False)
+            elif isinstance(value, list):
+                for element in value:
+                    if isinstance(element, dict):
+                        self._load_lazy_arrays(element, top_level=False)
+
 
 class AsdfExporter(DatasetExporter):
     """
@@ -1217,7 +1447,9 @@ class AsdfExporter(DatasetExporter):
         if not self.target:
             raise aspecd.exceptions.MissingTargetError
 
-        dataset_dict = self.dataset.to_dict()
+        dataset_dict = aspecd.system.intern_system_info(
+            self.dataset.to_dict()
+        )
         dataset_dict["dataset_history"] = dataset_dict.pop("history")
         asdf_file = asdf.AsdfFile(dataset_dict)
         asdf_file.write_to(self.target + self.extension)
@@ -1231,21 +1463,95 @@ class AsdfImporter(DatasetImporter):
     `homepage of the asdf package <https://asdf.readthedocs.io/en/stable/>`_,
     and its `format specification <https://asdf-standard.readthedocs.io/>`_.
 
+    Attributes
+    ----------
+    parameters : :class:`dict`
+        Additional parameters to control import options.
+
+        mmap_mode : :class:`str`
+            Mode for memory-mapping the arrays of the dataset
+
+            If set, arrays stored in binary blocks of the file are
+            memory-mapped, allowing to handle datasets not fitting into
+            memory. Valid modes are "r" (read-only) and "c"
+            (copy-on-write, *i.e.* the data can be modified in memory,
+            but the file is not changed). Compressed blocks are read into
+            memory.
+
+            Default: None
+
+            .. versionadded:: 0.12
+
+
+    .. versionchanged:: 0.12
+        New parameter ``mmap_mode``
+
     """
 
     def __init__(self, source=None):
         super().__init__(source=source)
         self.extension = ".asdf"
+        self.parameters["mmap_mode"] = None
 
     def _import(self):
+        filename = self.source + self.extension
+        mmap_mode = self.parameters.get("mmap_mode", None)
         with asdf.open(
-            self.source + self.extension, lazy_load=False, copy_arrays=True
+            filename, **_asdf_open_options(memmap=bool(mmap_mode))
         ) as asdf_file:
             dataset_dict = asdf_file.tree
+            if mmap_mode:
+                _memory_map_arrays(dataset_dict, filename, mmap_mode)
             dataset_dict["history"] = dataset_dict.pop("dataset_history")
             self.dataset.from_dict(dataset_dict)
 
 
+def _asdf_open_options(memmap=False):
+    # asdf 3.1 replaced the option copy_arrays by memmap
+    if "memmap" in inspect.signature(asdf.open).parameters:
+        return {"lazy_load": False, "memmap": memmap}
+    return {"lazy_load": False, "copy_arrays": not memmap}
+
+
+def _memory_map_arrays(container=None, filename="", mode="c"):
+    # Replace arrays mapped by asdf, only valid as long as the file is
+    # open, by memory maps of their own, and copy all other arrays.
+    if isinstance(container, dict):
+        keys = container.keys()
+    else:
+        keys = range(len(container))
+    for key in keys:
+        value = container[key]
+        if isinstance(value, np.ndarray):
+            container[key] = _memory_map_array(value, filename, mode)
+        elif isinstance(value, (dict, list)):
+            _memory_map_arrays(value, filename, mode)
+
+
+def _memory_map_array(array=None, filename="", mode="c"):
+    base = array
+    while base is not None and not isinstance(base, mmap.mmap):
+        base = getattr(base, "base", None)
+    if (
+        base is None
+        or not array.size
+        or len(base) != os.path.getsize(filename)
+        or not (array.flags.c_contiguous or array.flags.f_contiguous)
+    ):
+        return np.array(array)
+    offset = (
+        array.ctypes.data - np.frombuffer(base, dtype=np.uint8).ctypes.data
+    )
+    return np.memmap(
+        filename,
+        dtype=array.dtype,
+        mode=mode,
+        offset=offset,
+        shape=array.shape,
+        order="F" if np.isfortran(array) else "C",
+    )
+
+
 class TxtImporter(DatasetImporter):
     # noinspection PyUnresolvedReferences
     """
@@ -1446,3 +1752,112 @@ class TxtExporter(DatasetExporter):
 
     def _sanitise_file_extension(self, target=None):
         return "".join([os.path.splitext(target)[0], self.extension])
+
+
+def collect_blob_garbage(blob_store="", sources=None, dry_run=False):
+    """
+    Remove arrays from a blob store not referenced by any ADF file.
+
+    Datasets exported with a blob store (see :class:`aspecd.io.AdfExporter`)
+    share their arrays in this store. Removing or overwriting ADF files
+    hence leaves arrays in the store not needed any more.
+
+    .. important::
+        All ADF files referring to the blob store need to be contained in
+        the sources, and no datasets should be exported to the blob store
+        while collecting garbage. Otherwise, arrays still needed will be
+        removed.
+
+    Parameters
+    ----------
+    blob_store : :class:`str`
+        Directory of the blob store
+
+    sources : :class:`list`
+        ADF files and directories (searched recursively for ADF files)
+        referring to the blob store
+
+    dry_run : :class:`bool`
+        Whether to only return the arrays that would be removed
+
+        Default: False
+
+    Returns
+    -------
+    removed : :class:`list`
+        Names of the arrays removed from the blob store
+
+
+    .. versionadded:: 0.12
+
+    """
+    referenced = set()
+    for filename in _adf_files(sources or []):
+        with zipfile.ZipFile(filename, "r") as zipped_file:
+            yaml = aspecd.utils.Yaml()
+            yaml.read_stream(zipped_file.read("dataset.yaml"))
+        referenced.update(_blob_filenames(yaml.dict))
+    store = aspecd.utils.BlobStore(directory=blob_store)
+    return store.collect_garbage(referenced=referenced, dry_run=dry_run)
+
+
+def _adf_files(sources=None):
+    for source in sources:
+        if os.path.isdir(source):
+            for root, _, filenames in os.walk(source):
+                for filename in sorted(filenames):
+                    if filename.endswith(".adf"):
+                        yield os.path.join(root, filename)
+        else:
+            yield source
+
+
+def _blob_filenames(dict_=None):
+    filenames = []
+    for value in dict_.values():
+        if isinstance(value, list):
+            for element in value:
+                if isinstance(element, dict):
+                    filenames.extend(_blob_filenames(element))
+        elif isinstance(value, dict):
+            if value.get("type") == "numpy.ndarray" and value.get("blob"):
+                filenames.append(value["file"])
+            else:
+                filenames.extend(_blob_filenames(value))
+    return filenames
+
+
+def adfgc():
+    """
+    Collect garbage in a blob store shared by ADF files.
+
+    The ASpecD framework creates a console script entry point named
+    "adfgc" that will allow you to type ``adfgc <blob_store> <sources>``
+    on the command line after installing the ASpecD framework. For
+    details, see :func:`aspecd.io.collect_blob_garbage`.
+
+    .. versionadded:: 0.12
+
+    """
+    parser = argparse.ArgumentParser(
+        description="Remove arrays from a blob store not referenced by any "
+        "of the given ADF files"
+    )
+    parser.add_argument("blob_store", help="directory of the blob store")
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="ADF files and directories containing ADF files",
+    )
+    parser.add_argument(
+        "-n",
+        "--dry-run",
+        action="store_true",
+        help="only list arrays that would be removed",
+    )
+    args = parser.parse_args()
+    removed = collect_blob_garbage(
+        blob_store=args.blob_store, sources=args.sources, dry_run=args.dry_run
+    )
+    for filename in removed:
+        print(filename)
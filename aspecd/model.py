@@ -227,13 +227,14 @@ Module documentation
 import copy
 
 import numpy as np
-import scipy.special
 
 import aspecd.dataset
 import aspecd.exceptions
 import aspecd.utils
 from aspecd.utils import not_zero, isiterable, ToDictMixin
 
+scipy = aspecd.utils.LazyModule("scipy")
+
 
 class Model(ToDictMixin):
     """
@@ -786,6 +786,45 @@ available plotter classes. This is what the
 works.
 
 
+Plotting many figures
+=====================
+
+Creating figure and axes is the most time-consuming part of plotting
+(simple) data. Reusing cleared figures and axes does not help, though,
+as clearing an axes takes about as long as creating it anew. Hence,
+each plot gets its own figure, and you should close figures no longer
+needed, using :func:`matplotlib.pyplot.close`.
+
+The rc parameters set by a matplotlib style (see
+:attr:`aspecd.plotting.Plotter.style`) are determined only once per style
+and process and cached, thus applying a style to each of thousands of
+plots does not parse and validate its parameters again. If you change a
+style at runtime, *e.g.* by reloading the style library of matplotlib,
+call :func:`clear_style_cache`.
+
+
+Updating plots
+==============
+
+Plotting data changing over time, *e.g.* growing datasets in monitoring
+applications, by calling :meth:`aspecd.plotting.Plotter.plot` each time
+creates figure, axes, drawings, annotations, and legend anew. Instead,
+call :meth:`aspecd.plotting.Plotter.update` after having plotted once::
+
+    plotter = aspecd.plotting.SinglePlotter1D()
+    dataset.plot(plotter)
+    # ... data of the dataset change
+    plotter.update()
+
+This replaces the data of the existing drawings, recomputes the axes
+limits, and redraws only the drawings (using blitting), as long as the
+axes limits and the figure size did not change. Hence, if you fix the
+axes limits using the properties of the plotter, updating is fastest.
+Currently, updating is supported by :class:`SinglePlotter1D`,
+:class:`SinglePlotter2D`, and :class:`MultiPlotter1D` and classes derived
+from these.
+
+
 For developers
 ==============
 
@@ -885,7 +924,7 @@ A few comments on this code snippet:
 * The actual object returned by the plot function is stored in
   ``self.drawing``.
 
-* The actual plot function gets the data to be plotted by accessing 
+* The actual plot function gets the data to be plotted by accessing
   ``self.data`` (and *not* ``self.dataset.data``).
 
 Of course, usually there is more that is handled in a plotter. For
@@ -901,14 +940,10 @@ import copy
 import errno
 import hashlib
 import logging
+import math
 import os
+import weakref
 
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-
-# pylint: disable=unused-import
-import matplotlib.collections
-from matplotlib import ticker
 import numpy as np
 
 import aspecd.dataset
@@ -916,10 +951,21 @@ import aspecd.exceptions
 import aspecd.history
 import aspecd.utils
 
+mpl = aspecd.utils.LazyModule("matplotlib")
+plt = aspecd.utils.LazyModule("matplotlib.pyplot")
+ticker = aspecd.utils.LazyModule("matplotlib.ticker")
+
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Process-wide cache of rc parameters set by styles, the keys being names
+_STYLES = {}
+
+# Backgrounds of figures for blitting when updating plots, with the view
+# limits and figure size they are valid for, the keys being figures
+_BACKGROUNDS = weakref.WeakKeyDictionary()
+
 
 class Plotter(aspecd.utils.ToDictMixin):
     """Base class for plots.
@@ -1169,6 +1215,47 @@ class Plotter(aspecd.utils.ToDictMixin):
         self._tight_layout()
         self._reset_style()
 
+    def update(self):
+        """Update the plot with the current data.
+
+        Rather than creating figure, axes, drawings, and annotations anew,
+        as :meth:`plot` does, only the data of the existing drawings are
+        replaced and the axes limits recomputed. As long as neither the
+        axes limits nor the figure size changed, only the drawings are
+        redrawn (using blitting), otherwise the entire figure.
+
+        This is particularly useful for repeatedly plotting data changing
+        over time, *e.g.* growing datasets in monitoring applications.
+        Updating plots is supported by :class:`SinglePlotter1D`,
+        :class:`SinglePlotter2D`, and :class:`MultiPlotter1D`.
+
+        .. note::
+            Updating a plot does not add a record to the history of the
+            dataset(s), as only the data, but not the plot as such change.
+
+        .. note::
+            When redrawing only the drawings, they are drawn on top of all
+            other elements of the figure, such as annotations.
+
+        Raises
+        ------
+        aspecd.exceptions.MissingPlotError
+            Raised if nothing has been plotted yet
+        aspecd.exceptions.UpdateNotSupportedError
+            Raised if the plotter does not support updating plots
+
+
+        .. versionadded:: 0.12
+
+        """
+        if not self.figure:
+            raise aspecd.exceptions.MissingPlotError(
+                message="Nothing plotted yet to update"
+            )
+        drawings = self._update_plot()
+        self._update_limits(drawings)
+        self._redraw(drawings)
+
     # noinspection PyUnusedLocal
     @staticmethod
     def applicable(data):  # pylint: disable=unused-argument
@@ -1219,7 +1306,7 @@ class Plotter(aspecd.utils.ToDictMixin):
         del self.annotations[index]
 
     def _set_style(self):
-        self._original_rcparams = mpl.rcParams.copy()
+        self._original_rcparams = dict.copy(mpl.rcParams)
         if self.style:
             if self.style not in plt.style.available + ["default", "xkcd"]:
                 message = f'Cannot find matplotlib style "{self.style}".'
@@ -1227,7 +1314,7 @@ class Plotter(aspecd.utils.ToDictMixin):
             if self.style == "xkcd":
                 self._set_xkcd_style()
             else:
-                plt.style.use(self.style)
+                dict.update(mpl.rcParams, _style_parameters(self.style))
 
     def _reset_style(self):
         dict.update(mpl.rcParams, self._original_rcparams)
@@ -1350,6 +1437,28 @@ class Plotter(aspecd.utils.ToDictMixin):
 
         """
 
+    def _update_plot(self):
+        """Update the data of the drawings of the plot.
+
+        The implementation of the actual updating goes in here in all
+        classes inheriting from Plotter and supporting :meth:`update`. This
+        method is automatically called by :meth:`update`.
+
+        Returns
+        -------
+        drawings : :class:`list`
+            Drawings (:class:`matplotlib.artist.Artist`) updated
+
+        Raises
+        ------
+        aspecd.exceptions.UpdateNotSupportedError
+            Raised if the plotter does not support updating plots
+
+        """
+        raise aspecd.exceptions.UpdateNotSupportedError(
+            message=f"{self.name} does not support updating plots"
+        )
+
     def _add_annotations(self):
         for annotation in self.annotations:
             annotation.annotate(self, from_plotter=True)
@@ -1461,6 +1570,68 @@ class Plotter(aspecd.utils.ToDictMixin):
         if self.parameters["tight_layout"]:
             self.figure.set_layout_engine(layout="tight")
 
+    def _update_limits(self, drawings):
+        """
+        Recompute the axes limits from the drawings.
+
+        Other elements, such as zero lines and annotations, are hidden
+        while recomputing the limits, as they would otherwise retain the
+        limits from plotting.
+
+        """
+        axes = self.axes if isinstance(self.axes, list) else [self.axes]
+        others = [
+            artist
+            for axes_ in axes
+            for artist in axes_.lines + axes_.patches + axes_.images
+            if artist not in drawings and artist.get_visible()
+        ]
+        for artist in others:
+            artist.set_visible(False)
+        for axes_ in axes:
+            axes_.relim(visible_only=True)
+            axes_.autoscale_view()
+        for artist in others:
+            artist.set_visible(True)
+
+    def _get_view_limits(self):
+        """Return the limits that, if changed, require a full redraw."""
+        axes = self.axes if isinstance(self.axes, list) else [self.axes]
+        return [(axes_.get_xlim(), axes_.get_ylim()) for axes_ in axes]
+
+    def _redraw(self, drawings):
+        """
+        Redraw the figure, using blitting if possible.
+
+        The background of the figure without the drawings is kept and
+        reused as long as the view limits and the figure size stay the
+        same. Otherwise, the entire figure is drawn and its background
+        kept anew.
+
+        """
+        canvas = self.figure.canvas
+        if not canvas.supports_blit:
+            canvas.draw()
+            return
+        state = [self._get_view_limits(), self.figure.bbox.bounds]
+        background, background_state = _BACKGROUNDS.get(
+            self.figure, (None, None)
+        )
+        if background is None or state != background_state:
+            for drawing in drawings:
+                drawing.set_animated(True)
+            canvas.draw()
+            for drawing in drawings:
+                drawing.set_animated(False)
+            background = canvas.copy_from_bbox(self.figure.bbox)
+            _BACKGROUNDS[self.figure] = (background, state)
+        else:
+            canvas.restore_region(background)
+        for drawing in drawings:
+            self.figure.draw_artist(drawing)
+        canvas.blit(self.figure.bbox)
+        canvas.flush_events()
+
 
 class SinglePlotter(Plotter):
     """Base class for plots of single datasets.
@@ -1582,6 +1753,41 @@ class SinglePlotter(Plotter):
         self._call_from_dataset(from_dataset)
         return self.dataset
 
+    def update(self, dataset=None):
+        """Update the plot with the current data of the dataset.
+
+        For details, see :meth:`aspecd.plotting.Plotter.update`.
+
+        Parameters
+        ----------
+        dataset : :class:`aspecd.dataset.Dataset`
+            dataset to update the plot for
+
+            If not given, the dataset plotted before is used.
+
+        Raises
+        ------
+        aspecd.exceptions.MissingPlotError
+            Raised if nothing has been plotted yet
+        aspecd.exceptions.NotApplicableToDatasetError
+            Raised when plotting is not applicable to dataset
+        aspecd.exceptions.UpdateNotSupportedError
+            Raised if the plotter does not support updating plots
+
+
+        .. versionadded:: 0.12
+
+        """
+        if not self.drawing:
+            raise aspecd.exceptions.MissingPlotError(
+                message="Nothing plotted yet to update"
+            )
+        if dataset:
+            self.dataset = dataset
+        self._assign_data()
+        self._check_applicability()
+        super().update()
+
     def create_history_record(self):
         """
         Create history record to be added to the dataset.
@@ -1596,14 +1802,17 @@ class SinglePlotter(Plotter):
         history_record : :class:`aspecd.history.PlotHistoryRecord`
             history record for plotting step
 
+
+        .. versionchanged:: 0.12
+            The records of the preprocessing are shared with the history
+            of the dataset rather than deep copies
+
         """
         history_record = aspecd.history.PlotHistoryRecord(
             package=self.dataset.package_name
         )
         history_record.plot = aspecd.history.SinglePlotRecord(plotter=self)
-        history_record.plot.preprocessing = copy.deepcopy(
-            self.dataset.history
-        )
+        history_record.plot.preprocessing = list(self.dataset.history)
         return history_record
 
     def _assign_dataset(self, dataset):
@@ -1702,6 +1911,43 @@ class SinglePlotter1D(SinglePlotter):
 
             Default: False
 
+        decimate : :class:`str`
+            Method for decimating the data before plotting
+
+            Plotting and particularly saving long traces with millions of
+            points to vector graphics files takes a long time and results
+            in huge files, although only a few points per pixel can be
+            discerned. The "minmax" method retains the minimum and maximum
+            of the data within each bucket of consecutive points,
+            resulting in virtually the same figure. The "largest triangle three
+            buckets" ("lttb") method retains one point per bucket,
+            preserving the shape of the trace, but not necessarily all
+            extrema.
+
+            Decimation is only performed for the types "plot", "step",
+            and "semilogy", as it assumes the points to be evenly
+            distributed along the (linear) axis. Furthermore, it assumes
+            the values of the axis to be sorted. If limits are set for the
+            axis, only the points within these limits are decimated and
+            plotted, together with the adjacent point on either side.
+
+            Possible values: '', 'minmax', 'lttb'
+
+            Default: ''
+
+            .. versionadded:: 0.12
+
+        decimation_points : :class:`int`
+            Number of points retained when decimating the data
+
+            If zero, four points per pixel of the axes are retained,
+            determined from the size of the axes and the resolution (DPI)
+            of the figure.
+
+            Default: 0
+
+            .. versionadded:: 0.12
+
     Raises
     ------
     TypeError
@@ -1777,12 +2023,29 @@ class SinglePlotter1D(SinglePlotter):
               device_data: timestamp
             filename: output.pdf
 
+    Plotting long traces with millions of points, particularly saving
+    them to vector graphics files, takes a long time. Hence, you may want
+    to decimate the data, retaining only the minima and maxima of the
+    points, a few per pixel of the axes:
+
+    .. code-block:: yaml
+
+        - kind: singleplot
+          type: SinglePlotter1D
+          properties:
+            parameters:
+              decimate: minmax
+            filename: output.pdf
+
     .. versionchanged:: 0.7
         New parameter ``switch_axes``
 
     .. versionchanged:: 0.9
         Issue warning with log plotters and negative values
 
+    .. versionchanged:: 0.12
+        New parameters ``decimate`` and ``decimation_points``
+
     """
 
     def __init__(self):
@@ -1792,6 +2055,8 @@ class SinglePlotter1D(SinglePlotter):
         # noinspection PyTypeChecker
         self.parameters["tight"] = ""
         self.parameters["switch_axes"] = False
+        self.parameters["decimate"] = ""
+        self.parameters["decimation_points"] = 0
         self._type = "plot"
         self._allowed_types = [
             "plot",
@@ -1850,18 +2115,35 @@ class SinglePlotter1D(SinglePlotter):
         self._check_values_for_logplot()
         if not self.properties.drawing.label:
             self.properties.drawing.label = self.dataset.label
+        values, data = _decimate(
+            self.data.axes[0].values, self.data.data, plotter=self
+        )
         if self.parameters["switch_axes"]:
             (self.drawing,) = plot_function(
-                self.data.data,
-                self.data.axes[0].values,
+                data,
+                values,
                 label=self.properties.drawing.label,
             )
         else:
             (self.drawing,) = plot_function(
-                self.data.axes[0].values,
-                self.data.data,
+                values,
+                data,
                 label=self.properties.drawing.label,
             )
+        self._set_tight_limits()
+
+    def _update_plot(self):
+        values, data = _decimate(
+            self.data.axes[0].values, self.data.data, plotter=self
+        )
+        if self.parameters["switch_axes"]:
+            self.drawing.set_data(data, values)
+        else:
+            self.drawing.set_data(values, data)
+        self._set_tight_limits()
+        return [self.drawing]
+
+    def _set_tight_limits(self):
         if self.parameters["tight"]:
             if self.parameters["tight"] in ("x", "both"):
                 self.axes.set_xlim(
@@ -1995,6 +2277,33 @@ class SinglePlotter2D(SinglePlotter):
 
             .. versionadded:: 0.9
 
+        downsample : :class:`bool`
+            Whether to downsample the data to the resolution of the axes
+
+            Blocks of adjacent points are averaged, such that at least as
+            many points remain along each axis as the axes have pixels
+            (determined from figure size and resolution). The range of
+            the axes is retained. Particularly for large datasets, this
+            considerably speeds up plotting and reduces the size of the
+            resulting files, without visible differences.
+
+            Default: False
+
+            .. versionadded:: 0.12
+
+        rasterise : :class:`bool`
+            Whether to rasterise contour plots in vector graphics output
+
+            Contour plots of large datasets can result in enormous vector
+            graphics files. Rasterising the contours (with the resolution
+            of the figure) limits the file size, while axes, labels, and
+            annotations remain vector graphics. Images (type ``imshow``)
+            are always rasterised.
+
+            Default: False
+
+            .. versionadded:: 0.12
+
 
     properties : :class:`aspecd.plotting.SinglePlot2DProperties`
         Properties of the plot, defining its appearance
@@ -2090,9 +2399,29 @@ class SinglePlotter2D(SinglePlotter):
 
     In this particular case, the contour lines are thin black solid lines.
 
+    For large datasets, plotting (and saving the figure) can be made
+    considerably faster by downsampling the data to the resolution of
+    the axes, and rasterising the contours keeps vector graphics files
+    small:
+
+    .. code-block:: yaml
+
+       - kind: singleplot
+         type: SinglePlotter2D
+         properties:
+           type: contourf
+           filename: output.pdf
+           parameters:
+             downsample: True
+             rasterise: True
+
     Make sure to check the documentation for further parameters that can be
     set.
 
+
+    .. versionchanged:: 0.12
+        New parameters ``downsample`` and ``rasterise``
+
     """
 
     def __init__(self):
@@ -2104,6 +2433,8 @@ class SinglePlotter2D(SinglePlotter):
         self.parameters["threshold"] = None
         self.parameters["show_contour_lines"] = False
         self.parameters["show_colorbar"] = False
+        self.parameters["downsample"] = False
+        self.parameters["rasterise"] = False
         self.properties = SinglePlot2DProperties()
         self.colorbar = None
         self._type = "imshow"
@@ -2190,7 +2521,7 @@ class SinglePlotter2D(SinglePlotter):
         plot_function = getattr(self.axes, self.type)
         data = self._shape_data()
         self.drawing = plot_function(
-            data, extent=self._get_extent(), aspect="auto"
+            data, extent=self._get_extent(), aspect="auto", origin="lower"
         )
 
     def _plot_contour(self):
@@ -2204,38 +2535,109 @@ class SinglePlotter2D(SinglePlotter):
         else:
             levels = level_ticker.tick_values(np.min(data), np.max(data))
         self.drawing = plot_function(
-            data, extent=self._get_extent(), levels=levels
+            data,
+            extent=self._get_extent(),
+            levels=levels,
+            rasterized=self.parameters["rasterise"],
         )
         if self.type == "contourf" and self.parameters["show_contour_lines"]:
             self.axes.contour(
-                self.drawing, colors="k", linewidths=0.5, linestyles="-"
+                self.drawing,
+                colors="k",
+                linewidths=0.5,
+                linestyles="-",
+                rasterized=self.parameters["rasterise"],
             )
 
+    def _update_plot(self):
+        if self.type == "imshow":
+            data = self._shape_data()
+            self.drawing.set_data(data)
+            self.drawing.set_extent(self._get_extent())
+            self._update_clim(data)
+            return [self.drawing]
+        for drawing in self._get_contours():
+            drawing.remove()
+        self._plot_contour()
+        self.properties.drawing.apply(drawing=self.drawing)
+        if self.colorbar:
+            self.colorbar.update_normal(self.drawing)
+        return self._get_contours()
+
+    def _update_clim(self, data):
+        """
+        Scale the colours of the image to the data.
+
+        Limits set by the norm parameters are retained. The limits are only
+        set if they changed, as each change results in redrawing the
+        colorbar.
+
+        """
+        clim = [np.min(data), np.max(data)]
+        for idx, key in enumerate(("vmin", "vmax")):
+            if key in self.properties.drawing.norm_parameters:
+                clim[idx] = self.properties.drawing.norm_parameters[key]
+        if tuple(clim) != self.drawing.get_clim():
+            self.drawing.set_clim(*clim)
+
+    def _get_contours(self):
+        return [
+            child
+            for child in self.axes.get_children()
+            if isinstance(child, mpl.contour.ContourSet)
+        ]
+
+    def _update_limits(self, drawings):
+        extent = self._get_extent()
+        if self.axes.get_autoscalex_on():
+            self.axes.set_xlim(extent[:2], auto=None)
+        if self.axes.get_autoscaley_on():
+            self.axes.set_ylim(extent[2:], auto=None)
+
+    def _get_view_limits(self):
+        limits = super()._get_view_limits()
+        if self.colorbar:
+            limits.append(self.drawing.get_clim())
+        return limits
+
     def _shape_data(self):
         if self.parameters["switch_axes"]:
             data = self.data.data
         else:
             data = self.data.data.T
-        if self.type == "imshow":
-            data = np.flipud(data)
+        if self.parameters["downsample"]:
+            factors = self._get_downsampling_factors()
+            data = _block_mean(
+                _block_mean(data, factors[0], axis=0), factors[1], axis=1
+            )
         return data
 
     def _get_extent(self):
         if self.parameters["switch_axes"]:
-            extent = [
-                self.data.axes[1].values[0],
-                self.data.axes[1].values[-1],
-                self.data.axes[0].values[0],
-                self.data.axes[0].values[-1],
-            ]
+            xvalues = self.data.axes[1].values
+            yvalues = self.data.axes[0].values
         else:
-            extent = [
-                self.data.axes[0].values[0],
-                self.data.axes[0].values[-1],
-                self.data.axes[1].values[0],
-                self.data.axes[1].values[-1],
-            ]
-        return extent
+            xvalues = self.data.axes[0].values
+            yvalues = self.data.axes[1].values
+        # Downsampling the data must not shrink the range of the axes
+        return [xvalues[0], xvalues[-1], yvalues[0], yvalues[-1]]
+
+    def _get_downsampling_factors(self):
+        """
+        Return factors for downsampling rows and columns of shaped data.
+
+        The factors are chosen such that the downsampled data retain at
+        least as many points along each axis as the axes have pixels.
+
+        """
+        shape = self.data.data.shape
+        if not self.parameters["switch_axes"]:
+            shape = shape[::-1]
+        extent = self.axes.get_window_extent()
+        pixels = (math.ceil(extent.height), math.ceil(extent.width))
+        return [
+            max(1, points // pixel) for points, pixel in zip(shape, pixels)
+        ]
 
     def _set_axes_labels(self):
         """Set axes labels from axes in dataset.
@@ -2845,6 +3247,7 @@ class MultiDeviceDataPlotter1D(SinglePlotter1D):
             # noinspection PyTypedDict
             self.parameters["device_data"] = [self.parameters["device_data"]]
         devices = self.parameters["device_data"]
+        self.data = []
         for device in devices:
             if device not in self.dataset.device_data:
                 raise KeyError(f"Device '{device}' not found in dataset.")
@@ -2857,15 +3260,33 @@ class MultiDeviceDataPlotter1D(SinglePlotter1D):
             label = data.metadata.label or self.parameters["device_data"][idx]
             if not self.properties.drawings[idx].label:
                 self.properties.drawings[idx].label = label
+            values, data_ = _decimate(
+                data.axes[0].values, data.data, plotter=self
+            )
             if self.parameters["switch_axes"]:
-                (drawing,) = plot_function(
-                    data.data, data.axes[0].values, label=label
-                )
+                (drawing,) = plot_function(data_, values, label=label)
             else:
-                (drawing,) = plot_function(
-                    data.axes[0].values, data.data, label=label
-                )
+                (drawing,) = plot_function(values, data_, label=label)
             self.drawing.append(drawing)
+        self._set_tight_limits()
+
+    def _update_plot(self):
+        if len(self.data) != len(self.drawing):
+            raise aspecd.exceptions.MissingDrawingError(
+                message="Number of devices differs from number of drawings"
+            )
+        for drawing, data in zip(self.drawing, self.data):
+            values, data_ = _decimate(
+                data.axes[0].values, data.data, plotter=self
+            )
+            if self.parameters["switch_axes"]:
+                drawing.set_data(data_, values)
+            else:
+                drawing.set_data(values, data_)
+        self._set_tight_limits()
+        return self.drawing
+
+    def _set_tight_limits(self):
         if self.parameters["tight"]:
             axes_limits = [
                 min(data.axes[0].values.min() for data in self.data),
@@ -3269,6 +3690,31 @@ class MultiPlotter(Plotter):
         # Update/redraw legend after having set properties
         self._set_legend()
 
+    def update(self):
+        """Update the plot with the current data of the datasets.
+
+        For details, see :meth:`aspecd.plotting.Plotter.update`.
+
+        Raises
+        ------
+        aspecd.exceptions.MissingPlotError
+            Raised if nothing has been plotted yet
+        aspecd.exceptions.NotApplicableToDatasetError
+            Raised when plotting is not applicable to at least one of the
+            datasets listed in :attr:`datasets`
+
+
+        .. versionadded:: 0.12
+
+        """
+        if not self.figure:
+            raise aspecd.exceptions.MissingPlotError(
+                message="Nothing plotted yet to update"
+            )
+        self._assign_data()
+        self._check_for_applicability()
+        super().update()
+
     def _assign_data(self):
         self.data = []  # Important, e.g., for CompositePlotter
         if self.parameters["device_data"]:
@@ -3397,6 +3843,43 @@ class MultiPlotter1D(MultiPlotter):
 
             Default: ''
 
+        decimate : :class:`str`
+            Method for decimating the data of each dataset before plotting
+
+            Plotting and particularly saving long traces with millions of
+            points to vector graphics files takes a long time and results
+            in huge files, although only a few points per pixel can be
+            discerned. The "minmax" method retains the minimum and maximum
+            of the data within each bucket of consecutive points,
+            resulting in virtually the same figure. The "largest triangle three
+            buckets" ("lttb") method retains one point per bucket,
+            preserving the shape of the trace, but not necessarily all
+            extrema.
+
+            Decimation is only performed for the types "plot", "step",
+            and "semilogy", as it assumes the points to be evenly
+            distributed along the (linear) axis. Furthermore, it assumes
+            the values of the axis to be sorted. If limits are set for the
+            axis, only the points within these limits are decimated and
+            plotted, together with the adjacent point on either side.
+
+            Possible values: '', 'minmax', 'lttb'
+
+            Default: ''
+
+            .. versionadded:: 0.12
+
+        decimation_points : :class:`int`
+            Number of points retained when decimating the data
+
+            If zero, four points per pixel of the axes are retained,
+            determined from the size of the axes and the resolution (DPI)
+            of the figure.
+
+            Default: 0
+
+            .. versionadded:: 0.12
+
     Examples
     --------
     For convenience, a series of examples in recipe style (for details of
@@ -3505,6 +3988,8 @@ class MultiPlotter1D(MultiPlotter):
         self.properties = MultiPlot1DProperties()
         self.parameters["switch_axes"] = False
         self.parameters["tight"] = ""
+        self.parameters["decimate"] = ""
+        self.parameters["decimation_points"] = 0
         self._type = "plot"
         self._allowed_types = [
             "plot",
@@ -3580,19 +4065,41 @@ class MultiPlotter1D(MultiPlotter):
         for idx, data in enumerate(self.data):
             if not self.properties.drawings[idx].label:
                 self.properties.drawings[idx].label = self.datasets[idx].label
+            values, data_ = _decimate(
+                data.axes[0].values, data.data, plotter=self
+            )
             if self.parameters["switch_axes"]:
                 (drawing,) = plot_function(
-                    data.data,
-                    data.axes[0].values,
+                    data_,
+                    values,
                     label=self.properties.drawings[idx].label,
                 )
             else:
                 (drawing,) = plot_function(
-                    data.axes[0].values,
-                    data.data,
+                    values,
+                    data_,
                     label=self.properties.drawings[idx].label,
                 )
             self.drawings.append(drawing)
+        self._set_tight_limits()
+
+    def _update_plot(self):
+        if len(self.data) != len(self.drawings):
+            raise aspecd.exceptions.MissingDrawingError(
+                message="Number of datasets differs from number of drawings"
+            )
+        for drawing, data in zip(self.drawings, self.data):
+            values, data_ = _decimate(
+                data.axes[0].values, data.data, plotter=self
+            )
+            if self.parameters["switch_axes"]:
+                drawing.set_data(data_, values)
+            else:
+                drawing.set_data(values, data_)
+        self._set_tight_limits()
+        return self.drawings
+
+    def _set_tight_limits(self):
         if self.parameters["tight"]:
             axes_limits = [
                 min(data.axes[0].values.min() for data in self.data),
@@ -3773,16 +4280,19 @@ class MultiPlotter1DStacked(MultiPlotter1D):
         for idx, dataset in enumerate(self.datasets):
             if not self.properties.drawings[idx].label:
                 self.properties.drawings[idx].label = dataset.label
+            values, data = _decimate(
+                dataset.data.axes[0].values, dataset.data.data, plotter=self
+            )
             if self.parameters["switch_axes"]:
                 (drawing,) = plot_function(
-                    dataset.data.data - idx * offset,
-                    dataset.data.axes[0].values,
+                    data - idx * offset,
+                    values,
                     label=self.properties.drawings[idx].label,
                 )
             else:
                 (drawing,) = plot_function(
-                    dataset.data.axes[0].values,
-                    dataset.data.data - idx * offset,
+                    values,
+                    data - idx * offset,
                     label=self.properties.drawings[idx].label,
                 )
             self.drawings.append(drawing)
@@ -3794,6 +4304,27 @@ class MultiPlotter1DStacked(MultiPlotter1D):
             labelleft=False,
             labelright=False,
         )
+        self._set_tight_limits()
+
+    def _update_plot(self):
+        if len(self.datasets) != len(self.drawings):
+            raise aspecd.exceptions.MissingDrawingError(
+                message="Number of datasets differs from number of drawings"
+            )
+        offset = self.parameters["offset"]
+        for idx, dataset in enumerate(self.datasets):
+            values, data = _decimate(
+                dataset.data.axes[0].values, dataset.data.data, plotter=self
+            )
+            if self.parameters["switch_axes"]:
+                self.drawings[idx].set_data(data - idx * offset, values)
+            else:
+                self.drawings[idx].set_data(values, data - idx * offset)
+        self._set_tight_limits()
+        return self.drawings
+
+    def _set_tight_limits(self):
+        offset = self.parameters["offset"]
         if self.parameters["tight"]:
             axes_limits = [
                 min(
@@ -4320,14 +4851,17 @@ class SingleCompositePlotter(CompositePlotter):
         history_record : :class:`aspecd.history.PlotHistoryRecord`
             history record for plotting step
 
+
+        .. versionchanged:: 0.12
+            The records of the preprocessing are shared with the history
+            of the dataset rather than deep copies
+
         """
         history_record = aspecd.history.PlotHistoryRecord(
             package=self.dataset.package_name
         )
         history_record.plot = aspecd.history.SinglePlotRecord(plotter=self)
-        history_record.plot.preprocessing = copy.deepcopy(
-            self.dataset.history
-        )
+        history_record.plot.preprocessing = list(self.dataset.history)
         return history_record
 
     def _assign_dataset(self, dataset):
@@ -5703,10 +6237,8 @@ class AxesProperties(aspecd.utils.Properties):
             axes.set_xticklabels(self.xticklabels)
         if self.yticklabels is not None:
             axes.set_yticklabels(self.yticklabels)
-        for tick in axes.get_xticklabels():
-            tick.set_rotation(self.xticklabelangle)
-        for tick in axes.get_yticklabels():
-            tick.set_rotation(self.yticklabelangle)
+        axes.tick_params(axis="x", labelrotation=self.xticklabelangle)
+        axes.tick_params(axis="y", labelrotation=self.yticklabelangle)
 
     def _set_axes_label_properties(self, axes):
         axes.get_xaxis().get_label().set_fontsize(self.label_fontsize)
@@ -7513,3 +8045,166 @@ class MarkerProperties(DrawingProperties):
                 drawing.__class__,
                 prop,
             )
+
+
+def _decimate(values, data, plotter):
+    """
+    Decimate 1D data according to the parameters of the plotter.
+
+    Returns the axis values and data, decimated if the parameter
+    ``decimate`` of the plotter is set, the plot type is applicable,
+    and the data are longer than the number of points to retain.
+
+    """
+    types = ("plot", "step", "semilogy")
+    if not plotter.parameters["decimate"] or plotter.type not in types:
+        return values, data
+    if plotter.parameters["decimate"] not in ("minmax", "lttb"):
+        raise ValueError(
+            f"Unknown decimation {plotter.parameters['decimate']}"
+        )
+    number_of_points = plotter.parameters["decimation_points"]
+    if not number_of_points:
+        extent = plotter.axes.get_window_extent()
+        if plotter.parameters["switch_axes"]:
+            number_of_points = 4 * math.ceil(extent.height)
+        else:
+            number_of_points = 4 * math.ceil(extent.width)
+    values, data = _restrict_to_limits(values, data, plotter)
+    if len(data) <= max(number_of_points, 3):
+        return values, data
+    if plotter.parameters["decimate"] == "minmax":
+        indices = _min_max_indices(data, number_of_points)
+    else:
+        indices = _lttb_indices(values, data, number_of_points)
+    return values[indices], data[indices]
+
+
+def _restrict_to_limits(values, data, plotter):
+    """
+    Return axis values and data within the axis limits set in the plotter.
+
+    One point on either side of the limits is retained, so that the line
+    continues to the border of the axes.
+
+    """
+    if plotter.parameters["switch_axes"]:
+        limits = plotter.properties.axes.ylim
+    else:
+        limits = plotter.properties.axes.xlim
+    if not limits:
+        return values, data
+    descending = values[0] > values[-1]
+    sorted_values = values[::-1] if descending else values
+    start = max(np.searchsorted(sorted_values, min(limits)) - 1, 0)
+    end = min(
+        np.searchsorted(sorted_values, max(limits), side="right") + 1,
+        len(values),
+    )
+    if descending:
+        start, end = len(values) - end, len(values) - start
+    return values[start:end], data[start:end]
+
+
+def _min_max_indices(data, number_of_points):
+    """Return indices of minimum and maximum of each bucket of points."""
+    bucket_size = math.ceil(2 * len(data) / number_of_points)
+    size = len(data) - len(data) % bucket_size
+    buckets = np.reshape(data[:size], (-1, bucket_size))
+    offsets = np.arange(0, size, bucket_size)
+    indices = [
+        [0],
+        offsets + np.argmin(buckets, axis=1),
+        offsets + np.argmax(buckets, axis=1),
+        [len(data) - 1],
+    ]
+    if size < len(data):
+        indices.append(size + np.argmin(data[size:]))
+        indices.append(size + np.argmax(data[size:]))
+    return np.unique(np.hstack(indices))
+
+
+def _lttb_indices(values, data, number_of_points):
+    """
+    Return indices of points using largest triangle three buckets.
+
+    Besides first and last point, one point per bucket is retained,
+    namely the one forming the largest triangle with the point retained
+    from the previous bucket and the average of the next bucket.
+
+    For the algorithm, see S. Steinarsson: Downsampling Time Series for
+    Visual Representation, MSc thesis, University of Iceland (2013).
+
+    """
+    edges = np.linspace(1, len(data) - 1, number_of_points - 1).astype(int)
+    edges = np.append(edges, len(data))
+    indices = np.zeros(number_of_points, dtype=int)
+    indices[-1] = len(data) - 1
+    for bucket in range(number_of_points - 2):
+        start, end, next_end = edges[bucket : bucket + 3]
+        previous = indices[bucket]
+        average_value = values[end:next_end].mean()
+        average_data = data[end:next_end].mean()
+        areas = np.abs(
+            (values[previous] - average_value)
+            * (data[start:end] - data[previous])
+            - (values[previous] - values[start:end])
+            * (average_data - data[previous])
+        )
+        indices[bucket + 1] = start + np.argmax(areas)
+    return indices
+
+
+def _block_mean(data, block_size, axis=0):
+    """
+    Return means of blocks of points along the given axis of the data.
+
+    Each block contains ``block_size`` points, except for the last one
+    containing the remaining points.
+
+    """
+    if block_size == 1:
+        return data
+    starts = np.arange(0, data.shape[axis], block_size)
+    sizes = np.diff(np.append(starts, data.shape[axis]))
+    shape = [1] * data.ndim
+    shape[axis] = len(sizes)
+    return np.add.reduceat(data, starts, axis=axis) / np.reshape(sizes, shape)
+
+
+def clear_style_cache():
+    """
+    Clear the process-wide cache of rc parameters set by styles.
+
+    The rc parameters set by a matplotlib style are determined only once
+    per style and process. Clearing the cache results in determining the
+    parameters anew upon applying the style the next time.
+
+    .. versionadded:: 0.12
+
+    """
+    _STYLES.clear()
+
+
+def _style_parameters(style):
+    """
+    Return the rc parameters set by a matplotlib style.
+
+    To get exactly those parameters matplotlib sets (and validates) when
+    using the style, the style is used once with all rc parameters unset.
+    The backend is never set by styles and not restored by
+    :func:`matplotlib.rc_context`, hence left untouched.
+
+    """
+    if style not in _STYLES:
+        unset = object()
+        keys = [key for key in mpl.rcParams if key != "backend"]
+        with mpl.rc_context():
+            dict.update(mpl.rcParams, dict.fromkeys(keys, unset))
+            plt.style.use(style)
+            _STYLES[style] = {
+                key: value
+                for key, value in dict.items(mpl.rcParams)
+                if key != "backend" and value is not unset
+            }
+    return _STYLES[style]
@@ -147,7 +147,8 @@ independently.
 
 * :class:`aspecd.processing.Denoising1DSVD`
 
-  Denoise 1D data using singular value decomposition (SVD).
+  Denoise 1D data and traces of 2D data using singular value
+  decomposition (SVD).
 
 * :class:`aspecd.processing.ChangeAxesValues`
 
@@ -255,20 +256,42 @@ in the :attr:`aspecd.processing.ProcessingStep.parameters` dictionary. Thus,
 they are added to the dataset history and available for reports and alike.
 
 
+Processing data in chunks
+-------------------------
+
+Datasets too large to fit into memory can be imported memory-mapped (see
+:class:`aspecd.io.AdfImporter`) and processed in chunks, setting the
+attribute ``chunk_size`` of the processing step: The data are passed to the
+processing step slice by slice (or rather chunk by chunk) along one axis,
+hence only one chunk needs to be in memory at a time. This requires the
+processing step to be *separable* along this axis, *i.e.* to yield the same
+result for each slice whether processed separately or together with all
+other slices.
+
+Hence, if your processing step is separable along some axes, implement the
+non-public method ``_separable_axes`` returning the indices of these axes.
+If processing requires quantities depending on the entire data (such as the
+maximum used for normalising), determine them in ``_prepare_chunks``, and if
+processing adds parameters for each chunk (such as the coefficients of a
+baseline correction), combine them in ``_merge_chunk_parameters``. See
+:class:`aspecd.processing.SingleProcessingStep` for details.
+
+
 Module documentation
 ====================
 
 """
 
+import contextlib
 import copy
 import logging
 import math
 import operator
+import os
+import tempfile
+import weakref
 
 import numpy as np
-import scipy.ndimage
-import scipy.signal
-from scipy import interpolate
 
 import bibrecord.record as bib
 
@@ -276,6 +299,9 @@ import aspecd.exceptions
 import aspecd.history
 import aspecd.utils
 
+scipy = aspecd.utils.LazyModule("scipy")
+interpolate = aspecd.utils.LazyModule("scipy.interpolate")
+
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
@@ -505,11 +531,32 @@ class SingleProcessingStep(ProcessingStep):
     which is called by the :meth:`aspecd.dataset.Dataset.process` method of the
     dataset object.
 
+    Processing steps separable along an axis of the data, *i.e.* processing
+    each slice along this axis independently of all other slices, can
+    process the data in chunks of slices, setting :attr:`chunk_size`.
+    Hence, only one chunk needs to be in memory at a time, allowing to
+    process datasets larger than the available memory if their data are
+    memory-mapped (see :class:`aspecd.io.AdfImporter`). In this case,
+    the resulting data are written to a temporary file as well.
+    Processing steps declare the axes they are separable along by
+    implementing the non-public method :meth:`_separable_axes`. Steps not
+    separable along any axis process the data at once regardless of
+    :attr:`chunk_size`.
+
     Attributes
     ----------
     dataset : :class:`aspecd.dataset.Dataset`
         Dataset the processing step should be performed on
 
+    chunk_size : :class:`int`
+        Number of slices processed at once
+
+        Slices are taken along the first axis the processing step is
+        separable along. As the result does not depend on the chunk size,
+        it is not stored in the history of the dataset.
+
+        Default: 0 (process data at once)
+
     Raises
     ------
     aspecd.exceptions.NotApplicableToDatasetError
@@ -517,12 +564,17 @@ class SingleProcessingStep(ProcessingStep):
     aspecd.exceptions.MissingDatasetError
         Raised when no dataset exists to act on
 
+
+    .. versionchanged:: 0.12
+        New attribute :attr:`chunk_size` for processing data in chunks
+
     """
 
     def __init__(self):
         super().__init__()
         self.description = "Abstract singleprocessing step"
         self.dataset = None
+        self.chunk_size = 0
 
     def to_dict(self, remove_empty=False):
         """
@@ -614,6 +666,11 @@ class SingleProcessingStep(ProcessingStep):
     def _call_from_dataset(self, from_dataset=False):
         if not from_dataset:
             self.dataset.process(self)
+        elif self.chunk_size:
+            self._check_applicability()
+            self._set_defaults()
+            self._sanitise_parameters()
+            self._perform_task_in_chunks()
         else:
             super().process()
 
@@ -647,6 +704,101 @@ class SingleProcessingStep(ProcessingStep):
         )
         return history_record
 
+    def _separable_axes(self):
+        """Return indices of the axes the processing step is separable along.
+
+        Needs to be implemented in classes inheriting from
+        SingleProcessingStep according to their needs. Note that this
+        method will be called after sanitising parameters, hence the
+        result may depend on the parameters.
+
+        Returns
+        -------
+        axes : :class:`list`
+            Indices of the axes of the data
+
+            Empty by default, *i.e.* the processing step is not separable.
+
+        """
+        return []
+
+    def _prepare_chunks(self):
+        """Prepare processing the data in chunks.
+
+        Called once before processing the chunks, with the entire dataset.
+        Needs to be implemented in classes inheriting from
+        SingleProcessingStep according to their needs, *e.g.* to determine
+        quantities depending on the entire data.
+
+        """
+
+    def _merge_chunk_parameters(self, parameters, axis=0):
+        """Combine the parameters obtained upon processing the chunks.
+
+        Needs to be implemented in classes inheriting from
+        SingleProcessingStep according to their needs, *e.g.* if
+        processing adds parameters for each slice of the data. By default,
+        the parameters obtained upon processing the last chunk are retained.
+
+        Parameters
+        ----------
+        parameters : :class:`list`
+            Shallow copies of the parameters after processing each chunk
+
+        axis : :class:`int`
+            Index of the axis the data have been split along
+
+        """
+
+    def _perform_task_in_chunks(self):
+        axes = self._separable_axes()
+        if not axes or not self.dataset.data.data.size:
+            self._perform_task()
+            return
+        axis = axes[0]
+        self._prepare_chunks()
+        data = self.dataset.data
+        array = data.data
+        values = data.axes[axis].values
+        # Chunks are processed as separate data object with the same axes,
+        # but without copying the (possibly memory-mapped) data themselves
+        chunk = type(data)(calculated=data.calculated)
+        chunk_axes = copy.deepcopy(data.axes)
+        result = None
+        parameters = []
+        try:
+            self.dataset.data = chunk
+            for start in range(0, array.shape[axis], self.chunk_size):
+                index = (slice(None),) * axis + (
+                    slice(start, start + self.chunk_size),
+                )
+                chunk.data = np.array(array[index])
+                chunk_axes[axis].values = values[index[-1]]
+                chunk.axes = chunk_axes
+                self._perform_task()
+                if result is None:
+                    shape = list(chunk.data.shape)
+                    shape[axis] = array.shape[axis]
+                    result = _create_array(
+                        shape,
+                        dtype=chunk.data.dtype,
+                        memory_mapped=isinstance(array, np.memmap),
+                    )
+                result[index] = chunk.data
+                parameters.append(copy.copy(self.parameters))
+        except Exception:
+            if isinstance(result, np.memmap):
+                _remove_file(result.filename)
+            raise
+        finally:
+            self.dataset.data = data
+        self._merge_chunk_parameters(parameters, axis=axis)
+        data.data = _finalise_array(result)
+        # Processing may change the axes metadata, e.g. the unit
+        for chunk_axis, data_axis in zip(chunk.axes, data.axes):
+            for attribute in ("quantity", "symbol", "unit", "label"):
+                setattr(data_axis, attribute, getattr(chunk_axis, attribute))
+
 
 class MultiProcessingStep(ProcessingStep):
     """Base class for processing steps operating on multiple datasets.
@@ -970,8 +1122,26 @@ class Normalisation(SingleProcessingStep):
         self.parameters["noise_range"] = None
         self.parameters["noise_range_unit"] = "percentage"
         self._noise_amplitude = 0
+        self._divisor = None
+
+    def _sanitise_parameters(self):
+        # Divisor determined anew for each dataset, but once for all chunks
+        self._divisor = None
 
     def _perform_task(self):
+        if self._divisor is None:
+            self._determine_divisor()
+        self.dataset.data.data /= self._divisor
+        self.dataset.data.axes[-1].unit = ""
+
+    def _separable_axes(self):
+        return list(range(self.dataset.data.data.ndim))
+
+    def _prepare_chunks(self):
+        # The divisor depends on the entire data
+        self._determine_divisor()
+
+    def _determine_divisor(self):
         self._determine_noise_amplitude()
         if self.parameters["range"]:
             range_extraction = RangeExtraction()
@@ -985,23 +1155,21 @@ class Normalisation(SingleProcessingStep):
         else:
             data = self.dataset.data.data
         if "max" in self.parameters["kind"].lower():
-            self.dataset.data.data /= data.max() - self._noise_amplitude / 2
-            self.dataset.data.axes[-1].unit = ""
+            self._divisor = data.max() - self._noise_amplitude / 2
         elif "min" in self.parameters["kind"].lower():
-            self.dataset.data.data /= (
-                abs(data.min()) - self._noise_amplitude / 2
-            )
-            self.dataset.data.axes[-1].unit = ""
+            self._divisor = abs(data.min()) - self._noise_amplitude / 2
         elif "amp" in self.parameters["kind"].lower():
-            self.dataset.data.data /= (
-                data.max() - data.min()
-            ) - self._noise_amplitude
-            self.dataset.data.axes[-1].unit = ""
+            self._divisor = (data.max() - data.min()) - self._noise_amplitude
         elif "area" in self.parameters["kind"].lower():
             # might be written better
-            self.dataset.data.data /= np.sum(np.abs(data)) / data.shape[0]
-            self.dataset.data.data /= np.sum(np.abs(data))
-            self.dataset.data.axes[-1].unit = ""
+            area = np.sum(np.abs(data))
+            self._divisor = area / data.shape[0]
+            # Without range, the data have been divided once before
+            # determining the area a second time
+            if self.parameters["range"]:
+                self._divisor *= area
+            else:
+                self._divisor *= data.shape[0]
         else:
             raise ValueError(
                 f'Kind {self.parameters["kind"]} not recognised.'
@@ -1064,6 +1232,9 @@ class Integration(SingleProcessingStep):
             self.dataset.data.data, axis=dim - 1
         )
 
+    def _separable_axes(self):
+        return list(range(self.dataset.data.data.ndim - 1))
+
 
 class Differentiation(SingleProcessingStep):
     """
@@ -1109,7 +1280,12 @@ class Differentiation(SingleProcessingStep):
         if self.dataset.data.data.ndim == 1:
             self.dataset.data.data = np.gradient(self.dataset.data.data)
         else:
-            self.dataset.data.data = np.gradient(self.dataset.data.data)[0]
+            self.dataset.data.data = np.gradient(
+                self.dataset.data.data, axis=0
+            )
+
+    def _separable_axes(self):
+        return list(range(1, self.dataset.data.data.ndim))
 
 
 class ScalarAlgebra(SingleProcessingStep):
@@ -1203,6 +1379,9 @@ class ScalarAlgebra(SingleProcessingStep):
             self.dataset.data.data, self.parameters["value"]
         )
 
+    def _separable_axes(self):
+        return list(range(self.dataset.data.data.ndim))
+
 
 class Projection(SingleProcessingStep):
     # noinspection PyUnresolvedReferences
@@ -2038,7 +2217,7 @@ class RangeExtraction(SingleProcessingStep):
 
 class BaselineCorrection(SingleProcessingStep):
     # noinspection PyUnresolvedReferences
-    """
+    r"""
     Subtract baseline from dataset.
 
     Currently, only polynomial baseline corrections are supported.
@@ -2049,9 +2228,9 @@ class BaselineCorrection(SingleProcessingStep):
     If no order is explicitly given, a polynomial baseline of zeroth order
     will be used.
 
-    .. important::
-        Baseline correction works *only* for **1D and 2D** datasets,
-        not for higher-dimensional datasets.
+    For *N*\ D datasets, the baseline correction is performed along the
+    given axis for all slices of the dataset at once, *i.e.* using a single
+    least-squares fit. The coefficients for each slice are retained.
 
     Attributes
     ----------
@@ -2082,10 +2261,16 @@ class BaselineCorrection(SingleProcessingStep):
         coefficients:
             Coefficients used to calculate the baseline.
 
+            For *N*\ D datasets, the coefficients for each slice,
+            with the coefficients as first axis and the remaining axes of
+            the data in their original order. Hence, for a 2D dataset
+            corrected along the first axis, ``coefficients[:, 5]`` are the
+            coefficients used for the sixth column.
+
         axis : :class:`int`
             Axis along which to perform the baseline correction.
 
-            Only necessary in case of 2D data.
+            Only necessary in case of *N*\ D data.
 
             Default: 0
 
@@ -2157,6 +2342,10 @@ class BaselineCorrection(SingleProcessingStep):
     .. versionchanged:: 0.6.3
         Zero values in range properly handled
 
+    .. versionchanged:: 0.12
+        Works for *N*\ D datasets; all slices are fitted at once, and the
+        coefficients for all slices are retained
+
     """
 
     def __init__(self):
@@ -2170,30 +2359,10 @@ class BaselineCorrection(SingleProcessingStep):
         self.parameters["axis"] = 0
         self._data_points_left = None
         self._data_points_right = None
+        self._fit_indices = []
         self._axis_values = []
         self._intensity_values = []
 
-    @staticmethod
-    def applicable(dataset):
-        """
-        Check whether processing step is applicable to the given dataset.
-
-        Baseline correction is (currently) only applicable to datasets with
-        one- and two-dimensional data.
-
-        Parameters
-        ----------
-        dataset : :class:`aspecd.dataset.Dataset`
-            dataset to check
-
-        Returns
-        -------
-        applicable : :class:`bool`
-            `True` if successful, `False` otherwise.
-
-        """
-        return len(dataset.data.axes) < 4
-
     def _sanitise_parameters(self):
         if isinstance(self.parameters["fit_area"], (float, int)):
             fit_area = self.parameters["fit_area"]
@@ -2214,69 +2383,101 @@ class BaselineCorrection(SingleProcessingStep):
             self.parameters["fit_area"] = [50, 50]
 
     def _perform_task(self):
+        axis = self.parameters["axis"]
         self._get_fit_range()
         self._get_axis_values()
-        if self._is_n_dimensional():
-            axis = 1 if self.parameters["axis"] == 0 else 0
-            if self.parameters["axis"] == 0:
-                for idx in range(self.dataset.data.data.shape[axis]):
-                    self._get_intensity_values(self.dataset.data.data[:, idx])
-                    values_to_subtract = self._get_values_to_subtract()
-                    self.dataset.data.data[:, idx] -= values_to_subtract
-            else:
-                for idx in range(self.dataset.data.data.shape[axis]):
-                    self._get_intensity_values(self.dataset.data.data[idx, :])
-                    values_to_subtract = self._get_values_to_subtract()
-                    self.dataset.data.data[idx, :] -= values_to_subtract
-        else:
-            self._get_intensity_values(self.dataset.data.data)
-            values_to_subtract = self._get_values_to_subtract()
-            self.dataset.data.data -= values_to_subtract
+        # Fit all slices at once: fit axis first, all other axes flattened
+        data = np.moveaxis(self.dataset.data.data, axis, 0)
+        shape = data.shape
+        self._get_intensity_values(data.reshape(shape[0], -1))
+        values_to_subtract = self._get_values_to_subtract()
+        self.dataset.data.data -= np.moveaxis(
+            values_to_subtract.reshape(shape), 0, axis
+        )
+        self.parameters["coefficients"] = self.parameters[
+            "coefficients"
+        ].reshape((-1,) + shape[1:])
+
+    def _separable_axes(self):
+        return [
+            axis
+            for axis in range(self.dataset.data.data.ndim)
+            if axis != self.parameters["axis"]
+        ]
+
+    def _merge_chunk_parameters(self, parameters, axis=0):
+        # Coefficients first, remaining axes in their original order
+        if axis > self.parameters["axis"]:
+            axis -= 1
+        self.parameters["coefficients"] = np.concatenate(
+            [parameters_["coefficients"] for parameters_ in parameters],
+            axis=axis + 1,
+        )
 
     def _get_fit_range(self):
-        number_of_points = len(self.dataset.data.data)
+        number_of_points = self.dataset.data.data.shape[
+            self.parameters["axis"]
+        ]
         self._data_points_left = math.ceil(
             number_of_points * self.parameters["fit_area"][0] / 100.0
         )
         self._data_points_right = math.ceil(
             number_of_points * self.parameters["fit_area"][1] / 100.0
         )
+        self._fit_indices = np.r_[
+            0 : self._data_points_left,
+            number_of_points - self._data_points_right : number_of_points,
+        ]
 
-    # pylint: disable=invalid-unary-operand-type
     def _get_axis_values(self):
-        left_values = right_values = []
         axis = self.parameters["axis"]
-        if self._data_points_left:
-            left_values = self.dataset.data.axes[axis].values[
-                : self._data_points_left
-            ]
-        if self._data_points_right:
-            right_values = self.dataset.data.axes[axis].values[
-                -self._data_points_right :
-            ]
-        self._axis_values = np.concatenate((left_values, right_values))
+        self._axis_values = self.dataset.data.axes[axis].values[
+            self._fit_indices
+        ]
 
     def _get_intensity_values(self, data):
-        left_values = right_values = []
-        if self._data_points_left:
-            left_values = data[: self._data_points_left]
-        if self._data_points_right:
-            right_values = data[-self._data_points_right :]
-        self._intensity_values = np.concatenate((left_values, right_values))
-
-    # noinspection PyUnresolvedReferences,PyCallingNonCallable
+        self._intensity_values = data[self._fit_indices]
+
+    # noinspection PyUnresolvedReferences
     def _get_values_to_subtract(self):
-        polynomial = np.polynomial.Polynomial.fit(
-            self._axis_values,
-            self._intensity_values,
-            self.parameters["order"],
+        # Same as np.polynomial.Polynomial.fit, but for all slices at once:
+        # Axis values are mapped to [-1, 1] and the columns of the
+        # Vandermonde matrix scaled to improve the condition of the problem
+        order = self.parameters["order"]
+        domain = np.polynomial.polyutils.getdomain(self._axis_values)
+        offset, scale = np.polynomial.polyutils.mapparms(domain, [-1, 1])
+        vandermonde = np.polynomial.polynomial.polyvander(
+            offset + scale * self._axis_values, order
+        )
+        column_norms = np.sqrt(np.square(vandermonde).sum(axis=0))
+        column_norms[column_norms == 0] = 1
+        coefficients = np.linalg.lstsq(
+            vandermonde / column_norms, self._intensity_values, rcond=None
+        )[0]
+        coefficients = (coefficients.T / column_norms).T
+        axis_values = self.dataset.data.axes[self.parameters["axis"]].values
+        self.parameters["coefficients"] = (
+            self._conversion_matrix(domain) @ coefficients
+        )
+        return (
+            np.polynomial.polynomial.polyvander(
+                offset + scale * axis_values, order
+            )
+            @ coefficients
         )
-        self.parameters["coefficients"] = polynomial.convert().coef
-        axis = self.parameters["axis"]
-        return polynomial(self.dataset.data.axes[axis].values)
 
-    def _is_n_dimensional(self):
-        return len(self.dataset.data.axes) > 2
+    def _conversion_matrix(self, domain=None):
+        # Converts coefficients from scaled to data domain
+        number_of_coefficients = self.parameters["order"] + 1
+        matrix = np.zeros([number_of_coefficients, number_of_coefficients])
+        for idx, unit_vector in enumerate(np.eye(number_of_coefficients)):
+            coefficients = (
+                np.polynomial.Polynomial(unit_vector, domain=domain)
+                .convert()
+                .coef
+            )
+            matrix[: len(coefficients), idx] = coefficients
+        return matrix
 
 
 class Averaging(SingleProcessingStep):
@@ -3128,6 +3329,12 @@ class Filtering(SingleProcessingStep):
                 self.parameters["order"],
             )
 
+    def _separable_axes(self):
+        # Only the Savitzky-Golay filter operates along one axis
+        if self.parameters["type"] == "savitzky-golay":
+            return list(range(self.dataset.data.data.ndim - 1))
+        return []
+
     def _convert_filter_type(self):
         for filter_type, aliases in self._types.items():
             if self.parameters["type"] in aliases:
@@ -4096,18 +4303,35 @@ class Denoising1DSVD(SingleProcessingStep):
     Hence, if using this code leads to a scientific publication,
     strongly consider citing the appropriate publication(s).
 
+    For 2D datasets, each trace along the given axis is denoised
+    separately, all in one processing step. The singular value
+    decompositions of all traces are performed in batch. As the traces are
+    independent of each other, the data can be processed in chunks of
+    traces, setting :attr:`chunk_size`.
+
+    Only the leading singular values and vectors are necessary to determine
+    the rank of the approximating matrix. Hence, for long signals,
+    consider using the "randomised" solver, computing only those singular
+    values and vectors, and reusing them as starting point for the
+    decomposition in each step of the detrending. Note that the randomised
+    solver is an approximation, though usually yielding the same rank and
+    hence virtually the same result. To get reproducible results, the
+    random numbers involved are always generated with the same seed.
+
 
     Attributes
     ----------
     parameters : :class:`dict`
         All parameters necessary for this step.
 
-        rank : :class:`int`
+        rank : :class:`int` | :class:`list`
             Rank of the approximating matrix of the constructed partial
             circulant matrix from the sequence. The rank will automatically be
             determined by the algorithm. Hence, this parameter is read-only.
             For details of the algorithm, see the cited reference.
 
+            For 2D datasets, a list with the rank for each trace.
+
         fraction : :class:`float`
             Fraction of the data length used as rows of the constructed matrix.
 
@@ -4130,10 +4354,35 @@ class Denoising1DSVD(SingleProcessingStep):
 
             Default: 0.1
 
+        axis : :class:`int`
+            Axis along which to denoise the data.
+
+            Only necessary in case of 2D data, where each trace along this
+            axis is denoised.
+
+            Default: 0
+
+        solver : :class:`str`
+            Method used for the singular value decomposition.
+
+            Valid values: "full", "randomised"
+
+            The "full" solver computes all singular values and vectors,
+            the "randomised" solver only the leading ones necessary to
+            determine the rank.
+
+            Default: "full"
+
     Raises
     ------
     aspecd.exceptions.NotApplicableToDatasetError
-        Raised if dataset is not 1D or has <=10 data points.
+        Raised if dataset is neither 1D nor 2D or has <=10 data points.
+
+    ValueError
+        Raised if the traces have <=10 data points or the solver is unknown.
+
+    IndexError
+        Raised if axis is out of bounds for the given dataset.
 
 
     Examples
@@ -4167,6 +4416,28 @@ class Denoising1DSVD(SingleProcessingStep):
     circulant matrix does not necessarily provide better results and usually
     slows down processing.
 
+    Denoising long signals is considerably faster using the randomised
+    solver, computing only the leading singular values and vectors:
+
+    .. code-block:: yaml
+
+        - kind: processing
+          type: Denoising1DSVD
+          properties:
+            parameters:
+              solver: randomised
+
+    For 2D datasets, each trace along the given axis is denoised, here the
+    traces along the second axis (index 1), *i.e.* the rows of the data:
+
+    .. code-block:: yaml
+
+        - kind: processing
+          type: Denoising1DSVD
+          properties:
+            parameters:
+              axis: 1
+
     .. versionadded:: 0.12
 
 
@@ -4206,20 +4477,33 @@ class Denoising1DSVD(SingleProcessingStep):
         self.parameters["rank"] = 0
         self.parameters["fraction"] = 0.2
         self.parameters["noise_threshold"] = 0.1
+        self.parameters["axis"] = 0
+        self.parameters["solver"] = "full"
         self._n_rows = 0
+        self._traces = None
         self._matrix = None
-        self._U = None  # noqa
-        self._s = None  # noqa
-        self._Vh = None  # noqa
+        self._left_vectors = None
+        self._singular_values = None
+        self._right_vectors = None
+        self._rank = None
         self._trend = None
-        self._points_for_detrending = 11
+        self._points_for_detrending = None
+        # Components checked at once, components additionally computed by
+        # the randomised solver to approximate the leading ones accurately,
+        # and its power iterations without and with starting point
+        self._window = 10
+        self._oversampling = 20
+        self._power_iterations = (4, 1)
+        # Maximum number of matrix elements decomposed at once
+        self._batch_size = 2**24
 
     @staticmethod
     def applicable(dataset):
         """
         Check whether processing step is applicable to the given dataset.
 
-        This method is only applicable to 1D datasets with >10 data points.
+        This method is only applicable to 1D and 2D datasets with >10 data
+        points.
 
         Parameters
         ----------
@@ -4232,112 +4516,281 @@ class Denoising1DSVD(SingleProcessingStep):
             `True` if successful, `False` otherwise.
 
         """
-        return len(dataset.data.axes) == 2 and len(dataset.data.data) > 10
+        return (
+            len(dataset.data.axes) in (2, 3)
+            and max(dataset.data.data.shape) > 10
+        )
 
     def _sanitise_parameters(self):
+        if self.parameters["axis"] not in range(self.dataset.data.data.ndim):
+            raise IndexError(f"Axis {self.parameters['axis']} out of bounds")
+        size = self.dataset.data.data.shape[self.parameters["axis"]]
+        if size <= 10:
+            raise ValueError("Too few data points along axis, minimum: 11")
         if not self._n_rows:
-            self._n_rows = int(
-                self.dataset.data.data.size * self.parameters["fraction"]
-            )
+            self._n_rows = int(size * self.parameters["fraction"])
         self.parameters["rank"] = 0
         if self.parameters["fraction"] > 1:
             raise ValueError("Fraction exceeds signal dimensions")
         if self.parameters["fraction"] < 0.1:
             raise ValueError("Fraction too small, minimum: 0.1")
+        if self.parameters["solver"] not in ("full", "randomised"):
+            raise ValueError(f"Unknown solver {self.parameters['solver']}")
+
+    def _separable_axes(self):
+        if self.dataset.data.data.ndim == 1:
+            return []
+        return [1 - self.parameters["axis"]]
+
+    def _merge_chunk_parameters(self, parameters, axis=0):
+        self.parameters["rank"] = [
+            rank for parameters_ in parameters for rank in parameters_["rank"]
+        ]
 
     def _perform_task(self):
+        data = self.dataset.data.data
+        if data.ndim == 1:
+            self._traces = np.array(data[np.newaxis], dtype=float)
+        else:
+            self._traces = np.array(
+                np.moveaxis(data, self.parameters["axis"], -1), dtype=float
+            )
+        number_of_traces = len(self._traces)
+        self._left_vectors = [None] * number_of_traces
+        self._singular_values = [None] * number_of_traces
+        self._right_vectors = [None] * number_of_traces
+        self._rank = np.zeros(number_of_traces, dtype=int)
+        self._trend = np.zeros_like(self._traces)
+        self._points_for_detrending = np.full(number_of_traces, 11)
+        traces = list(range(number_of_traces))
         self._create_matrix()
-        self._perform_svd()
-        self._determine_rank()
-        self._detrend()
-        self._reconstruct_matrix()
-        self._average_matrix()
+        self._perform_svd(traces)
+        self._determine_rank(traces)
+        self._detrend(traces)
+        for trace in traces:
+            self._traces[trace] = (
+                self._average_matrix(self._reconstruct_matrix(trace))
+                + self._trend[trace]
+            )
+        if data.ndim == 1:
+            self.parameters["rank"] = int(self._rank[0])
+            self.dataset.data.data = self._traces[0]
+        else:
+            self.parameters["rank"] = self._rank.tolist()
+            self.dataset.data.data = np.moveaxis(
+                self._traces, -1, self.parameters["axis"]
+            )
 
     def _create_matrix(self):
-        extended_vector = np.hstack(
-            (
-                self.dataset.data.data,
-                self.dataset.data.data[: self._n_rows - 1],
-            )
+        extended_traces = np.hstack(
+            (self._traces, self._traces[:, : self._n_rows - 1])
+        )
+        shape = (len(self._traces), self._n_rows, self._traces.shape[1])
+        strides = (
+            extended_traces.strides[0],
+            extended_traces.strides[1],
+            extended_traces.strides[1],
         )
-        shape = (self._n_rows, self.dataset.data.data.size)
-        strides = (extended_vector.strides[0], extended_vector.strides[0])
         self._matrix = np.lib.stride_tricks.as_strided(
-            extended_vector, shape, strides
+            extended_traces, shape, strides
         )
 
-    def _perform_svd(self):
-        self._U, self._s, self._Vh = np.linalg.svd(self._matrix)
+    def _perform_svd(self, traces):
+        if self.parameters["solver"] == "randomised":
+            for trace in traces:
+                self._perform_randomised_svd(trace, self._window)
+        else:
+            # Decompose in batches of traces to limit memory used
+            batch_size = max(1, self._batch_size // self._matrix[0].size)
+            for start in range(0, len(traces), batch_size):
+                batch = traces[start : start + batch_size]
+                left_vectors, singular_values, right_vectors = np.linalg.svd(
+                    self._matrix[batch], full_matrices=False
+                )
+                for index, trace in enumerate(batch):
+                    self._left_vectors[trace] = left_vectors[index]
+                    self._singular_values[trace] = singular_values[index]
+                    self._right_vectors[trace] = right_vectors[index]
 
-    def _determine_rank(self):
-        while True:
-            left_singular_vectors = self._U[
-                :, self.parameters["rank"] : self.parameters["rank"] + 10
-            ]
-            normalised_mean_total_variation = np.mean(
-                np.abs(np.diff(left_singular_vectors, axis=0)), axis=0
-            ) / (
-                np.amax(left_singular_vectors, axis=0)
-                - np.amin(left_singular_vectors, axis=0)
-            )
-            try:
-                self.parameters["rank"] += np.argwhere(
-                    normalised_mean_total_variation
-                    > self.parameters["noise_threshold"]
-                )[0, 0]
-                break
-            except IndexError:
-                self.parameters["rank"] += 10
-
-    def _detrend(self):
-        self._trend = np.zeros_like(self.dataset.data.data)
-        while self._needs_detrending():
-            self._points_for_detrending -= 2
-            self._trend = np.linspace(
-                0,
-                self.dataset.data.data[-self._points_for_detrending :].mean()
-                - self.dataset.data.data[
-                    : self._points_for_detrending
-                ].mean(),
-                self.dataset.data.data.size,
+    def _perform_randomised_svd(self, trace, number_of_components):
+        """Compute the leading singular values and vectors of a trace.
+
+        Previously computed right singular vectors are used as starting
+        point, as they usually span the range of the matrix changed by
+        detrending very well. Hence, fewer power iterations are necessary.
+
+        For the algorithm, see N. Halko, P. G. Martinsson, J. A. Tropp:
+        SIAM Review 53, 217 (2011).
+        """
+        size = min(number_of_components + self._oversampling, self._n_rows)
+        if self._right_vectors[trace] is None:
+            start = np.empty((self._traces.shape[1], 0))
+            power_iterations = self._power_iterations[0]
+        else:
+            start = self._right_vectors[trace][:size].T
+            power_iterations = self._power_iterations[1]
+        start = np.hstack(
+            (
+                start,
+                np.random.default_rng(0).standard_normal(
+                    (self._traces.shape[1], size - start.shape[1])
+                ),
             )
-            self.dataset.data.data -= self._trend
-            self._create_matrix()
-            self._perform_svd()
-            self._determine_rank()
+        )
+        spectrum = np.fft.rfft(self._traces[trace])
+        basis = np.linalg.qr(self._multiply(spectrum, start))[0]
+        for _ in range(power_iterations):
+            basis = np.linalg.qr(self._multiply(spectrum, basis, True))[0]
+            basis = np.linalg.qr(self._multiply(spectrum, basis))[0]
+        (
+            left_vectors,
+            self._singular_values[trace],
+            self._right_vectors[trace],
+        ) = np.linalg.svd(
+            self._multiply(spectrum, basis, True).T, full_matrices=False
+        )
+        self._left_vectors[trace] = basis @ left_vectors
+
+    def _multiply(self, spectrum, vectors, transposed=False):
+        """Multiply partial circulant matrix of a trace with vectors.
 
-    def _needs_detrending(self):
-        noise_stddev = np.sqrt(
-            np.sum(self._s[self.parameters["rank"] :] ** 2)
-            / self.dataset.data.data.size
+        As each row of the matrix is the trace shifted by one, the product
+        is the circular cross-correlation of the trace and the vectors,
+        calculated using the Fourier transform of the trace (spectrum).
+        """
+        size = len(self._traces[0])
+        product = np.fft.irfft(
+            spectrum[:, np.newaxis]
+            * np.conj(np.fft.rfft(vectors, n=size, axis=0)),
+            n=size,
+            axis=0,
         )
-        gap = np.abs(
-            self.dataset.data.data[-self._points_for_detrending :].mean()
-            - self.dataset.data.data[: self._points_for_detrending].mean()
+        if not transposed:
+            product = product[: self._n_rows]
+        return product
+
+    def _number_of_components(self, trace):
+        """Return number of accurately determined singular components."""
+        number_of_components = len(self._singular_values[trace])
+        if number_of_components < self._n_rows:
+            number_of_components -= self._oversampling
+        return number_of_components
+
+    def _determine_rank(self, traces):
+        for trace in traces:
+            rank = 0
+            while True:
+                number_of_components = self._number_of_components(trace)
+                left_singular_vectors = self._left_vectors[trace][
+                    :, rank : min(rank + self._window, number_of_components)
+                ]
+                normalised_mean_total_variation = np.mean(
+                    np.abs(np.diff(left_singular_vectors, axis=0)), axis=0
+                ) / (
+                    np.amax(left_singular_vectors, axis=0)
+                    - np.amin(left_singular_vectors, axis=0)
+                )
+                try:
+                    rank += np.argwhere(
+                        normalised_mean_total_variation
+                        > self.parameters["noise_threshold"]
+                    )[0, 0]
+                    break
+                except IndexError:
+                    if number_of_components == self._n_rows:
+                        if rank + self._window >= number_of_components:
+                            rank = number_of_components
+                            break
+                    elif rank + self._window > number_of_components:
+                        self._perform_randomised_svd(
+                            trace, 2 * number_of_components
+                        )
+                        continue
+                    rank += self._window
+            self._rank[trace] = rank
+
+    def _detrend(self, traces):
+        traces = [trace for trace in traces if self._needs_detrending(trace)]
+        while traces:
+            for trace in traces:
+                self._points_for_detrending[trace] -= 2
+                points = self._points_for_detrending[trace]
+                data = self._traces[trace]
+                trend = np.linspace(
+                    0,
+                    data[-points:].mean() - data[:points].mean(),
+                    data.size,
+                )
+                data -= trend
+                self._trend[trace] += trend
+            self._create_matrix()
+            self._perform_svd(traces)
+            self._determine_rank(traces)
+            traces = [
+                trace for trace in traces if self._needs_detrending(trace)
+            ]
+
+    def _needs_detrending(self, trace):
+        # Norm of the noise components from the Frobenius norm of the
+        # matrix, hence not requiring all singular values
+        data = self._traces[trace]
+        noise_power = self._n_rows * np.sum(data**2) - np.sum(
+            self._singular_values[trace][: self._rank[trace]] ** 2
         )
+        noise_stddev = np.sqrt(max(noise_power, 0) / data.size)
+        points = self._points_for_detrending[trace]
+        gap = np.abs(data[-points:].mean() - data[:points].mean())
         return gap > noise_stddev
 
-    def _reconstruct_matrix(self):
-        self._matrix = (
-            self._U[:, : self.parameters["rank"]]
-            @ np.diag(self._s[: self.parameters["rank"]])
-            @ self._Vh[: self.parameters["rank"]]
+    def _reconstruct_matrix(self, trace):
+        rank = self._rank[trace]
+        left_vectors = self._left_vectors[trace][:, :rank]
+        right_vectors = self._right_vectors[trace][:rank]
+        return (
+            left_vectors * self._singular_values[trace][:rank] @ right_vectors
         )
 
-    def _average_matrix(self):
-        extended_matrix = np.hstack(
-            (self._matrix[:, -self._n_rows + 1 :], self._matrix)
-        )
+    def _average_matrix(self, matrix):
+        extended_matrix = np.hstack((matrix[:, -self._n_rows + 1 :], matrix))
         strides = (
             extended_matrix.strides[0] - extended_matrix.strides[1],
             extended_matrix.strides[1],
         )
-        self.dataset.data.data = np.mean(
+        return np.mean(
             np.lib.stride_tricks.as_strided(
                 extended_matrix[:, self._n_rows - 1 :],
-                self._matrix.shape,
+                matrix.shape,
                 strides,
             ),
             axis=0,
         )
-        self.dataset.data.data += self._trend
+
+
+def _create_array(shape, dtype=None, memory_mapped=False):
+    # Arrays larger than the available memory are mapped to a temporary file
+    if not memory_mapped or not np.prod(shape):
+        return np.empty(shape, dtype=dtype)
+    file_descriptor, filename = tempfile.mkstemp(
+        prefix="aspecd-", suffix=".dat"
+    )
+    os.close(file_descriptor)
+    return np.memmap(filename, dtype=dtype, mode="w+", shape=tuple(shape))
+
+
+def _finalise_array(array):
+    # Map temporary files copy-on-write, thus allowing to share the array
+    # with copies of the dataset, and remove them once no longer mapped.
+    if not isinstance(array, np.memmap):
+        return array
+    array.flush()
+    result = np.memmap(
+        array.filename, dtype=array.dtype, mode="c", shape=array.shape
+    )
+    weakref.finalize(result.base, _remove_file, array.filename)
+    return result
+
+
+def _remove_file(filename):
+    # Files still mapped by remapped copies cannot be removed on Windows
+    with contextlib.suppress(OSError):
+        os.remove(filename)
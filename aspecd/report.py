@@ -225,13 +225,15 @@ import subprocess  # nosec
 import tempfile
 from datetime import datetime
 
+# Not imported lazily, as classes derive from jinja2.Environment
 import jinja2
-import pkg_resources
 
 import aspecd.exceptions
 import aspecd.system
 import aspecd.utils
 
+pkg_resources = aspecd.utils.LazyModule("pkg_resources")
+
 
 class Reporter(aspecd.utils.ToDictMixin):
     """Base class for reports.
@@ -11,16 +11,40 @@ user currently logged in. Therefore, this is a relevant aspect for personal
 data protection, and each and every user of the system should be made
 available of this fact.
 
+
+Caching system information
+==========================
+
+Collecting the information on the system, particularly the versions of all
+packages required, is fairly time-consuming. As each history record
+contains system information, and the system does not change while
+processing data, the information is collected only once per package and
+process. Hence, all :obj:`aspecd.system.SystemInfo` objects for the same
+package share the same dictionaries, and you should consider these as
+read-only. If you need to collect the information anew, *e.g.* after
+having installed a package at runtime, call :func:`clear_cache`.
+
+When persisting datasets or histories of recipes, identical system
+information is stored only once, with all further records referring to it
+(see :func:`intern_system_info`).
+
+
+.. versionchanged:: 0.12
+    System information is cached per package and process
+
 """
 
 import getpass
 import platform
 import sys
 
-import pkg_resources
-
 import aspecd.utils
 
+pkg_resources = aspecd.utils.LazyModule("pkg_resources")
+
+# Process-wide cache of system information, the keys being package names
+_SYSTEM_INFO = {}
+
 
 class SystemInfo(aspecd.utils.ToDictMixin):
     """
@@ -47,27 +71,45 @@ class SystemInfo(aspecd.utils.ToDictMixin):
         framework to store their version number in the SystemInfo class and
         hence in the history records. Prerequisite for reproducibility.
 
+
+    .. versionchanged:: 0.12
+        Information is collected once per package and process and shared
+        between objects
+
     """
 
     def __init__(self, package=""):
         super().__init__()
         self.python = {}
         self.packages = {}
-        self.platform = platform.platform()
+        self.platform = ""
         self.user = {}
         # Set some properties of dicts
         self._set_values(package)
 
     def _set_values(self, package):
-        self.python["version"] = sys.version
-        self.packages["aspecd"] = aspecd.utils.get_aspecd_version()
-        self._add_requirements_to_packages(package="aspecd")
-        if package and package != "aspecd":
-            self.packages[package] = aspecd.utils.package_version(package)
-            self._add_requirements_to_packages(package=package)
-        self.user["login"] = getpass.getuser()
-
-    def _add_requirements_to_packages(self, package="aspecd"):
+        if package == "aspecd":
+            package = ""
+        if package not in _SYSTEM_INFO:
+            _SYSTEM_INFO[package] = self._collect_values(package)
+        for key, value in _SYSTEM_INFO[package].items():
+            setattr(self, key, value)
+
+    def _collect_values(self, package):
+        packages = {"aspecd": aspecd.utils.get_aspecd_version()}
+        self._add_requirements_to_packages(packages, package="aspecd")
+        if package:
+            packages[package] = aspecd.utils.package_version(package)
+            self._add_requirements_to_packages(packages, package=package)
+        return {
+            "python": {"version": sys.version},
+            "packages": packages,
+            "platform": platform.platform(),
+            "user": {"login": getpass.getuser()},
+        }
+
+    @staticmethod
+    def _add_requirements_to_packages(packages, package="aspecd"):
         requirements = [
             requirement.name
             for requirement in pkg_resources.get_distribution(
@@ -75,7 +117,7 @@ class SystemInfo(aspecd.utils.ToDictMixin):
             ).requires()
         ]
         for requirement in requirements:
-            self.packages[requirement] = pkg_resources.get_distribution(
+            packages[requirement] = pkg_resources.get_distribution(
                 requirement
             ).version
 
@@ -86,6 +128,9 @@ class SystemInfo(aspecd.utils.ToDictMixin):
         Only parameters in the dictionary that are valid properties of the
         class are set accordingly.
 
+        Dictionaries are updated in copies, as they are shared with other
+        objects (see :mod:`aspecd.system` for details).
+
         Parameters
         ----------
         dict_ : :class:`dict`
@@ -95,7 +140,75 @@ class SystemInfo(aspecd.utils.ToDictMixin):
         for key, value in dict_.items():
             if hasattr(self, key):
                 if isinstance(value, dict):
-                    for sub_key, sub_value in value.items():
-                        getattr(self, key)[sub_key] = sub_value
+                    attribute = dict(getattr(self, key))
+                    attribute.update(value)
+                    setattr(self, key, attribute)
                 else:
                     setattr(self, key, value)
+
+
+def clear_cache():
+    """
+    Clear the process-wide cache of system information.
+
+    System information is collected only once per package and process,
+    and all :obj:`aspecd.system.SystemInfo` objects created afterwards
+    share the same dictionaries. Clearing the cache results in collecting
+    the information anew upon creating the next object.
+
+    .. versionadded:: 0.12
+
+    """
+    _SYSTEM_INFO.clear()
+
+
+def intern_system_info(dict_=None, keys=("sysinfo", "system_info")):
+    """
+    Let identical system information in a dictionary refer to one object.
+
+    Each history record of a dataset contains the system information,
+    and usually, these are identical for most if not all records. Replacing
+    identical dictionaries by references to a single dictionary results in
+    YAML files (and ASDF files) where the system information is stored
+    only once (as YAML anchor), and all other records refer to it (as YAML
+    alias). Reading such files results in dictionaries referring to the
+    same object as well.
+
+    Parameters
+    ----------
+    dict_ : :class:`dict`
+        Dictionary, *e.g.* obtained from :meth:`aspecd.dataset.Dataset.to_dict`
+
+        Gets changed in place.
+
+    keys : :class:`tuple`
+        Keys of the dictionaries containing system information
+
+        Default: ("sysinfo", "system_info")
+
+    Returns
+    -------
+    dict_ : :class:`dict`
+        Dictionary with identical system information referring to one object
+
+
+    .. versionadded:: 0.12
+
+    """
+    _intern_system_info(dict_, keys=keys, system_infos=[])
+    return dict_
+
+
+def _intern_system_info(value, keys=(), system_infos=None):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in keys and isinstance(item, dict):
+                if item in system_infos:
+                    value[key] = system_infos[system_infos.index(item)]
+                else:
+                    system_infos.append(item)
+            else:
+                _intern_system_info(item, keys, system_infos)
+    elif isinstance(value, list):
+        for item in value:
+            _intern_system_info(item, keys, system_infos)
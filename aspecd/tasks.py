@@ -544,6 +544,26 @@ important settings are described below:
   analysis irreproducible and therefore mostly useless. Hence,
   use *only* for debugging purposes.
 
+* ``import_workers``
+
+  Number of datasets imported concurrently. Importing datasets is usually
+  limited by reading files rather than by computation, particularly with
+  datasets residing on network storage. Hence, setting this to a value
+  larger than one can considerably speed up loading recipes with many
+  datasets. The order of the datasets is retained in any case.
+
+  .. versionadded:: 0.12
+
+* ``plot_workers``
+
+  Number of figures of singleplot tasks created and saved concurrently.
+  Creating and saving a figure for each of many datasets usually takes
+  much longer than processing them. Hence, setting this to a value larger
+  than one can considerably speed up recipes plotting many datasets
+  individually. For details, see :class:`aspecd.tasks.SingleplotTask`.
+
+  .. versionadded:: 0.12
+
 * ``colors``
 
   Settings for colors.
@@ -642,7 +662,7 @@ Its output will look similar to the following:
 
 .. code-block:: none
 
-    usage: serve [-h] [-v | -q] recipe
+    usage: serve [-h] [-v | -q] [--jobs N] recipe
 
     Process a recipe in context of recipe-driven data analysis
 
@@ -653,6 +673,7 @@ Its output will look similar to the following:
       -h, --help     show this help message and exit
       -v, --verbose  show debug output
       -q, --quiet    don't show any output
+      --jobs N       number of tasks to perform in parallel
 
 
 Of course, you can do the same from within Python (however, why would you
@@ -671,6 +692,30 @@ directive within the recipe. And of course, calling the recipe from the
 command-line will only help you if it creates some kind of output.
 
 
+Cooking recipes in parallel
+---------------------------
+
+Recipes containing lots of datasets may take quite a while to be cooked,
+as tasks are performed one after the other. However, tasks frequently
+operate on entirely different datasets and hence do not depend on each
+other. Therefore, you can tell ``serve`` to perform independent tasks in
+parallel, using up to the given number of processes:
+
+.. code-block:: bash
+
+    serve --jobs 4 <my-recipe>.yaml
+
+Which tasks depend on each other is derived from the datasets a task is
+applied to (``apply_to``), the labels of results and figures it creates
+(``result``, ``label``), and the labels it refers to in its properties.
+Processing, analysis, model, and export tasks are performed in separate
+processes, all other tasks (such as plotting and reports) in the main
+process, after all tasks preceding them in the recipe have been performed.
+The history of the cooked recipe is the same as if the tasks had been
+performed one after the other. For details, see the documentation of the
+:class:`aspecd.tasks.Chef` class.
+
+
 History of a recipe
 ===================
 
@@ -980,16 +1025,16 @@ Module documentation
 
 import argparse
 import collections
+import concurrent.futures
 import copy
 import datetime
 import logging
 import os
 import re
 import sys
+import time
 import warnings
 
-import matplotlib.pyplot as plt
-
 import aspecd.dataset
 import aspecd.exceptions
 import aspecd.io
@@ -997,6 +1042,8 @@ import aspecd.plotting
 import aspecd.system
 import aspecd.utils
 
+plt = aspecd.utils.LazyModule("matplotlib.pyplot")
+
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
@@ -1052,6 +1099,15 @@ class Recipe:
 
         The keys are the dataset ids.
 
+    import_times : :class:`collections.OrderedDict`
+        Ordered dictionary of the times needed for importing the datasets
+
+        The keys are the dataset ids, the values the import times in
+        seconds. Useful for finding out which datasets slow down loading
+        a recipe.
+
+        .. versionadded:: 0.12
+
     tasks : :class:`list`
         List of tasks to be performed on the datasets
 
@@ -1205,6 +1261,29 @@ class Recipe:
 
            .. versionadded:: 0.4
 
+        import_workers: :class:`int`
+           Number of datasets imported concurrently.
+
+           Importing datasets is usually limited by reading files, hence
+           importing them in a pool of threads can considerably speed up
+           loading recipes with many datasets. The order of the datasets
+           in :attr:`datasets` is retained.
+
+           Default: 1
+
+           .. versionadded:: 0.12
+
+        plot_workers: :class:`int`
+           Number of figures of singleplot tasks created concurrently.
+
+           Creating and saving figures of singleplot tasks applied to
+           many datasets in a pool of processes can considerably speed up
+           recipes. See :class:`aspecd.tasks.SingleplotTask` for details.
+
+           Default: 1
+
+           .. versionadded:: 0.12
+
         .. versionchanged:: 0.4
             Moved properties to keys in this dictionary
 
@@ -1268,6 +1347,7 @@ class Recipe:
         super().__init__()
         self.datasets = collections.OrderedDict()
         self.dataset_parameters = collections.OrderedDict()
+        self.import_times = collections.OrderedDict()
         self.results = collections.OrderedDict()
         self.figures = collections.OrderedDict()
         self.plotters = collections.OrderedDict()
@@ -1287,6 +1367,8 @@ class Recipe:
             "autosave_plots": True,
             "autosave_datasets": True,
             "write_history": True,
+            "import_workers": 1,
+            "plot_workers": 1,
         }
         self.directories = {
             "output": "",
@@ -1336,8 +1418,7 @@ class Recipe:
             )
             self.dataset_factory = self._get_dataset_factory(package=package)
         if "datasets" in dict_:
-            for key in dict_["datasets"]:
-                self._append_dataset(key)
+            self._append_datasets(dict_["datasets"])
         if "tasks" in dict_:
             for key in dict_["tasks"]:
                 self._append_task(key)
@@ -1346,7 +1427,30 @@ class Recipe:
     def _get_absolute_path(path_=""):
         return os.path.join(os.path.abspath(os.path.curdir), path_)
 
-    def _append_dataset(self, key):
+    def _append_datasets(self, keys):
+        imports = [self._dataset_import(key) for key in keys]
+        workers = self.settings["import_workers"]
+        if workers and workers > 1 and len(imports) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._import_dataset, import_, detach=True
+                    )
+                    for _, import_ in imports
+                ]
+                datasets = [future.result() for future in futures]
+        else:
+            datasets = [
+                self._import_dataset(import_) for _, import_ in imports
+            ]
+        for (label, _), (dataset, duration) in zip(imports, datasets):
+            logger.debug('Imported dataset "%s" in %.3f s', label, duration)
+            self.datasets[label] = dataset
+            self.import_times[label] = duration
+
+    def _dataset_import(self, key):
         properties = {}
         importer = None
         importer_parameters = None
@@ -1370,26 +1474,38 @@ class Recipe:
         if self.directories["datasets_source"]:
             source = os.path.join(self.directories["datasets_source"], source)
         logger.info('Import dataset "%s" as "%s"', source, label)
+        return label, {
+            "source": source,
+            "importer": importer,
+            "importer_parameters": importer_parameters,
+            "properties": properties,
+        }
+
+    def _import_dataset(self, import_, detach=False):
+        start = time.perf_counter()
+        properties = import_["properties"]
         if "package" in properties:
             dataset_factory = self._get_dataset_factory(
                 package=properties["package"]
             )
-            # noinspection PyUnresolvedReferences
-            dataset = dataset_factory.get_dataset(
-                source=source,
-                importer=importer,
-                parameters=importer_parameters,
-            )
         else:
-            dataset = self.dataset_factory.get_dataset(
-                source=source,
-                importer=importer,
-                parameters=importer_parameters,
-            )
+            dataset_factory = self.dataset_factory
+            if detach:
+                # Importer factories keep the source they were called for
+                dataset_factory = copy.copy(dataset_factory)
+                dataset_factory.importer_factory = copy.copy(
+                    dataset_factory.importer_factory
+                )
+        # noinspection PyUnresolvedReferences
+        dataset = dataset_factory.get_dataset(
+            source=import_["source"],
+            importer=import_["importer"],
+            parameters=import_["importer_parameters"],
+        )
         for property_key, value in properties.items():
             if hasattr(dataset, property_key):
                 setattr(dataset, property_key, value)
-        self.datasets[label] = dataset
+        return dataset, time.perf_counter() - start
 
     @staticmethod
     def _get_dataset_factory(package=""):
@@ -1754,6 +1870,22 @@ class Chef:
     themselves, therefore allowing a full turnover, as well as easy
     modification of a recipe.
 
+    Tasks operating on different datasets do not depend on each other and
+    can hence be performed in parallel. Setting :attr:`jobs` to a value
+    larger than one lets the chef derive the dependencies of the tasks from
+    the datasets they are applied to, the results and figures they create,
+    and the labels they refer to in their properties. Independent
+    processing, analysis, model, and export tasks are performed in a pool
+    of up to :attr:`jobs` processes. All other tasks, such as plotting and
+    reports, are performed in the main process after all tasks preceding
+    them in the recipe have been performed. Regardless of the order the
+    tasks have actually been performed in, the history contains them in the
+    order of the recipe::
+
+        chef = aspecd.tasks.Chef()
+        chef.jobs = 4
+        chef.cook(recipe)
+
     Attributes
     ----------
     recipe : :class:`aspecd.tasks.Recipe`
@@ -1769,6 +1901,14 @@ class Chef:
 
         Can be exported to a YAML file that works as a recipe.
 
+    jobs : :class:`int`
+        Maximum number of tasks performed in parallel
+
+        If larger than one, independent tasks are performed in a pool of
+        processes.
+
+        Default: 1
+
     Parameters
     ----------
     recipe : :class:`aspecd.tasks.Recipe`
@@ -1779,11 +1919,16 @@ class Chef:
     aspecd.tasks.MissingRecipeError
         Raised if no recipe is available to be cooked
 
+
+    .. versionchanged:: 0.12
+        New attribute :attr:`jobs` for performing tasks in parallel
+
     """
 
     def __init__(self, recipe=None):
         self.history = collections.OrderedDict()
         self.recipe = recipe
+        self.jobs = 1
         self._timespec = "seconds"  # Format used for time stamps
 
     def cook(self, recipe=None):
@@ -1808,24 +1953,224 @@ class Chef:
         .. versionchanged:: 0.10
             All open figures are closed after cooking the recipe.
 
+        .. versionchanged:: 0.12
+            Independent tasks are performed in parallel if :attr:`jobs` is
+            larger than one.
+
         """
         self._assign_recipe(recipe)
         self._prepare_history()
-        for task in self.recipe.tasks:
-            if task.skip:
-                logger.info('Skipping task "%s"', task.type)
-            else:
-                task.perform()
-                task_history = task.to_dict()
-                if isinstance(task_history, list):
-                    self.history["tasks"].extend(task_history)
+        if self.jobs > 1:
+            self._cook_in_parallel()
+        else:
+            for task in self.recipe.tasks:
+                if task.skip:
+                    logger.info('Skipping task "%s"', task.type)
                 else:
-                    self.history["tasks"].append(task_history)
+                    task.perform()
+                    self._add_to_history(task.to_dict())
         self.history["info"]["end"] = datetime.datetime.now().isoformat(
             timespec=self._timespec
         )
         self._close_figures()
 
+    def _add_to_history(self, task_history):
+        if isinstance(task_history, list):
+            self.history["tasks"].extend(task_history)
+        else:
+            self.history["tasks"].append(task_history)
+
+    def _cook_in_parallel(self):
+        tasks = []
+        for task in self.recipe.tasks:
+            if task.skip:
+                logger.info('Skipping task "%s"', task.type)
+            else:
+                tasks.append(task)
+        in_process = self._tasks_in_process(tasks)
+        dependencies = self._task_dependencies(tasks, in_process)
+        histories = {}
+        # Keys of the results created by each task, and existing before
+        results = {-1: list(self.recipe.results)}
+        futures = {}
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.jobs
+        ) as executor:
+            try:
+                while len(histories) < len(tasks):
+                    for index, task in enumerate(tasks):
+                        if (
+                            index in histories
+                            or index in futures.values()
+                            or not dependencies[index] <= histories.keys()
+                        ):
+                            continue
+                        if in_process[index]:
+                            keys = list(self.recipe.results)
+                            task.perform()
+                            histories[index] = task.to_dict()
+                            results[index] = [
+                                key
+                                for key in self.recipe.results
+                                if key not in keys
+                            ]
+                            break
+                        future = executor.submit(
+                            _perform_task, *self._detach_task(task)
+                        )
+                        futures[future] = index
+                    else:
+                        done, _ = concurrent.futures.wait(
+                            futures,
+                            return_when=concurrent.futures.FIRST_COMPLETED,
+                        )
+                        for future in done:
+                            index = futures.pop(future)
+                            histories[index], results[index] = (
+                                self._update_recipe(*future.result())
+                            )
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        for index in range(len(tasks)):
+            self._add_to_history(histories[index])
+        self._sort_results(
+            [results[index] for index in range(-1, len(tasks))]
+        )
+
+    def _update_recipe(self, history, datasets, results):
+        """Update recipe from a task performed in a separate process."""
+        self.recipe.datasets.update(datasets)
+        self.recipe.results.update(results)
+        return history, list(results)
+
+    def _sort_results(self, keys_of_tasks):
+        """Sort results in the order of the tasks creating them."""
+        keys = []
+        for keys_of_task in keys_of_tasks:
+            keys.extend(key for key in keys_of_task if key not in keys)
+        for key in keys:
+            self.recipe.results.move_to_end(key)
+
+    def _task_dependencies(self, tasks, in_process):
+        """
+        Return the indices of the tasks each task depends upon.
+
+        A task depends on a preceding task if one of them writes to a
+        dataset, result, or figure the other one reads from or writes to.
+        Tasks performed in the main process depend on all preceding tasks.
+
+        """
+        writes = [self._task_writes(task) for task in tasks]
+        labels = set(self.recipe.datasets.keys()).union(*writes)
+        reads = [self._task_reads(task, labels) for task in tasks]
+        dependencies = []
+        for index in range(len(tasks)):
+            if in_process[index]:
+                dependencies.append(set(range(index)))
+                continue
+            dependencies.append(
+                {
+                    previous
+                    for previous in range(index)
+                    if writes[previous] & (reads[index] | writes[index])
+                    or reads[previous] & writes[index]
+                }
+            )
+        return dependencies
+
+    def _task_writes(self, task):
+        labels = set(self._task_apply_to(task))
+        for attribute in ("result", "label"):
+            value = getattr(task, attribute, "")
+            if isinstance(value, list):
+                labels.update(value)
+            elif value:
+                labels.add(value)
+        return labels
+
+    def _task_reads(self, task, labels):
+        references = set(self._task_apply_to(task))
+        for key, value in task.__dict__.items():
+            if not key.startswith("_") and key != "recipe":
+                references.update(self._strings_in(value))
+        return references & labels
+
+    def _task_apply_to(self, task):
+        if task.apply_to:
+            if isinstance(task.apply_to, list):
+                return task.apply_to
+            return [task.apply_to]
+        return list(self.recipe.datasets.keys())
+
+    def _strings_in(self, value):
+        if isinstance(value, str):
+            if "{{" in value:
+                return set(re.findall(r"[\w.-]+", value))
+            return {value}
+        if isinstance(value, dict):
+            values = list(value.keys()) + list(value.values())
+        elif isinstance(value, (list, tuple)):
+            values = value
+        else:
+            return set()
+        return set().union(*(self._strings_in(item) for item in values))
+
+    def _tasks_in_process(self, tasks):
+        """
+        Return for each task whether it needs to be performed in process.
+
+        Only tasks operating on datasets and results exclusively can be
+        performed in a separate process. Figures and plotters depend on the
+        state of the main process.
+
+        """
+        main_labels = set()
+        in_process = []
+        for task in tasks:
+            if isinstance(task, _PARALLEL_TASKS) and not (
+                self._task_reads(task, main_labels)
+            ):
+                in_process.append(False)
+            else:
+                in_process.append(True)
+                main_labels |= self._task_writes(task) - set(
+                    self.recipe.datasets.keys()
+                )
+        return in_process
+
+    def _detach_task(self, task):
+        """
+        Return copy of task with a recipe containing only what it refers to.
+
+        Only the datasets and results the task reads from or writes to get
+        transferred to the process performing the task.
+
+        """
+        labels = set(self.recipe.datasets.keys()) | set(
+            self.recipe.results.keys()
+        )
+        references = self._task_reads(task, labels)
+        recipe = copy.copy(self.recipe)
+        recipe.datasets = collections.OrderedDict(
+            (key, value)
+            for key, value in self.recipe.datasets.items()
+            if key in references
+        )
+        recipe.results = collections.OrderedDict(
+            (key, value)
+            for key, value in self.recipe.results.items()
+            if key in references
+        )
+        recipe.figures = collections.OrderedDict()
+        recipe.plotters = collections.OrderedDict()
+        recipe.plotannotations = {}
+        recipe.tasks = []
+        task = copy.copy(task)
+        task.recipe = recipe
+        return task, self._task_writes(task)
+
     def _assign_recipe(self, recipe):
         if not recipe:
             if not self.recipe:
@@ -2279,11 +2624,20 @@ class Task(aspecd.utils.ToDictMixin):
         prefix them in a recipe and therefore greatly enhances the user
         experience.
 
+        Classes are resolved using :func:`aspecd.utils.class_from_name`,
+        hence both, classes found and class names not found in a package,
+        are memoised, and classes registered using
+        :func:`aspecd.utils.register_class` are taken into account.
+
         Returns
         -------
         obj : `object`
             Object of a class defined in the :attr:`type` attribute of a task
 
+
+        .. versionchanged:: 0.12
+            Classes (not) found are memoised
+
         """
         if "." in self.kind:
             package_name, self.kind = self.kind.split(".")
@@ -3311,6 +3665,16 @@ class PlotTask(Task):
             Plot whose figure should be saved
 
         """
+        filename = self._get_filename(plot)
+        if filename:
+            saver = aspecd.plotting.Saver(filename=filename)
+            logger.info(
+                'Save figure from "%s" to file "%s"', self.type, filename
+            )
+            plot.save(saver)
+        return filename
+
+    def _get_filename(self, plot):
         filename = None
         if plot.filename:
             filename = plot.filename
@@ -3324,11 +3688,6 @@ class PlotTask(Task):
                     self.recipe.directories["output"], filename
                 )
             self.properties["filename"] = filename
-            saver = aspecd.plotting.Saver(filename=filename)
-            logger.info(
-                'Save figure from "%s" to file "%s"', self.type, filename
-            )
-            plot.save(saver)
         return filename
 
     def set_colormap(self):
@@ -3523,6 +3882,22 @@ class SingleplotTask(PlotTask):
     saving the plots, include the ``autosave_plots`` directive in the
     ``settings`` dict of your recipe and set it to False.
 
+    Creating and saving the figures for many datasets can take much longer
+    than processing the datasets. Hence, if ``plot_workers`` in the
+    settings of the recipe is larger than one, the figures are created and
+    saved in a pool of processes, using a non-interactive backend. Only the
+    plotter and the data, axes, and metadata of the dataset are passed to
+    the processes. Records of the figures and the history of the datasets
+    are the same as if the figures were created one after the other. As the
+    figures are closed after saving them, they are created one after the
+    other if the plotters are referred to by a ``result`` or the task has a
+    ``target``.
+
+
+    .. versionchanged:: 0.12
+        Figures are created and saved in parallel if ``plot_workers`` in
+        the recipe settings is larger than one
+
     """
 
     def _add_figure_to_recipe(self, label=""):
@@ -3542,44 +3917,123 @@ class SingleplotTask(PlotTask):
             and len(self.apply_to) == len(self.properties["filename"])
         ):
             filenames = self.properties["filename"]
-        autosave_filename = False
         self._set_figure_label()
+        workers = self.recipe.settings["plot_workers"]
+        if (
+            workers
+            and workers > 1
+            and len(self.apply_to) > 1
+            and not self.result
+            and not self.target
+        ):
+            save_filenames = self._plot_in_parallel(filenames, workers)
+        else:
+            autosave_filename = False
+            for number, dataset_id in enumerate(self.apply_to):
+                if autosave_filename:
+                    self.properties.pop("filename")
+                dataset = self.recipe.get_dataset(dataset_id)
+                autosave_filename = self._prepare_plotter(
+                    number, dataset, filenames
+                )
+                logger.info(
+                    'Perform "%s" on dataset "%s"', self.type, dataset_id
+                )
+                dataset.plot(plotter=self._task)
+                # noinspection PyTypeChecker
+                save_filename = self.save_plot(plot=self._task)
+                save_filenames.append(save_filename)
+                self._add_plotter_to_recipe(number)
+                self._add_figure_to_recipe(label=self.label[number])
+        if len(self.apply_to) > 1 and save_filenames and not self.result:
+            self._task.filename = save_filenames
+
+    def _prepare_plotter(self, number, dataset, filenames):
+        """Create plotter for the given dataset and return autosave flag."""
+        autosave_filename = False
+        self._task = self.get_object()
+        self._get_annotations()
+        self.set_colormap()
+        if self.label and not self._task.label:
+            self._task.label = self.label[number]
+        if self.target:
+            self._task.figure = self.recipe.plotters[self.target].figure
+            self._task.axes = self.recipe.plotters[self.target].axes
+        if filenames:
+            self._task.filename = filenames[number]
+        elif (
+            "filename" not in self.properties
+            and self.recipe.settings["autosave_plots"]
+        ):
+            dataset_basename = os.path.splitext(
+                os.path.split(dataset.id)[-1]
+            )[0]
+            # noinspection PyUnresolvedReferences
+            plotter_name = self._task.name.split(".")[-1]
+            self._task.filename = "".join(
+                [dataset_basename, "_", plotter_name, ".pdf"]
+            )
+            autosave_filename = True
+        return autosave_filename
+
+    def _plot_in_parallel(self, filenames, workers):
+        plots = self._prepare_plots(filenames)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _plot_dataset,
+                    plotter,
+                    _dataset_for_plotting(dataset),
+                    filename,
+                )
+                for _, dataset, plotter, filename in plots
+            ]
+            return [
+                self._collect_plot(number, plot, future)
+                for number, (plot, future) in enumerate(zip(plots, futures))
+            ]
+
+    def _prepare_plots(self, filenames):
+        """Create plotters for all datasets to be plotted in parallel."""
+        plots = []
+        autosave_filename = False
         for number, dataset_id in enumerate(self.apply_to):
             if autosave_filename:
                 self.properties.pop("filename")
             dataset = self.recipe.get_dataset(dataset_id)
-            self._task = self.get_object()
-            self._get_annotations()
-            self.set_colormap()
-            if self.label and not self._task.label:
-                self._task.label = self.label[number]
-            if self.target:
-                self._task.figure = self.recipe.plotters[self.target].figure
-                self._task.axes = self.recipe.plotters[self.target].axes
-            if filenames:
-                self._task.filename = filenames[number]
-            elif (
-                "filename" not in self.properties
-                and self.recipe.settings["autosave_plots"]
-            ):
-                dataset_basename = os.path.splitext(
-                    os.path.split(dataset.id)[-1]
-                )[0]
-                # noinspection PyUnresolvedReferences
-                plotter_name = self._task.name.split(".")[-1]
-                self._task.filename = "".join(
-                    [dataset_basename, "_", plotter_name, ".pdf"]
-                )
-                autosave_filename = True
-            logger.info('Perform "%s" on dataset "%s"', self.type, dataset_id)
-            dataset.plot(plotter=self._task)
+            autosave_filename = self._prepare_plotter(
+                number, dataset, filenames
+            )
             # noinspection PyTypeChecker
-            save_filename = self.save_plot(plot=self._task)
-            save_filenames.append(save_filename)
-            self._add_plotter_to_recipe(number)
-            self._add_figure_to_recipe(label=self.label[number])
-        if len(self.apply_to) > 1 and save_filenames and not self.result:
-            self._task.filename = save_filenames
+            plots.append(
+                (
+                    dataset_id,
+                    dataset,
+                    self._task,
+                    self._get_filename(self._task),
+                )
+            )
+        return plots
+
+    def _collect_plot(self, number, plot, future):
+        """Update plotter and recipe from a plot performed in parallel."""
+        dataset_id, dataset, plotter, filename = plot
+        logger.info('Perform "%s" on dataset "%s"', self.type, dataset_id)
+        parameters, properties, saved_filename = future.result()
+        plotter.parameters = parameters
+        plotter.properties = properties
+        plotter.dataset = dataset
+        dataset.append_plot_record(plotter.create_history_record())
+        if filename:
+            logger.info(
+                'Save figure from "%s" to file "%s"', self.type, filename
+            )
+            plotter.filename = saved_filename
+        self._task = plotter
+        self._add_figure_to_recipe(label=self.label[number])
+        return filename
 
     def _add_plotter_to_recipe(self, number=None):
         if self.result:
@@ -4871,6 +5325,78 @@ class FigureRecord(aspecd.utils.ToDictMixin):
             setattr(self, attribute, getattr(plotter, attribute))
 
 
+# Tasks that can be performed in a separate process by the Chef
+_PARALLEL_TASKS = (
+    ProcessingTask,
+    MultiprocessingTask,
+    AnalysisTask,
+    ModelTask,
+    ExportTask,
+)
+
+
+def _perform_task(task, labels):
+    """
+    Perform task in a separate process and return history and results.
+
+    Used by :class:`aspecd.tasks.Chef` for performing tasks in parallel.
+    Besides the history of the task, the datasets and results with the
+    given labels are returned, as these are the objects the task has
+    written to.
+
+    """
+    task.perform()
+    datasets = {
+        key: value
+        for key, value in task.recipe.datasets.items()
+        if key in labels
+    }
+    results = {
+        key: value
+        for key, value in task.recipe.results.items()
+        if key in labels
+    }
+    return task.to_dict(), datasets, results
+
+
+def _dataset_for_plotting(dataset):
+    """
+    Return copy of dataset containing only what is necessary for plotting.
+
+    Used by :class:`aspecd.tasks.SingleplotTask` for plotting datasets in
+    parallel, as only the data, axes, device data, and metadata of a
+    dataset need to be passed to the processes, but not its history and
+    other records.
+
+    """
+    dataset_for_plotting = type(dataset)()
+    dataset_for_plotting.data = dataset.data
+    # Plotters (including those of composite plotters) may use any device
+    dataset_for_plotting.device_data = dict(dataset.device_data)
+    dataset_for_plotting.metadata = dataset.metadata
+    dataset_for_plotting.id = dataset.id
+    dataset_for_plotting.label = dataset.label
+    return dataset_for_plotting
+
+
+def _plot_dataset(plotter, dataset, filename):
+    """
+    Plot dataset and save figure in a separate process.
+
+    Used by :class:`aspecd.tasks.SingleplotTask` for plotting datasets in
+    parallel. As the figure is closed after saving, only the parameters
+    and properties of the plotter, possibly set during plotting, and the
+    name of the file the figure has been saved to are returned.
+
+    """
+    plt.switch_backend("agg")
+    plotter.plot(dataset=dataset, from_dataset=True)
+    if filename:
+        plotter.save(aspecd.plotting.Saver(filename=filename))
+    plt.close(plotter.figure)
+    return plotter.parameters, plotter.properties, plotter.filename
+
+
 class ChefDeService:
     """
     Wrapper for serving the results of recipes given a recipe file name.
@@ -4904,15 +5430,27 @@ class ChefDeService:
     recipe_filename : :class:`str`
         Name of the recipe file to serve the cooked results for
 
+    jobs : :class:`int`
+        Maximum number of tasks performed in parallel
+
+        For details, see :attr:`aspecd.tasks.Chef.jobs`.
+
+        Default: 1
+
     Raises
     ------
     aspecd.tasks.MissingRecipeError
         Raised if no recipe filename is provided upon trying to serve
 
+
+    .. versionchanged:: 0.12
+        New attribute :attr:`jobs`
+
     """
 
     def __init__(self):
         self.recipe_filename = ""
+        self.jobs = 1
         self._history_filename = ""
         self._recipe = aspecd.tasks.Recipe()
         self._chef = aspecd.tasks.Chef()
@@ -4950,6 +5488,7 @@ class ChefDeService:
 
     def _cook_recipe(self):
         self._chef.recipe = self._recipe
+        self._chef.jobs = self.jobs
         self._chef.cook()
 
     def _create_recipe(self):
@@ -4959,7 +5498,7 @@ class ChefDeService:
     def _write_history(self):
         self._create_history_filename()
         yaml = aspecd.utils.Yaml()
-        yaml.dict = self._chef.history
+        yaml.dict = aspecd.system.intern_system_info(self._chef.history)
         yaml.numpy_array_to_list = True
         yaml.serialise_numpy_arrays()
         if self._recipe.settings["write_history"]:
@@ -4994,11 +5533,18 @@ def serve():
     recipes that rely on functionality of ASpecD-derived packages for their
     being cooked and served.
 
+    Use the ``--jobs`` switch to perform independent tasks of the recipe
+    in parallel, *e.g.* ``serve --jobs 4 <recipe_name.yaml>``.
+
     Raises
     ------
     aspecd.exceptions.MissingRecipeError
         Raised if no recipe filename is provided upon trying to serve
 
+
+    .. versionchanged:: 0.12
+        New switch ``--jobs`` for performing tasks in parallel
+
     """
     parser = argparse.ArgumentParser(
         description="Process a recipe in context of recipe-driven data analysis"
@@ -5011,6 +5557,13 @@ def serve():
     group.add_argument(
         "-q", "--quiet", action="store_true", help="don't show any output"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of tasks to perform in parallel",
+    )
     args = parser.parse_args()
 
     package_logger = aspecd.utils.get_logger()
@@ -5024,6 +5577,7 @@ def serve():
         handler.setFormatter(formatter)
         package_logger.addHandler(handler)
     chef_de_service = ChefDeService()
+    chef_de_service.jobs = args.jobs
     try:
         chef_de_service.serve(recipe_filename=args.recipe)
     # pylint: disable=broad-except
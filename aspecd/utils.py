@@ -6,19 +6,23 @@ modules of the ASpecD package, but it can be imported into every other module.
 """
 
 import collections
+import concurrent.futures
 import contextlib
 import datetime
 import hashlib
 import importlib
 import inspect
+import io
 import logging
 import os
 import pkgutil
 import re
+import struct
+import tempfile
+import zipfile
 
 import numpy as np
 import oyaml as yaml
-import pkg_resources
 
 import aspecd.exceptions
 
@@ -51,6 +55,10 @@ def object_from_class_name(full_class_name_string):
     To obtain the full class name of an object, you might want to use the
     function :func:`full_class_name`
 
+    The class is resolved using :func:`class_from_name`, hence classes
+    registered using :func:`register_class` are taken into account,
+    and resolving the same class name repeatedly is cheap.
+
     Parameters
     ----------
     full_class_name_string : :class:`str`
@@ -61,13 +69,215 @@ def object_from_class_name(full_class_name_string):
     object_ : `object`
         object instantiated from the class given in `full_class_name_string`
 
+
+    .. versionchanged:: 0.12
+        Classes are resolved using :func:`class_from_name`
+
+    """
+    return class_from_name(full_class_name_string)()
+
+
+def class_from_name(full_class_name_string):
+    """
+    Return class from full class name.
+
+    Resolving a class name requires importing the module and looking up
+    the class in there. As the same class names are resolved over and over
+    again, *e.g.* when creating the records of tasks stored in a dataset,
+    classes are memoised. Similarly, class names that could not be
+    resolved are memoised, raising the same error immediately upon
+    subsequent calls.
+
+    Classes registered using :func:`register_class` take precedence. Use
+    :func:`clear_class_cache` to resolve class names anew, *e.g.* after
+    having (re)loaded modules.
+
+    Parameters
+    ----------
+    full_class_name_string : :class:`str`
+        string with full class name including packages and modules
+
+    Returns
+    -------
+    class_ : :class:`type`
+        class given in `full_class_name_string`
+
+    Raises
+    ------
+    ModuleNotFoundError
+        Raised if the module cannot be found
+    AttributeError
+        Raised if the class does not exist in the module
+
+
+    .. versionadded:: 0.12
+
+    """
+    if full_class_name_string in _CLASS_REGISTRY:
+        return _CLASS_REGISTRY[full_class_name_string]
+    if full_class_name_string in _CLASSES:
+        return _CLASSES[full_class_name_string]
+    if full_class_name_string in _MISSING_CLASSES:
+        error_class, args = _MISSING_CLASSES[full_class_name_string]
+        raise error_class(*args)
+    module_name, _, class_name = full_class_name_string.rpartition(".")
+    try:
+        module = importlib.import_module(module_name)
+        class_ = getattr(module, class_name)
+    except (AttributeError, ModuleNotFoundError) as error:
+        _MISSING_CLASSES[full_class_name_string] = (
+            error.__class__,
+            error.args,
+        )
+        raise
+    _CLASSES[full_class_name_string] = class_
+    return class_
+
+
+def register_class(class_=None, name=""):
+    """
+    Register class to be resolved by the given name.
+
+    Packages derived from the ASpecD framework can register classes
+    explicitly, *e.g.* classes defined outside the usual module
+    structure, or classes that should be available under a different
+    (full) class name. Registered classes take precedence over classes
+    resolved by importing modules.
+
+    As the class is returned, the function can be used as class decorator
+    as well, registering the class under its full class name:
+
+    .. code-block::
+
+        @aspecd.utils.register_class
+        class MyProcessingStep(aspecd.processing.SingleProcessingStep):
+            pass
+
+    Parameters
+    ----------
+    class_ : :class:`type`
+        class to be registered
+
+    name : :class:`str`
+        full class name the class should be resolved by
+
+        Defaults to the full class name of the class itself.
+
+    Returns
+    -------
+    class_ : :class:`type`
+        class registered
+
+
+    .. versionadded:: 0.12
+
+    """
+    if not name:
+        name = ".".join([class_.__module__, class_.__name__])
+    _CLASS_REGISTRY[name] = class_
+    _MISSING_CLASSES.pop(name, None)
+    return class_
+
+
+def unregister_class(name=""):
+    """
+    Remove class registered by the given name.
+
+    Parameters
+    ----------
+    name : :class:`str`
+        full class name the class has been registered by
+
+
+    .. versionadded:: 0.12
+
+    """
+    _CLASS_REGISTRY.pop(name, None)
+
+
+def clear_class_cache():
+    """
+    Clear cache of classes resolved by :func:`class_from_name`.
+
+    Classes registered using :func:`register_class` are retained.
+
+
+    .. versionadded:: 0.12
+
+    """
+    _CLASSES.clear()
+    _MISSING_CLASSES.clear()
+
+
+# Classes registered explicitly, see register_class
+_CLASS_REGISTRY = {}
+
+# Classes and errors of class names resolved, see class_from_name
+_CLASSES = {}
+_MISSING_CLASSES = {}
+
+
+class LazyModule:
+    """
+    Module imported only upon first accessing one of its attributes.
+
+    Importing some of the packages the ASpecD framework depends upon,
+    such as matplotlib, SciPy, or asdf, takes considerable time. Hence,
+    modules using these packages only within functions and methods import
+    them lazily, *i.e.* only when actually needed. This way, importing
+    the ASpecD modules is fast, and, *e.g.*, a recipe only processing and
+    exporting datasets never imports matplotlib.
+
+    Submodules not yet imported are imported upon accessing them as well,
+    similar to importing them explicitly.
+
+    Attributes
+    ----------
+    name : :class:`str`
+        Full name of the module to import
+
+    Examples
+    --------
+    Instead of ``import matplotlib.pyplot as plt``, write:
+
+    .. code-block::
+
+        plt = aspecd.utils.LazyModule("matplotlib.pyplot")
+
+    The module is imported upon first accessing any of its attributes,
+    *e.g.* by calling ``plt.subplots()``.
+
+
+    .. versionadded:: 0.12
+
     """
-    class_name_parts = full_class_name_string.split(".")
-    class_name = class_name_parts[-1]
-    module_name = ".".join(class_name_parts[0:-1])
-    module = importlib.import_module(module_name)
-    object_ = getattr(module, class_name)()
-    return object_
+
+    def __init__(self, name=""):
+        self.name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        """Return attribute of the module, importing it if necessary."""
+        if attribute.startswith("__") or attribute == "_module":
+            raise AttributeError(attribute)
+        if self._module is None:
+            self._module = importlib.import_module(self.name)
+        try:
+            return getattr(self._module, attribute)
+        except AttributeError:
+            try:
+                return importlib.import_module(f"{self.name}.{attribute}")
+            except ModuleNotFoundError:
+                pass
+            raise
+
+    def __repr__(self):
+        """Return representation naming the module."""
+        return f"<lazily imported module {self.name!r}>"
+
+
+# Imported lazily, as scanning all installed distributions takes time
+pkg_resources = LazyModule("pkg_resources")
 
 
 class ToDictMixin:
@@ -171,6 +381,12 @@ class ToDictMixin:
             private method that can be overridden in derived classes to
             copy the dictionary.
 
+        .. versionchanged:: 0.12
+            Keys to remove are cached and traversing is dispatched on the
+            type of the values, making it considerably faster. NumPy arrays
+            (including subclasses, *e.g.* memory-mapped arrays) are never
+            copied nor traversed.
+
         """
         if hasattr(self, "__odict__"):
             result = self._traverse_dict(
@@ -211,50 +427,140 @@ class ToDictMixin:
         return dictionary
 
     def _clean_dict(self, dictionary, traversing=True):
-        to_remove = []
-        for key in dictionary:
-            if (
-                (
-                    str(key).startswith("_")
-                    and key not in self._include_in_to_dict
-                )
-                or str(key) in self._exclude_from_to_dict
-                and not traversing
-            ):
-                to_remove.append(key)
-        for key in to_remove:
+        for key in self._keys_to_remove(tuple(dictionary), traversing):
             dictionary.pop(key, None)
         if not traversing:
             for key in self._include_in_to_dict:
                 dictionary[key] = getattr(self, key)
         return dictionary
 
+    def _keys_to_remove(self, keys, traversing=True):
+        # The keys to remove only depend on the class, the keys, and the
+        # attributes to in- and exclude. Hence, they are cached.
+        plan_key = (
+            self.__class__,
+            keys,
+            traversing,
+            tuple(self._include_in_to_dict),
+            tuple(self._exclude_from_to_dict),
+        )
+        try:
+            return _TO_DICT_PLANS[plan_key]
+        except KeyError:
+            pass
+        to_remove = tuple(
+            key
+            for key in keys
+            if (
+                str(key).startswith("_")
+                and key not in self._include_in_to_dict
+            )
+            or str(key) in self._exclude_from_to_dict
+            and not traversing
+        )
+        if len(_TO_DICT_PLANS) >= _TO_DICT_PLANS_MAXSIZE:
+            _TO_DICT_PLANS.clear()
+        _TO_DICT_PLANS[plan_key] = to_remove
+        return to_remove
+
     def _traverse_dict(self, instance_dict):
         output = collections.OrderedDict()
         for key, value in instance_dict.items():
-            output[key] = self._traverse(key, value)
+            # Shortcut for values returned unaltered, see _traverser
+            if (
+                _TO_DICT_TRAVERSERS.get(value.__class__) == "_traverse_value"
+                and self.__class__._traverse is ToDictMixin._traverse
+            ):
+                output[key] = value
+            else:
+                output[key] = self._traverse(key, value)
         return output
 
     def _traverse(self, key, value):
-        if isinstance(value, ToDictMixin):
-            result = value.to_dict()
-        elif isinstance(value, (dict, collections.OrderedDict)):
-            result = self._traverse_dict(self._clean_dict(value))
-        elif hasattr(value, "__odict__"):
+        try:
+            traverser = _TO_DICT_TRAVERSERS[value.__class__]
+        except KeyError:
+            traverser = self._traverser(value.__class__)
+            _TO_DICT_TRAVERSERS[value.__class__] = traverser
+        return getattr(self, traverser)(key, value)
+
+    @staticmethod
+    def _traverser(type_):
+        """
+        Return name of the method traversing values of the given type.
+
+        Traversing is dispatched on the type of the values, as checking for
+        attributes of every single value is rather expensive. Values of
+        types known to neither have attributes nor contain other values are
+        returned unaltered. In particular, NumPy arrays are never copied,
+        and the attributes of subclasses of :class:`numpy.ndarray`,
+        *e.g.* memory-mapped arrays, are not traversed.
+
+        Parameters
+        ----------
+        type_ : :class:`type`
+            Type of the values to traverse
+
+        Returns
+        -------
+        traverser : :class:`str`
+            Name of the method traversing values of the given type
+
+        """
+        if issubclass(type_, ToDictMixin):
+            traverser = "_traverse_to_dict_mixin"
+        elif issubclass(type_, dict):
+            traverser = "_traverse_mapping"
+        elif type_ is list:
+            traverser = "_traverse_list"
+        elif type_ in (datetime.datetime, datetime.date, datetime.time):
+            traverser = "_traverse_datetime"
+        elif type_ in (str, int, float, bool, complex, bytes, type(None)):
+            traverser = "_traverse_value"
+        elif issubclass(type_, (np.ndarray, np.generic)):
+            traverser = "_traverse_value"
+        else:
+            traverser = "_traverse_object"
+        return traverser
+
+    @staticmethod
+    # pylint: disable-next=unused-argument
+    def _traverse_to_dict_mixin(key, value):
+        return value.to_dict()
+
+    # pylint: disable-next=unused-argument
+    def _traverse_mapping(self, key, value):
+        return self._traverse_dict(self._clean_dict(value))
+
+    def _traverse_list(self, key, value):
+        return [self._traverse(key, i) for i in value]
+
+    @staticmethod
+    def _traverse_datetime(key, value):  # pylint: disable=unused-argument
+        return str(value)
+
+    @staticmethod
+    def _traverse_value(key, value):  # pylint: disable=unused-argument
+        return value
+
+    def _traverse_object(self, key, value):  # pylint: disable=unused-argument
+        if hasattr(value, "__odict__"):
             result = self._traverse_dict(self._clean_dict(value.__odict__))
         elif hasattr(value, "__dict__"):
             result = self._traverse_dict(self._clean_dict(value.__dict__))
-        elif isinstance(value, list):
-            result = [self._traverse(key, i) for i in value]
-        elif isinstance(
-            value, (datetime.datetime, datetime.date, datetime.time)
-        ):
-            result = str(value)
         else:
             result = value
         return result
 
 
+# Keys to remove from dicts, see ToDictMixin._keys_to_remove
+_TO_DICT_PLANS = {}
+_TO_DICT_PLANS_MAXSIZE = 4096
+
+# Names of methods traversing values, see ToDictMixin._traverser
+_TO_DICT_TRAVERSERS = {}
+
+
 def get_aspecd_version():
     """
     Get version of ASpecD package.
@@ -389,31 +695,104 @@ class Yaml:
     binary_files : :class:`list`
         List of names of the binary files containing large arrays
 
+    binary_arrays : :class:`collections.OrderedDict`
+        Arrays stored in binary files, with the file names as keys
+
+        Useful if the binary files should not be written to the file
+        system, but somewhere else, *e.g.* directly into an archive.
+        See :attr:`write_binary_files`.
+
+        .. versionadded:: 0.12
+
+    write_binary_files : :class:`bool`
+        Whether to write binary files when serialising NumPy arrays
+
+        If set to False, the arrays are only collected in
+        :attr:`binary_arrays`.
+
+        Default: True
+
+        .. versionadded:: 0.12
+
     binary_directory : :class:`str`
         Directory the binary files should be stored in
 
+        If :attr:`binary_archive` is set, the directory within the archive.
+
         Default: ''
 
+    blob_store : :class:`aspecd.utils.BlobStore`
+        Content-addressed store binary files are written to and read from
+
+        If set, binary files are neither written to
+        :attr:`binary_directory` nor collected in :attr:`binary_arrays`,
+        but added to the blob store, and the serialised arrays are marked
+        accordingly. Hence, arrays can be shared between different files.
+
+        Default: None
+
+        .. versionadded:: 0.12
+
+    binary_archive : :class:`str`
+        Name of a ZIP archive the binary files should be read from
+
+        If set, the binary files are read directly from the archive,
+        without extracting it first.
+
+        Default: ''
+
+        .. versionadded:: 0.12
+
+    lazy : :class:`bool`
+        Whether to defer reading binary files from an archive
+
+        Only applies if :attr:`binary_archive` is set. Binary files stored
+        uncompressed in the archive are memory-mapped directly from the
+        archive, compressed files are represented by a
+        :class:`aspecd.utils.LazyArray` only decompressed upon first access.
+        For details, see :func:`aspecd.utils.array_from_zip`.
+
+        Default: False
+
+        .. versionadded:: 0.12
+
+    mmap_mode : :class:`str`
+        Mode for memory-mapping binary files rather than reading them
+
+        If set, binary files are memory-mapped (see :class:`numpy.memmap`),
+        allowing to handle arrays not fitting into memory. Valid modes
+        are "r" (read-only) and "c" (copy-on-write, *i.e.* modifying the
+        array in memory is possible, but does not change the file).
+        Binary files stored compressed in an archive cannot be
+        memory-mapped and are read (or deferred, if :attr:`lazy` is set).
+
+        Default: None
+
+        .. versionadded:: 0.12
+
     loader : :class:`yaml.loader`
         Type of loader used for loading the YAML file
 
         The type of loader used is crucial for the safety of your
         application. See the documentation of the PyYAML package for details.
 
-        Default: :class:`yaml.SafeLoader`
+        Default: :class:`aspecd.utils.YamlLoader`
 
     dumper : :class:`yaml.Dumper`
         Type of dumper used for loading the YAML file
 
         The type of dumper used is should be compatible to the type of loader.
 
-        Default: :class:`yaml.SafeDumper`
+        Default: :class:`aspecd.utils.YamlDumper`
 
     Raises
     ------
     aspecd.utils.MissingFilenameError
         Raised if no filename is given to read from/write to
 
+    aspecd.exceptions.MissingBlobStoreError
+        Raised if arrays reside in a blob store, but no blob store is given
+
 
     .. versionchanged:: 0.4
         Added :attr:`numpy_array_to_list`
@@ -421,32 +800,27 @@ class Yaml:
     .. versionchanged:: 0.5
         Added :attr:`dumper` and set dumper to SafeDumper
 
+    .. versionchanged:: 0.12
+        Loader and dumper are C-accelerated if available and no longer
+        modify the global loaders of PyYAML upon instantiation; see
+        :class:`aspecd.utils.YamlLoader` and :class:`aspecd.utils.YamlDumper`
+
     """
 
     def __init__(self):
         self.binary_files = []
         self.binary_directory = ""
+        self.binary_archive = ""
+        self.binary_arrays = collections.OrderedDict()
+        self.blob_store = None
+        self.write_binary_files = True
+        self.lazy = False
+        self.mmap_mode = None
         self.dict = collections.OrderedDict()
         self.numpy_array_size_threshold = 100
         self.numpy_array_to_list = False
-        self.loader = yaml.SafeLoader
-        self.dumper = yaml.SafeDumper
-        self.loader.add_implicit_resolver(
-            "tag:yaml.org,2002:float",
-            re.compile(
-                """^(?:
-             [-+]?(?:[0-9][0-9_]*)\\.[0-9_]*(?:[eE][-+]?[0-9]+)?
-            |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
-            |\\.[0-9_]+(?:[eE][-+][0-9]+)?
-            |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\\.[0-9_]*
-            |[-+]?\\.(?:inf|Inf|INF)
-            |\\.(?:nan|NaN|NAN))$""",
-                re.X,
-            ),
-            list("-+0123456789."),
-        )
-        self.dumper.add_representer(np.float64, self._numpy_float_representer)
-        self.dumper.add_representer(np.int64, self._numpy_int_representer)
+        self.loader = YamlLoader
+        self.dumper = YamlDumper
 
     def read_from(self, filename=""):
         """
@@ -543,38 +917,35 @@ class Yaml:
         content. Thus, having several identical arrays will lead to less
         files written, eventually saving space and overall file size.
 
+        If there are several arrays to be stored in binary form, they are
+        hashed in parallel using a pool of threads.
+
+        .. versionchanged:: 0.12
+            Arrays are hashed in parallel and collected in
+            :attr:`binary_arrays`.
+
         """
         self._traverse_serialise_numpy_arrays(dict_=self.dict)
 
-    def _traverse_serialise_numpy_arrays(self, dict_=None):  # noqa: MC0001
+    def _traverse_serialise_numpy_arrays(self, dict_=None, pending=None):
+        top_level = pending is None
+        if top_level:
+            pending = []
         for key in dict_.keys():
             if isinstance(dict_[key], list):
                 for element in dict_[key]:
                     if isinstance(element, (dict, collections.OrderedDict)):
-                        self._traverse_serialise_numpy_arrays(dict_=element)
+                        self._traverse_serialise_numpy_arrays(
+                            dict_=element, pending=pending
+                        )
             elif isinstance(dict_[key], np.ndarray):
                 if dict_[key].size > self.numpy_array_size_threshold:
-                    self._create_binary_directory()
-                    try:
-                        filename = (
-                            hashlib.sha256(dict_[key]).hexdigest() + ".npy"
-                        )
-                    except ValueError:
-                        filename = (
-                            hashlib.sha256(dict_[key].copy()).hexdigest()
-                            + ".npy"
-                        )
-                    np.save(
-                        os.path.join(self.binary_directory, filename),
-                        dict_[key],
-                        allow_pickle=False,
-                    )
+                    pending.append(dict_[key])
                     dict_[key] = {
                         "type": "numpy.ndarray",
                         "dtype": str(dict_[key].dtype),
-                        "file": filename,
+                        "file": len(pending) - 1,
                     }
-                    self.binary_files.append(filename)
                 elif self.numpy_array_to_list:
                     dict_[key] = dict_[key].tolist()
                 else:
@@ -584,9 +955,53 @@ class Yaml:
                         "array": dict_[key].tolist(),
                     }
             elif isinstance(dict_[key], (dict, collections.OrderedDict)):
-                self._traverse_serialise_numpy_arrays(dict_=dict_[key])
-            # make list of binary_files unique
-            self.binary_files = list(set(self.binary_files))
+                self._traverse_serialise_numpy_arrays(
+                    dict_=dict_[key], pending=pending
+                )
+        if top_level and pending:
+            filenames = self._save_binary_files(pending)
+            self._replace_binary_file_indices(dict_, filenames)
+
+    def _save_binary_files(self, arrays=None):
+        if len(arrays) > 1:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                hashes = list(executor.map(_sha256_hexdigest, arrays))
+        else:
+            hashes = [_sha256_hexdigest(array) for array in arrays]
+        filenames = [hash_ + ".npy" for hash_ in hashes]
+        for filename, array in zip(filenames, arrays):
+            if self.blob_store is not None:
+                self.blob_store.add(filename, array)
+                continue
+            if filename in self.binary_arrays:
+                continue
+            self.binary_arrays[filename] = array
+            if self.write_binary_files:
+                self._create_binary_directory()
+                np.save(
+                    os.path.join(self.binary_directory, filename),
+                    array,
+                    allow_pickle=False,
+                )
+        # make list of binary_files unique
+        self.binary_files = list(set(self.binary_files + filenames))
+        return filenames
+
+    def _replace_binary_file_indices(self, dict_=None, filenames=None):
+        for value in dict_.values():
+            if isinstance(value, list):
+                for element in value:
+                    if isinstance(element, (dict, collections.OrderedDict)):
+                        self._replace_binary_file_indices(element, filenames)
+            elif isinstance(value, (dict, collections.OrderedDict)):
+                if value.get("type") == "numpy.ndarray" and isinstance(
+                    value.get("file"), int
+                ):
+                    value["file"] = filenames[value["file"]]
+                    if self.blob_store is not None:
+                        value["blob"] = True
+                else:
+                    self._replace_binary_file_indices(value, filenames)
 
     def serialize_numpy_arrays(self):
         """
@@ -620,12 +1035,11 @@ class Yaml:
                     "type" in dict_[key].keys()
                     and dict_[key]["type"] == "numpy.ndarray"
                 ):
-                    if "file" in dict_[key].keys():
-                        self._create_binary_directory()
-                        dict_[key] = np.load(
-                            os.path.join(
-                                self.binary_directory, dict_[key]["file"]
-                            )
+                    if dict_[key].get("blob", False):
+                        dict_[key] = self._load_blob(dict_[key]["file"])
+                    elif "file" in dict_[key].keys():
+                        dict_[key] = self._load_binary_file(
+                            dict_[key]["file"]
                         )
                     else:
                         dict_[key] = np.asarray(dict_[key]["array"])
@@ -640,19 +1054,502 @@ class Yaml:
         """
         self.deserialise_numpy_arrays()
 
+    def _load_binary_file(self, filename=""):
+        if self.binary_archive:
+            member = filename
+            if self.binary_directory:
+                member = "/".join([self.binary_directory, filename])
+            return array_from_zip(
+                archive=self.binary_archive,
+                member=member,
+                lazy=self.lazy,
+                mmap_mode=self.mmap_mode,
+            )
+        self._create_binary_directory()
+        return np.load(
+            os.path.join(self.binary_directory, filename),
+            mmap_mode=self.mmap_mode,
+        )
+
+    def _load_blob(self, filename=""):
+        if self.blob_store is None:
+            raise aspecd.exceptions.MissingBlobStoreError(
+                f"Array {filename} resides in a blob store, but no blob "
+                f"store is given"
+            )
+        mmap_mode = self.mmap_mode
+        if self.lazy and not mmap_mode:
+            mmap_mode = "c"
+        return self.blob_store.load(filename, mmap_mode=mmap_mode)
+
     def _create_binary_directory(self):
         if self.binary_directory and not os.path.exists(
             self.binary_directory
         ):
             os.mkdir(self.binary_directory)
 
-    @staticmethod
-    def _numpy_float_representer(dumper, data):
-        return dumper.represent_float(float(data))
 
-    @staticmethod
-    def _numpy_int_representer(dumper, data):
-        return dumper.represent_int(int(data))
+class YamlLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+    """
+    Safe YAML loader used by :class:`aspecd.utils.Yaml`.
+
+    Based on the C-accelerated :class:`yaml.CSafeLoader` if PyYAML has been
+    built with libyaml, otherwise on :class:`yaml.SafeLoader`. In contrast
+    to the YAML 1.1 specification, floats with exponent but without
+    decimal point, such as ``1e3``, are resolved as floats.
+
+    The resolver is registered once with this class, leaving the loaders
+    of PyYAML untouched.
+
+    .. versionadded:: 0.12
+
+    """
+
+
+class YamlDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+    """
+    Safe YAML dumper used by :class:`aspecd.utils.Yaml`.
+
+    Based on the C-accelerated :class:`yaml.CSafeDumper` if PyYAML has been
+    built with libyaml, otherwise on :class:`yaml.SafeDumper`. NumPy floats
+    and integers are represented as their Python counterparts, and strings
+    that would be read as floats by the :class:`aspecd.utils.YamlLoader`
+    are quoted.
+
+    .. versionadded:: 0.12
+
+    """
+
+
+def _represent_numpy_float(dumper, data):
+    return dumper.represent_float(float(data))
+
+
+def _represent_numpy_int(dumper, data):
+    return dumper.represent_int(int(data))
+
+
+_YAML_FLOAT_RESOLVER = re.compile(
+    """^(?:
+     [-+]?(?:[0-9][0-9_]*)\\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+    |\\.[0-9_]+(?:[eE][-+][0-9]+)?
+    |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\\.[0-9_]*
+    |[-+]?\\.(?:inf|Inf|INF)
+    |\\.(?:nan|NaN|NAN))$""",
+    re.X,
+)
+
+for _class in (YamlLoader, YamlDumper):
+    _class.add_implicit_resolver(
+        "tag:yaml.org,2002:float",
+        _YAML_FLOAT_RESOLVER,
+        list("-+0123456789."),
+    )
+YamlDumper.add_representer(np.float64, _represent_numpy_float)
+YamlDumper.add_representer(np.int64, _represent_numpy_int)
+
+
+class BlobStore:
+    """
+    Content-addressed store for NumPy arrays shared between files.
+
+    Arrays are stored in NumPy format in a directory, using the SHA256 hash
+    of their content as filename (see
+    :meth:`aspecd.utils.Yaml.serialise_numpy_arrays`). Hence, each array is
+    written only once, regardless of how many files refer to it. To keep
+    the number of files per directory manageable, the files are
+    distributed over subdirectories named after the first two characters
+    of the hash.
+
+    Arrays are written to a temporary file first that is renamed
+    afterwards, hence several processes can safely share one store.
+
+    As the store has no way of knowing which arrays are still referred
+    to, unused arrays need to be removed explicitly, see
+    :meth:`collect_garbage`.
+
+    Attributes
+    ----------
+    directory : :class:`str`
+        Directory the arrays are stored in
+
+        Will be created upon adding the first array if necessary.
+
+
+    Examples
+    --------
+    Usually, you will not use the blob store directly, but set the
+    ``blob_store`` attribute of the :class:`aspecd.io.AdfExporter` and
+    the corresponding parameter of the :class:`aspecd.io.AdfImporter`.
+    Nevertheless, adding and loading arrays is straightforward:
+
+    .. code-block::
+
+        store = BlobStore(directory="blobs")
+        store.add("<sha256>.npy", array)
+        array = store.load("<sha256>.npy")
+
+
+    .. versionadded:: 0.12
+
+    """
+
+    def __init__(self, directory=""):
+        self.directory = directory
+
+    def __contains__(self, filename):
+        """Return whether the store contains a file with the given name."""
+        return os.path.exists(self.filepath(filename))
+
+    def __len__(self):
+        """Return number of files in the store."""
+        return len(self.filenames())
+
+    def filepath(self, filename=""):
+        """
+        Path of the file an array is stored in.
+
+        Parameters
+        ----------
+        filename : :class:`str`
+            Name of the array, *i.e.* its hash with extension ".npy"
+
+        Returns
+        -------
+        filepath : :class:`str`
+            Path of the file the array is stored in
+
+        """
+        return os.path.join(self.directory, filename[:2], filename)
+
+    def add(self, filename="", array=None):
+        """
+        Add an array to the store, if not already present.
+
+        Parameters
+        ----------
+        filename : :class:`str`
+            Name of the array, *i.e.* its hash with extension ".npy"
+
+        array : :class:`numpy.ndarray`
+            Array to be stored
+
+        """
+        if filename in self:
+            return
+        subdirectory = os.path.dirname(self.filepath(filename))
+        os.makedirs(subdirectory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=subdirectory, suffix=".tmp", delete=False
+        ) as file:
+            np.save(file, array, allow_pickle=False)
+        os.replace(file.name, self.filepath(filename))
+
+    def load(self, filename="", mmap_mode=None):
+        """
+        Load an array from the store.
+
+        Parameters
+        ----------
+        filename : :class:`str`
+            Name of the array, *i.e.* its hash with extension ".npy"
+
+        mmap_mode : :class:`str`
+            Memory-map mode, see :func:`numpy.load` for details
+
+            Default: None
+
+        Returns
+        -------
+        array : :class:`numpy.ndarray`
+            Array loaded from the store
+
+        """
+        return np.load(self.filepath(filename), mmap_mode=mmap_mode)
+
+    def filenames(self):
+        """
+        Names of all arrays contained in the store.
+
+        Returns
+        -------
+        filenames : :class:`list`
+            Names of all arrays contained in the store
+
+        """
+        filenames = []
+        if not os.path.isdir(self.directory):
+            return filenames
+        for subdirectory in sorted(os.listdir(self.directory)):
+            subdirectory_path = os.path.join(self.directory, subdirectory)
+            if not os.path.isdir(subdirectory_path):
+                continue
+            filenames.extend(
+                sorted(
+                    name
+                    for name in os.listdir(subdirectory_path)
+                    if name.endswith(".npy")
+                )
+            )
+        return filenames
+
+    def collect_garbage(self, referenced=None, dry_run=False):
+        """
+        Remove all arrays not referenced any more.
+
+        .. important::
+            Make sure that the list of referenced arrays is complete and no
+            files referring to the store are written while collecting
+            garbage. Otherwise, arrays still needed may be removed.
+
+        Parameters
+        ----------
+        referenced : :class:`list`
+            Names of the arrays still referenced and hence to be kept
+
+        dry_run : :class:`bool`
+            Whether to only return the arrays that would be removed
+
+            Default: False
+
+        Returns
+        -------
+        removed : :class:`list`
+            Names of the arrays removed
+
+        """
+        referenced = set(referenced or [])
+        removed = [
+            filename
+            for filename in self.filenames()
+            if filename not in referenced
+        ]
+        if not dry_run:
+            for filename in removed:
+                os.remove(self.filepath(filename))
+        return removed
+
+
+def _sha256_hexdigest(array):
+    # hashlib releases the GIL for larger buffers, hence hashing several
+    # arrays in threads does actually run in parallel.
+    try:
+        return hashlib.sha256(array).hexdigest()
+    except (ValueError, BufferError):
+        return hashlib.sha256(array.copy()).hexdigest()
+
+
+class LazyArray:
+    """
+    NumPy array in a ZIP archive only read upon first access.
+
+    Reading the header of a file in NumPy format is sufficient to know
+    shape and data type of the array. Hence, these are available right
+    away, while the actual data are only read (and decompressed) from the
+    archive upon calling :meth:`load` or converting the object into a
+    NumPy array, *e.g.* using :func:`numpy.asarray`. The array is read only
+    once and cached afterwards.
+
+    Usually, you will not create objects of this class directly,
+    but obtain them from :func:`aspecd.utils.array_from_zip`.
+
+    Attributes
+    ----------
+    archive : :class:`str`
+        Name of the ZIP archive
+
+    member : :class:`str`
+        Name of the file within the archive
+
+    shape : :class:`tuple`
+        Shape of the array
+
+    dtype : :class:`numpy.dtype`
+        Data type of the array
+
+    Parameters
+    ----------
+    archive : :class:`str`
+        Name of the ZIP archive
+
+    member : :class:`str`
+        Name of the file within the archive
+
+
+    .. versionadded:: 0.12
+
+    """
+
+    def __init__(self, archive="", member=""):
+        self.archive = archive
+        self.member = member
+        self.shape = ()
+        self.dtype = None
+        self._array = None
+        if self.archive and self.member:
+            self._read_header()
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the array."""
+        return len(self.shape)
+
+    @property
+    def size(self):
+        """Number of elements of the array."""
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self):
+        """Number of bytes the array will occupy once loaded."""
+        return self.size * self.dtype.itemsize
+
+    @property
+    def loaded(self):
+        """Whether the array has already been read from the archive."""
+        return self._array is not None
+
+    def load(self):
+        """
+        Read the array from the archive (if not done before).
+
+        Returns
+        -------
+        array : :class:`numpy.ndarray`
+            Array read from the archive
+
+        """
+        if self._array is None:
+            with zipfile.ZipFile(self.archive, "r") as zipped_file:
+                with zipped_file.open(self.member) as file:
+                    self._array = np.load(
+                        io.BytesIO(file.read()), allow_pickle=False
+                    )
+        return self._array
+
+    def __array__(self, dtype=None, copy=None):
+        """Return the array, read from the archive upon first access.
+
+        The array read is cached and returned without copying, unless
+        ``copy`` is True or a copy is necessary to convert the data type.
+        If ``copy`` is False and a copy is necessary, a :class:`ValueError`
+        is raised.
+
+        """
+        array = self.load()
+        if dtype is not None and np.dtype(dtype) != array.dtype:
+            if copy is False:
+                raise ValueError(
+                    "Unable to avoid copy while converting data type"
+                )
+            return array.astype(dtype)
+        if copy:
+            return array.copy()
+        return array
+
+    def __len__(self):
+        """Return length of the first dimension of the array."""
+        return self.shape[0]
+
+    def _read_header(self):
+        with zipfile.ZipFile(self.archive, "r") as zipped_file:
+            with zipped_file.open(self.member) as file:
+                self.shape, _, self.dtype = _read_npy_header(file)
+
+
+def array_from_zip(archive="", member="", lazy=False, mmap_mode=None):
+    """
+    Read NumPy array stored in NumPy format from a ZIP archive.
+
+    The archive is not extracted, but the array read directly from the
+    respective file (member) in the archive.
+
+    If the array should be loaded lazily, the array is not read into
+    memory. Instead, files stored uncompressed in the archive are
+    memory-mapped directly from the archive, resulting in a
+    :class:`numpy.memmap` object. The memory map is "copy-on-write",
+    *i.e.* modifying the array in memory is possible, but does not change
+    the archive. For files stored compressed in the archive,
+    a :class:`aspecd.utils.LazyArray` object gets returned that is only
+    decompressed upon first access.
+
+    Similarly, files stored uncompressed in the archive can be
+    memory-mapped explicitly by setting ``mmap_mode``, with either
+    read-only ("r") or copy-on-write ("c") access. Files stored
+    compressed are read into memory in this case, unless the array should
+    be loaded lazily.
+
+    Parameters
+    ----------
+    archive : :class:`str`
+        Name of the ZIP archive
+
+    member : :class:`str`
+        Name of the file within the archive
+
+    lazy : :class:`bool`
+        Whether to defer reading the array
+
+        Default: False
+
+    mmap_mode : :class:`str`
+        Mode for memory-mapping the array, either "r" or "c"
+
+        If not set and the array should be loaded lazily, "c" is used.
+
+        Default: None
+
+    Returns
+    -------
+    array : :class:`numpy.ndarray` | :class:`aspecd.utils.LazyArray`
+        Array read (or to be read) from the archive
+
+    Raises
+    ------
+    ValueError
+        Raised if the mode for memory-mapping is invalid
+
+
+    .. versionadded:: 0.12
+
+    """
+    if mmap_mode not in (None, "r", "c"):
+        raise ValueError(f"Invalid mode for memory-mapping: {mmap_mode}")
+    with zipfile.ZipFile(archive, "r") as zipped_file:
+        info = zipped_file.getinfo(member)
+        compressed = (
+            info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1
+        )
+        if not lazy and (not mmap_mode or compressed):
+            with zipped_file.open(info) as file:
+                return np.load(io.BytesIO(file.read()), allow_pickle=False)
+    if compressed:
+        return LazyArray(archive=archive, member=member)
+    with open(archive, "rb") as file:
+        file.seek(info.header_offset)
+        local_header = file.read(30)
+        name_length, extra_length = struct.unpack("<HH", local_header[26:])
+        file.seek(info.header_offset + 30 + name_length + extra_length)
+        shape, fortran_order, dtype = _read_npy_header(file)
+        offset = file.tell()
+    if not int(np.prod(shape)):
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(
+        archive,
+        dtype=dtype,
+        mode=mmap_mode or "c",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def _read_npy_header(file):
+    version = np.lib.format.read_magic(file)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(file)
+    return np.lib.format.read_array_header_2_0(file)
 
 
 def replace_value_in_dict(replacement=None, target=None):  # noqa: MC0001
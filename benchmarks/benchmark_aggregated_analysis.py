@@ -0,0 +1,75 @@
+"""Benchmark: aggregating analyses of many datasets.
+
+:class:`aspecd.analysis.AggregatedAnalysisStep` performs an analysis step
+on each of a list of datasets and aggregates the results at once. As
+reference serves analysing each dataset and appending its result to the
+data of the resulting dataset, as done by earlier versions of ASpecD.
+Throughput is given in datasets per second.
+
+Run from the project root::
+
+    python benchmarks/benchmark_aggregated_analysis.py
+
+"""
+
+import timeit
+
+import numpy as np
+
+import aspecd.analysis
+import aspecd.dataset
+
+
+def create_datasets(number_of_datasets=1000):
+    """Create list of 1D datasets."""
+    datasets = []
+    for number in range(number_of_datasets):
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.random.random(100)
+        dataset.label = f"dataset{number}"
+        datasets.append(dataset)
+    return datasets
+
+
+def aggregated_analysis(datasets):
+    """Aggregate the maxima of all datasets."""
+    analysis_step = aspecd.analysis.AggregatedAnalysisStep()
+    analysis_step.analysis_step = "BasicCharacteristics"
+    analysis_step.parameters["kind"] = "max"
+    analysis_step.datasets = datasets
+    analysis_step.analyse()
+
+
+def aggregated_analysis_append(datasets):
+    """Append the result of each analysis, as in earlier versions."""
+    analysis_step = aspecd.analysis.BasicCharacteristics()
+    analysis_step.parameters["kind"] = "max"
+    result = aspecd.dataset.CalculatedDataset()
+    index = []
+    for dataset in datasets:
+        analysis_done = dataset.analyse(analysis_step)
+        result.data.data = np.append(result.data.data, analysis_done.result)
+        index.append(dataset.label)
+    result.data.axes[0].index = index
+
+
+def main():
+    """Print throughput aggregating at once and appending each result."""
+    print(f"{'datasets':>9} {'at once / s^-1':>15} {'append / s^-1':>14}")
+    for number_of_datasets in [100, 1000, 10000]:
+        datasets = create_datasets(number_of_datasets)
+        throughput = []
+        for function in (aggregated_analysis, aggregated_analysis_append):
+            timer = timeit.Timer(lambda: function(datasets))
+            throughput.append(number_of_datasets / min(timer.repeat(3, 1)))
+            for dataset in datasets:
+                dataset.analyses.clear()
+                dataset.tasks.clear()
+        print(
+            f"{number_of_datasets:>9} {throughput[0]:>15.0f}"
+            f" {throughput[1]:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
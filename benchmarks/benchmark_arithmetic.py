@@ -0,0 +1,62 @@
+"""Benchmark: arithmetic operations on datasets.
+
+Adding, subtracting, multiplying, and dividing datasets creates a new
+dataset whose data array is the only thing newly allocated, with history
+and other records shared with the original dataset. As reference serves
+deep-copying the dataset before operating on its data, as done by earlier
+versions of ASpecD.
+
+Run from the project root::
+
+    python benchmarks/benchmark_arithmetic.py
+
+"""
+
+import copy
+import timeit
+
+import numpy as np
+
+import aspecd.dataset
+import aspecd.processing
+
+
+def create_dataset(history_length=20, number_of_points=1000):
+    """Create dataset with a history of the given length."""
+    dataset = aspecd.dataset.Dataset()
+    dataset.data.data = np.random.random(number_of_points)
+    processing_step = aspecd.processing.ScalarAlgebra()
+    processing_step.parameters = {"kind": "add", "value": 1}
+    for _ in range(history_length):
+        dataset.process(processing_step)
+    return dataset
+
+
+def subtract(dataset, other):
+    """Subtract datasets using the arithmetic operator."""
+    return dataset - other
+
+
+def subtract_deepcopy(dataset, other):
+    """Subtract datasets from a deep copy, as done in earlier versions."""
+    result = copy.deepcopy(dataset)
+    result.data.data -= other.data.data
+    return result
+
+
+def main():
+    """Time subtracting datasets with histories of different length."""
+    print(f"{'history':>8} {'operator / ms':>14} {'deepcopy / ms':>14}")
+    for history_length in [0, 10, 100]:
+        dataset = create_dataset(history_length)
+        other = create_dataset(history_length)
+        times = []
+        for function in (subtract, subtract_deepcopy):
+            timer = timeit.Timer(lambda: function(dataset, other))
+            number, _ = timer.autorange()
+            times.append(min(timer.repeat(3, number)) / number * 1e3)
+        print(f"{history_length:>8} {times[0]:>14.3f} {times[1]:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: baseline correction of 2D datasets.
+
+:class:`aspecd.processing.BaselineCorrection` fits the baselines of all
+slices of a dataset in one least-squares fit. As reference serves fitting
+each slice separately using :meth:`numpy.polynomial.Polynomial.fit`, as
+done by earlier versions of ASpecD.
+
+Run from the project root::
+
+    python benchmarks/benchmark_baseline_correction.py
+
+"""
+
+import copy
+import math
+import timeit
+
+import numpy as np
+
+import aspecd.dataset
+import aspecd.processing
+
+
+def create_dataset(number_of_slices=2000, number_of_points=500):
+    """Create 2D dataset with the given number of slices."""
+    dataset = aspecd.dataset.Dataset()
+    dataset.data.data = np.random.random([number_of_points, number_of_slices])
+    return dataset
+
+
+def baseline_correction(dataset, order=1):
+    """Perform baseline correction using the processing step."""
+    processing_step = aspecd.processing.BaselineCorrection()
+    processing_step.parameters["order"] = order
+    dataset.process(processing_step)
+
+
+def baseline_correction_loop(dataset, order=1):
+    """Fit each slice separately, as done in earlier versions of ASpecD."""
+    data = dataset.data.data
+    number_of_points = data.shape[0]
+    points = math.ceil(number_of_points * 10 / 100.0)
+    axis_values = dataset.data.axes[0].values
+    fit_values = np.concatenate((axis_values[:points], axis_values[-points:]))
+    for idx in range(data.shape[1]):
+        intensities = np.concatenate(
+            (data[:points, idx], data[-points:, idx])
+        )
+        polynomial = np.polynomial.Polynomial.fit(
+            fit_values, intensities, order
+        )
+        _ = polynomial.convert().coef
+        data[:, idx] -= polynomial(axis_values)
+    dataset.data.data = data
+
+
+def main():
+    """Time batched baseline correction and loop over slices."""
+    print(f"{'slices':>8} {'batched / ms':>14} {'loop / ms':>12}")
+    for number_of_slices in [10, 100, 1000, 2000]:
+        dataset = create_dataset(number_of_slices)
+        times = []
+        for function in (baseline_correction, baseline_correction_loop):
+            timer = timeit.Timer(lambda: function(copy.deepcopy(dataset)))
+            number, _ = timer.autorange()
+            times.append(min(timer.repeat(3, number)) / number * 1e3)
+        print(f"{number_of_slices:>8} {times[0]:>14.2f} {times[1]:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
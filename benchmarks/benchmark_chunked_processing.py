@@ -0,0 +1,90 @@
+"""Benchmark: memory used by processing memory-mapped datasets in chunks.
+
+Processing steps separable along an axis of the data process the data in
+chunks if their attribute ``chunk_size`` is set (see
+:class:`aspecd.processing.SingleProcessingStep`). For memory-mapped
+datasets, only one chunk needs to be in memory at a time, and the result
+is written to a temporary file. As reference serves processing the data at
+once.
+
+Run from the project root::
+
+    python benchmarks/benchmark_chunked_processing.py
+
+"""
+
+import os
+import tracemalloc
+
+import numpy as np
+
+import aspecd.dataset
+import aspecd.io
+import aspecd.processing
+
+FILENAME = "benchmark_chunked_processing"
+
+
+def create_file(shape=(5000, 2000)):
+    """Create ADF file containing a dataset of the given shape."""
+    dataset = aspecd.dataset.Dataset()
+    dataset.data.data = np.random.random(shape)
+    dataset.export_to(aspecd.io.AdfExporter(target=FILENAME))
+
+
+def import_dataset():
+    """Import dataset memory-mapped from the ADF file."""
+    dataset = aspecd.dataset.Dataset()
+    importer = aspecd.io.AdfImporter(source=FILENAME)
+    importer.parameters["mmap_mode"] = "c"
+    dataset.import_from(importer)
+    return dataset
+
+
+def baseline_correction():
+    """Return baseline correction along the second axis."""
+    step = aspecd.processing.BaselineCorrection()
+    step.parameters["axis"] = 1
+    return step
+
+
+def integration():
+    """Return integration along the last axis."""
+    return aspecd.processing.Integration()
+
+
+def scalar_algebra():
+    """Return addition of a scalar."""
+    step = aspecd.processing.ScalarAlgebra()
+    step.parameters["kind"] = "add"
+    return step
+
+
+def peak_memory(create_step, chunk_size=0):
+    """Return peak memory used by processing in MB."""
+    dataset = import_dataset()
+    step = create_step()
+    step.chunk_size = chunk_size
+    tracemalloc.start()
+    dataset.process(step)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main():
+    """Measure peak memory processing at once and in chunks."""
+    create_file()
+    print(f"{'step':>20} {'at once / MB':>13} {'chunks / MB':>12}")
+    try:
+        for create_step in (baseline_correction, integration, scalar_algebra):
+            print(
+                f"{create_step.__name__:>20} {peak_memory(create_step):>13.1f}"
+                f" {peak_memory(create_step, chunk_size=100):>12.1f}"
+            )
+    finally:
+        os.remove(FILENAME + ".adf")
+
+
+if __name__ == "__main__":
+    main()
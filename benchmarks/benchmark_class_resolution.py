@@ -0,0 +1,92 @@
+"""Benchmark: resolving class names.
+
+Classes of tasks and of the records stored in a dataset are resolved from
+their full class names by :func:`aspecd.utils.class_from_name`, memoising
+both, classes found and class names not found. As reference serves
+importing the module and looking up the class each time, as done by
+earlier versions of ASpecD.
+
+Run from the project root::
+
+    python benchmarks/benchmark_class_resolution.py
+
+"""
+
+import importlib
+import timeit
+
+import numpy as np
+
+import aspecd.dataset
+import aspecd.processing
+import aspecd.tasks
+import aspecd.utils
+
+
+def object_from_class_name(full_class_name_string):
+    """Create object importing the module, as in earlier versions."""
+    class_name_parts = full_class_name_string.split(".")
+    class_name = class_name_parts[-1]
+    module_name = ".".join(class_name_parts[0:-1])
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)()
+
+
+def create_dataset_dict(number_of_tasks=10000):
+    """Create dict of a dataset with the given number of task records."""
+    dataset = aspecd.dataset.Dataset()
+    dataset.data.data = np.random.random(10)
+    processing_step = aspecd.processing.ScalarAlgebra()
+    processing_step.parameters = {"kind": "add", "value": 1}
+    for _ in range(number_of_tasks):
+        dataset.process(processing_step)
+    dataset_dict = dataset.to_dict()
+    # Unshare records, as in datasets written by earlier versions of ASpecD
+    for task in dataset_dict["tasks"]:
+        task["task"] = dict(task["task"])
+    return dataset_dict
+
+
+def from_dict(dataset_dict):
+    """Reconstruct dataset from dict."""
+    dataset = aspecd.dataset.Dataset()
+    dataset.from_dict(dataset_dict)
+
+
+def create_task_object():
+    """Create object of a task for a class of the aspecd package."""
+    task = aspecd.tasks.ProcessingTask()
+    task.kind = "processing"
+    task.type = "ScalarAlgebra"
+    task.package = "foo"
+    # pylint: disable=protected-access
+    task._create_object()
+
+
+def time(function, uncached):
+    """Return best time of calling the function in ms."""
+    original = aspecd.utils.object_from_class_name
+    if uncached:
+        aspecd.utils.object_from_class_name = object_from_class_name
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    result = min(timer.repeat(3, number)) / number * 1e3
+    aspecd.utils.object_from_class_name = original
+    return result
+
+
+def main():
+    """Time resolving class names with and without memoising classes."""
+    print(f"{'':>12} {'cached / ms':>12} {'uncached / ms':>14}")
+    dataset_dict = create_dataset_dict()
+    functions = {
+        "dataset": lambda: from_dict(dataset_dict),
+        "task object": create_task_object,
+    }
+    for name, function in functions.items():
+        times = [time(function, uncached) for uncached in (False, True)]
+        print(f"{name:>12} {times[0]:>12.3f} {times[1]:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
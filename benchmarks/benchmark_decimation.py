@@ -0,0 +1,71 @@
+"""Benchmark: plotting and saving long traces with and without decimation.
+
+With the parameter ``decimate`` of :class:`aspecd.plotting.SinglePlotter1D`,
+long traces are decimated to a few points per pixel of the axes before
+plotting, retaining the minima and maxima of the data (or, alternatively,
+the points selected by the largest-triangle-three-buckets algorithm). As
+reference serves plotting all points. Given are the times for plotting
+and saving the figure as PDF file and the size of the resulting file.
+
+Run from the project root::
+
+    python benchmarks/benchmark_decimation.py
+
+"""
+
+import os
+import timeit
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import aspecd.dataset
+import aspecd.plotting
+
+FILENAME = "benchmark_decimation.pdf"
+
+
+def create_dataset(number_of_points=100000):
+    """Create 1D dataset with noisy sine curve."""
+    dataset = aspecd.dataset.Dataset()
+    data = np.sin(np.linspace(0, 8 * np.pi, number_of_points))
+    dataset.data.data = data + np.random.random(number_of_points) * 0.2
+    return dataset
+
+
+def plot(dataset, decimate=""):
+    """Plot dataset and save figure to PDF file."""
+    plotter = aspecd.plotting.SinglePlotter1D()
+    plotter.parameters["decimate"] = decimate
+    plotter.parameters["tight_layout"] = True
+    dataset.plot(plotter)
+    plotter.save(aspecd.plotting.Saver(filename=FILENAME))
+    plt.close(plotter.figure)
+
+
+def main():
+    """Time plotting and saving with and without decimation."""
+    print(
+        f"{'points':>9} {'all / s':>8} {'minmax / s':>11} {'lttb / s':>9}"
+        f" {'all / kB':>9} {'minmax / kB':>12}"
+    )
+    try:
+        for number_of_points in [10**4, 10**5, 10**6, 10**7]:
+            dataset = create_dataset(number_of_points)
+            times = []
+            sizes = []
+            for decimate in ("", "minmax", "lttb"):
+                timer = timeit.Timer(lambda: plot(dataset, decimate))
+                times.append(min(timer.repeat(3, 1)))
+                sizes.append(os.path.getsize(FILENAME) / 1e3)
+            print(
+                f"{number_of_points:>9} {times[0]:>8.2f} {times[1]:>11.2f}"
+                f" {times[2]:>9.2f} {sizes[0]:>9.0f} {sizes[1]:>12.0f}"
+            )
+    finally:
+        if os.path.exists(FILENAME):
+            os.remove(FILENAME)
+
+
+if __name__ == "__main__":
+    main()
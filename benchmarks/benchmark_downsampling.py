@@ -0,0 +1,82 @@
+"""Benchmark: plotting and saving large 2D datasets with downsampling.
+
+With the parameter ``downsample`` of :class:`aspecd.plotting.SinglePlotter2D`,
+the data are downsampled to the resolution of the axes before plotting,
+and with the parameter ``rasterise``, contours are rasterised in vector
+graphics output. As reference serves plotting the data at full resolution.
+Given are the times for plotting and saving the figure as PDF file and the
+size of the resulting file.
+
+Run from the project root::
+
+    python benchmarks/benchmark_downsampling.py
+
+"""
+
+import os
+import timeit
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import aspecd.dataset
+import aspecd.plotting
+
+FILENAME = "benchmark_downsampling.pdf"
+
+
+def create_dataset(number_of_points=4000):
+    """Create 2D dataset with noisy two-dimensional Gaussian."""
+    dataset = aspecd.dataset.Dataset()
+    values = np.linspace(-3, 3, number_of_points)
+    data = np.exp(-(values[:, np.newaxis] ** 2) - values**2)
+    noise = np.random.random((number_of_points, number_of_points)) * 0.05
+    dataset.data.data = data + noise
+    return dataset
+
+
+def plot(dataset, plot_type="imshow", downsample=False, rasterise=False):
+    """Plot dataset and save figure to PDF file."""
+    plotter = aspecd.plotting.SinglePlotter2D()
+    plotter.type = plot_type
+    plotter.parameters["downsample"] = downsample
+    plotter.parameters["rasterise"] = rasterise
+    dataset.plot(plotter)
+    plotter.save(aspecd.plotting.Saver(filename=FILENAME))
+    plt.close(plotter.figure)
+
+
+def main():
+    """Time plotting and saving at full resolution and downsampled."""
+    print(
+        f"{'type':>9} {'points':>7} {'setting':>20} {'time / s':>9}"
+        f" {'size / kB':>10}"
+    )
+    settings = {
+        "full resolution": {},
+        "downsample": {"downsample": True},
+        "downsample+rasterise": {"downsample": True, "rasterise": True},
+    }
+    try:
+        for number_of_points in [1000, 4000]:
+            dataset = create_dataset(number_of_points)
+            for plot_type in ("imshow", "contourf"):
+                for name, setting in settings.items():
+                    if plot_type == "imshow" and "rasterise" in setting:
+                        continue
+                    timer = timeit.Timer(
+                        lambda: plot(dataset, plot_type, **setting)
+                    )
+                    time = min(timer.repeat(3, 1))
+                    size = os.path.getsize(FILENAME) / 1e3
+                    print(
+                        f"{plot_type:>9} {number_of_points:>7} {name:>20}"
+                        f" {time:>9.2f} {size:>10.0f}"
+                    )
+    finally:
+        if os.path.exists(FILENAME):
+            os.remove(FILENAME)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark: importing ASpecD modules.
+
+Heavy dependencies, such as matplotlib, SciPy, asdf, and pkg_resources,
+are imported lazily, *i.e.* only when actually needed (see
+:class:`aspecd.utils.LazyModule`). As reference serves importing these
+dependencies upfront, as done by earlier versions of ASpecD. Each import
+is timed in a fresh interpreter.
+
+Run from the project root::
+
+    python benchmarks/benchmark_import.py
+
+"""
+
+import subprocess
+import sys
+
+DEPENDENCIES = [
+    "asdf",
+    "matplotlib.pyplot",
+    "pkg_resources",
+    "scipy.interpolate",
+    "scipy.ndimage",
+    "scipy.signal",
+    "scipy.special",
+]
+
+
+def import_time(module, eager=False, repetitions=5):
+    """Return best time of importing the module in a new interpreter in ms."""
+    imports = [module]
+    if eager:
+        imports = DEPENDENCIES + imports
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"import {', '.join(imports)}\n"
+        "print(time.perf_counter() - start)"
+    )
+    times = []
+    for _ in range(repetitions):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times.append(float(result.stdout) * 1e3)
+    return min(times)
+
+
+def main():
+    """Time importing modules with lazy and eager dependencies."""
+    print(f"{'module':>18} {'lazy / ms':>10} {'eager / ms':>11}")
+    for module in [
+        "aspecd.dataset",
+        "aspecd.processing",
+        "aspecd.plotting",
+        "aspecd.tasks",
+    ]:
+        times = [import_time(module, eager) for eager in (False, True)]
+        print(f"{module:>18} {times[0]:>10.0f} {times[1]:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
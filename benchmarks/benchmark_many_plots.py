@@ -0,0 +1,82 @@
+"""Benchmark: plotting many datasets of the same type.
+
+Creating figure and axes is the most time-consuming part of plotting
+simple data. The rc parameters set by a style are determined only once
+per style and cached (see :func:`aspecd.plotting.clear_style_cache`). As
+reference for applying the style serves using the style with matplotlib
+for each plot, as done by earlier versions of ASpecD. Throughput is given
+in plots per second, including closing the figures.
+
+Run from the project root::
+
+    python benchmarks/benchmark_many_plots.py
+
+"""
+
+import timeit
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+
+import aspecd.dataset
+import aspecd.plotting
+
+
+def create_dataset():
+    """Create 1D dataset with noisy sine curve."""
+    dataset = aspecd.dataset.Dataset()
+    data = np.sin(np.linspace(0, 8 * np.pi, 1000))
+    dataset.data.data = data + np.random.random(1000) * 0.2
+    return dataset
+
+
+def plot(dataset, style="", number_of_plots=1000):
+    """Plot dataset repeatedly, closing each figure."""
+    for _ in range(number_of_plots):
+        plotter = aspecd.plotting.SinglePlotter1D()
+        plotter.style = style
+        dataset.plot(plotter)
+        plt.close(plotter.figure)
+
+
+def apply_style(style):
+    """Apply cached style and reset rc parameters."""
+    original_rcparams = dict.copy(mpl.rcParams)
+    # pylint: disable=protected-access
+    dict.update(mpl.rcParams, aspecd.plotting._style_parameters(style))
+    dict.update(mpl.rcParams, original_rcparams)
+
+
+def apply_style_matplotlib(style):
+    """Use style with matplotlib and reset rc parameters."""
+    original_rcparams = mpl.rcParams.copy()
+    plt.style.use(style)
+    dict.update(mpl.rcParams, original_rcparams)
+
+
+def main():
+    """Print plot throughput and time for applying styles."""
+    dataset = create_dataset()
+    print(
+        f"{'style':>10} {'plots / s^-1':>13} {'style / us':>11}"
+        f" {'matplotlib / us':>16}"
+    )
+    for style in ("", "ggplot", "default"):
+        timer = timeit.Timer(lambda: plot(dataset, style))
+        throughput = 1000 / min(timer.repeat(3, 1))
+        if style:
+            times = []
+            for function in (apply_style, apply_style_matplotlib):
+                timer = timeit.Timer(lambda: function(style))
+                times.append(min(timer.repeat(3, 1000)) * 1e3)
+            print(
+                f"{style:>10} {throughput:>13.0f} {times[0]:>11.1f}"
+                f" {times[1]:>16.1f}"
+            )
+        else:
+            print(f"{'none':>10} {throughput:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark: memory used by processing memory-mapped datasets.
+
+With the parameter ``mmap_mode`` of :class:`aspecd.io.AdfImporter`, the
+arrays of a dataset are memory-mapped from the ADF file rather than read
+into memory. Processing steps not modifying the data in place hence never
+read the entire data into memory. As reference serves importing the
+dataset without memory-mapping.
+
+Run from the project root::
+
+    python benchmarks/benchmark_memory_map.py
+
+"""
+
+import os
+import tracemalloc
+
+import numpy as np
+
+import aspecd.analysis
+import aspecd.dataset
+import aspecd.io
+import aspecd.processing
+
+FILENAME = "benchmark_memory_map"
+
+
+def create_file(shape=(5000, 2000)):
+    """Create ADF file containing a dataset of the given shape."""
+    dataset = aspecd.dataset.Dataset()
+    dataset.data.data = np.random.random(shape)
+    dataset.export_to(aspecd.io.AdfExporter(target=FILENAME))
+
+
+def import_dataset(mmap_mode=None):
+    """Import dataset from the ADF file."""
+    dataset = aspecd.dataset.Dataset()
+    importer = aspecd.io.AdfImporter(source=FILENAME)
+    importer.parameters["mmap_mode"] = mmap_mode
+    dataset.import_from(importer)
+    return dataset
+
+
+def slice_extraction(dataset):
+    """Extract single slice from the dataset."""
+    step = aspecd.processing.SliceExtraction()
+    step.parameters["position"] = 42
+    dataset.process(step)
+
+
+def range_extraction(dataset):
+    """Extract range from the dataset."""
+    step = aspecd.processing.RangeExtraction()
+    step.parameters["range"] = [[0, 100], [0, 100]]
+    dataset.process(step)
+
+
+def characteristics(dataset):
+    """Determine the maximum of the dataset."""
+    step = aspecd.analysis.BasicCharacteristics()
+    step.parameters["kind"] = "max"
+    dataset.analyse(step)
+
+
+def peak_memory(function, mmap_mode=None):
+    """Return peak memory used by importing and processing in MB."""
+    tracemalloc.start()
+    function(import_dataset(mmap_mode))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main():
+    """Measure peak memory with and without memory-mapping."""
+    create_file()
+    print(f"{'step':>18} {'in memory / MB':>15} {'mmap / MB':>10}")
+    try:
+        for function in (slice_extraction, range_extraction, characteristics):
+            # Import once to exclude memory used by importing modules
+            peak_memory(function, mmap_mode="c")
+            print(
+                f"{function.__name__:>18} {peak_memory(function):>15.1f}"
+                f" {peak_memory(function, mmap_mode='c'):>10.1f}"
+            )
+    finally:
+        os.remove(FILENAME + ".adf")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark: creating and saving figures of many datasets in parallel.
+
+If ``plot_workers`` in the settings of a recipe is larger than one,
+:class:`aspecd.tasks.SingleplotTask` creates and saves the figures of the
+datasets in a pool of processes. As reference serves creating and saving
+the figures one after the other. Note that a speedup requires several
+CPU cores.
+
+Run from the project root::
+
+    python benchmarks/benchmark_parallel_plotting.py
+
+"""
+
+import os
+import shutil
+import tempfile
+import timeit
+
+import numpy as np
+
+import aspecd.dataset
+import aspecd.io
+import aspecd.tasks
+
+
+def create_recipe(number_of_datasets=100, plot_workers=1, directory=""):
+    """Create recipe plotting each of the datasets to a PDF file."""
+    recipe = aspecd.tasks.Recipe()
+    dataset_factory = aspecd.dataset.DatasetFactory()
+    dataset_factory.importer_factory = aspecd.io.DatasetImporterFactory()
+    recipe.dataset_factory = dataset_factory
+    labels = [f"dataset{number}" for number in range(number_of_datasets)]
+    recipe.from_dict(
+        {
+            "datasets": labels,
+            "settings": {"plot_workers": plot_workers},
+            "directories": {"output": directory},
+            "tasks": [
+                {
+                    "kind": "singleplot",
+                    "type": "SinglePlotter1D",
+                    "apply_to": labels,
+                }
+            ],
+        }
+    )
+    for dataset in recipe.datasets.values():
+        dataset.data.data = np.random.random(1000)
+    return recipe
+
+
+def cook(recipe):
+    """Cook the recipe, performing the plotting task."""
+    chef = aspecd.tasks.Chef(recipe=recipe)
+    chef.cook()
+
+
+def main():
+    """Time creating and saving figures serially and in parallel."""
+    print(f"CPU cores: {os.cpu_count()}")
+    print(f"{'datasets':>9} {'serial / s':>11} {'4 workers / s':>14}")
+    directory = tempfile.mkdtemp()
+    try:
+        for number_of_datasets in [10, 100, 500]:
+            times = []
+            for plot_workers in (1, 4):
+                timer = timeit.Timer(
+                    lambda: cook(
+                        create_recipe(
+                            number_of_datasets, plot_workers, directory
+                        )
+                    )
+                )
+                times.append(min(timer.repeat(3, 1)))
+            print(
+                f"{number_of_datasets:>9} {times[0]:>11.2f}"
+                f" {times[1]:>14.2f}"
+            )
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark: finding peaks in all slices of 2D datasets.
+
+:class:`aspecd.analysis.PeakFinding` finds peaks in all slices of a 2D
+dataset in one analysis step, optionally using a pool of processes. As
+reference serves extracting each slice using
+:class:`aspecd.processing.SliceExtraction` and finding the peaks in the
+resulting 1D dataset, as necessary with earlier versions of ASpecD.
+
+Run from the project root::
+
+    python benchmarks/benchmark_peak_finding.py
+
+"""
+
+import copy
+import timeit
+
+import numpy as np
+
+import aspecd.analysis
+import aspecd.dataset
+import aspecd.processing
+
+
+def create_dataset(number_of_slices=1000, number_of_points=1000):
+    """Create 2D dataset with noisy sine curves as slices."""
+    dataset = aspecd.dataset.Dataset()
+    data = np.sin(np.linspace(0, 8 * np.pi, number_of_points))
+    data = np.tile(data, (number_of_slices, 1)).T
+    dataset.data.data = data + np.random.random(data.shape) * 0.2
+    return dataset
+
+
+def peak_finding(dataset, jobs=1):
+    """Find peaks in all slices at once."""
+    analysis_step = aspecd.analysis.PeakFinding()
+    analysis_step.parameters["prominence"] = 0.5
+    analysis_step.jobs = jobs
+    dataset.analyse(analysis_step)
+
+
+def peak_finding_parallel(dataset):
+    """Find peaks in all slices at once using four processes."""
+    peak_finding(dataset, jobs=4)
+
+
+def peak_finding_per_slice(dataset):
+    """Extract each slice and find its peaks, as in earlier versions."""
+    for position in range(dataset.data.data.shape[1]):
+        slice_ = copy.deepcopy(dataset)
+        extraction = aspecd.processing.SliceExtraction()
+        extraction.parameters["position"] = position
+        extraction.parameters["axis"] = 1
+        slice_.process(extraction)
+        peak_finding(slice_)
+
+
+def main():
+    """Time finding peaks in all slices at once and per slice."""
+    print(
+        f"{'slices':>8} {'batched / ms':>13} {'4 jobs / ms':>12}"
+        f" {'per slice / ms':>15}"
+    )
+    for number_of_slices in [10, 100, 1000]:
+        dataset = create_dataset(number_of_slices)
+        times = []
+        for function in (
+            peak_finding,
+            peak_finding_parallel,
+            peak_finding_per_slice,
+        ):
+            timer = timeit.Timer(lambda: function(dataset))
+            times.append(min(timer.repeat(3, 1)) * 1e3)
+        print(
+            f"{number_of_slices:>8} {times[0]:>13.1f} {times[1]:>12.1f}"
+            f" {times[2]:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark: frame rate re-plotting datasets changing over time.
+
+:meth:`aspecd.plotting.Plotter.update` replaces the data of the drawings
+of an existing plot and redraws only the drawings (using blitting) as long
+as the axes limits do not change. As reference serves plotting the
+dataset anew for each frame, as necessary with earlier versions of ASpecD.
+For each frame, the data of the dataset change and the figure is rendered
+(using the Agg backend). Frame rates are given in frames per second, for
+fixed axes limits and for axes limits following the data.
+
+Run from the project root::
+
+    python benchmarks/benchmark_plot_update.py
+
+"""
+
+import time
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+
+import aspecd.dataset
+import aspecd.plotting
+
+mpl.use("agg")
+
+
+def create_dataset(kind="1D", number_of_points=1000):
+    """Create 1D or 2D dataset with random data."""
+    dataset = aspecd.dataset.Dataset()
+    if kind == "1D":
+        dataset.data.data = np.random.random(number_of_points)
+    else:
+        dataset.data.data = np.random.random((number_of_points, 100))
+    return dataset
+
+
+def create_plotter(kind="1D", fixed_limits=True):
+    """Create plotter, optionally with fixed axes and colour limits."""
+    if kind == "1D":
+        plotter = aspecd.plotting.SinglePlotter1D()
+        if fixed_limits:
+            plotter.properties.axes.ylim = [-1, 2]
+    else:
+        plotter = aspecd.plotting.SinglePlotter2D()
+        plotter.parameters["show_colorbar"] = True
+        if fixed_limits:
+            plotter.properties.drawing.norm_parameters = {
+                "vmin": 0,
+                "vmax": 2,
+            }
+    return plotter
+
+
+def frame_rate_plot(kind="1D", fixed_limits=True, number_of_frames=50):
+    """Plot dataset anew for each frame, as in earlier versions."""
+    dataset = create_dataset(kind)
+    start = time.perf_counter()
+    for _ in range(number_of_frames):
+        dataset.data.data = np.random.random(dataset.data.data.shape)
+        plotter = create_plotter(kind, fixed_limits)
+        plotter.plot(dataset=dataset)
+        plotter.figure.canvas.draw()
+        plt.close(plotter.figure)
+    return number_of_frames / (time.perf_counter() - start)
+
+
+def frame_rate_update(kind="1D", fixed_limits=True, number_of_frames=50):
+    """Update plot for each frame."""
+    dataset = create_dataset(kind)
+    plotter = create_plotter(kind, fixed_limits)
+    plotter.plot(dataset=dataset)
+    plotter.update()
+    start = time.perf_counter()
+    for frame in range(number_of_frames):
+        dataset.data.data = np.random.random(dataset.data.data.shape)
+        if not fixed_limits:
+            dataset.data.data *= 1 + frame / number_of_frames
+        plotter.update()
+    rate = number_of_frames / (time.perf_counter() - start)
+    plt.close(plotter.figure)
+    return rate
+
+
+def main():
+    """Print frame rates plotting anew and updating plots."""
+    print(
+        f"{'plot':>4} {'limits':>8} {'plot / s^-1':>12} {'update / s^-1':>14}"
+    )
+    for kind in ("1D", "2D"):
+        for fixed_limits in (True, False):
+            limits = "fixed" if fixed_limits else "changing"
+            print(
+                f"{kind:>4} {limits:>8}"
+                f" {frame_rate_plot(kind, fixed_limits):>12.1f}"
+                f" {frame_rate_update(kind, fixed_limits):>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
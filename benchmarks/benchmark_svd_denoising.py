@@ -0,0 +1,61 @@
+"""Benchmark: denoising long signals using SVD.
+
+:class:`aspecd.processing.Denoising1DSVD` decomposes a partial circulant
+matrix constructed from the signal, with one row per shift of the signal,
+and determines the rank of its approximation from the leading singular
+vectors. The "randomised" solver computes only those leading singular
+values and vectors, reusing them in each step of the detrending. As
+reference serves the "full" solver, computing all singular values and
+vectors.
+
+Run from the project root::
+
+    python benchmarks/benchmark_svd_denoising.py
+
+"""
+
+import copy
+import timeit
+
+import numpy as np
+
+import aspecd.dataset
+import aspecd.processing
+
+
+def create_dataset(number_of_points=1000):
+    """Create 1D dataset with noisy sinc function."""
+    dataset = aspecd.dataset.Dataset()
+    data = np.sinc(np.linspace(-10, 10, number_of_points))
+    dataset.data.data = data + np.random.normal(
+        scale=0.05, size=number_of_points
+    )
+    return dataset
+
+
+def denoising(dataset, solver="full"):
+    """Denoise the dataset using the given solver."""
+    processing_step = aspecd.processing.Denoising1DSVD()
+    processing_step.parameters["solver"] = solver
+    copy.deepcopy(dataset).process(processing_step)
+
+
+def denoising_randomised(dataset):
+    """Denoise the dataset using the randomised solver."""
+    denoising(dataset, solver="randomised")
+
+
+def main():
+    """Time denoising with the full and the randomised solver."""
+    print(f"{'points':>7} {'full / ms':>10} {'randomised / ms':>16}")
+    for number_of_points in [1000, 2000, 4000, 8000]:
+        dataset = create_dataset(number_of_points)
+        times = []
+        for function in (denoising, denoising_randomised):
+            timer = timeit.Timer(lambda: function(dataset))
+            times.append(min(timer.repeat(3, 1)) * 1e3)
+        print(f"{number_of_points:>7} {times[0]:>10.1f} {times[1]:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark: creating history records.
+
+Each history record contains information on the system, collected by
+:class:`aspecd.system.SystemInfo`. This information is collected once per
+package and process and shared between all records. As reference serves
+collecting the information anew for each record, as done by earlier
+versions of ASpecD.
+
+Run from the project root::
+
+    python benchmarks/benchmark_system_info.py
+
+"""
+
+import timeit
+
+import aspecd.history
+import aspecd.system
+
+
+def create_record():
+    """Create history record using the cached system information."""
+    aspecd.history.HistoryRecord(package="numpy")
+
+
+def create_record_uncached():
+    """Create history record collecting the system information anew."""
+    aspecd.system.clear_cache()
+    aspecd.history.HistoryRecord(package="numpy")
+
+
+def main():
+    """Time creating history records with and without cache."""
+    print(f"{'cached / ms':>12} {'uncached / ms':>14}")
+    times = []
+    for function in (create_record, create_record_uncached):
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        times.append(min(timer.repeat(3, number)) / number * 1e3)
+    print(f"{times[0]:>12.3f} {times[1]:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
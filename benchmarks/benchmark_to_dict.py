@@ -0,0 +1,45 @@
+"""Benchmark: creating dicts from objects using ToDictMixin.
+
+:meth:`aspecd.utils.ToDictMixin.to_dict` is called for each task in
+recipe-driven data analysis (twice per dataset for processing tasks),
+for each history record, and for each export. Its cost is dominated by
+traversing the (potentially long) history of a dataset.
+
+Run from the project root::
+
+    python benchmarks/benchmark_to_dict.py
+
+"""
+
+import timeit
+
+import numpy as np
+
+import aspecd.dataset
+import aspecd.processing
+
+
+def create_dataset(history_length=0):
+    """Create dataset with a history of the given length."""
+    dataset = aspecd.dataset.Dataset()
+    dataset.data.data = np.random.random([100, 100])
+    processing_step = aspecd.processing.ScalarAlgebra()
+    processing_step.parameters = {"kind": "add", "value": 1}
+    for _ in range(history_length):
+        dataset.process(processing_step)
+    return dataset
+
+
+def main():
+    """Time dataset.to_dict() for different history lengths."""
+    print(f"{'steps':>8} {'to_dict / ms':>14}")
+    for history_length in [0, 10, 100, 1000]:
+        dataset = create_dataset(history_length)
+        timer = timeit.Timer(dataset.to_dict)
+        number, _ = timer.autorange()
+        time = min(timer.repeat(3, number)) / number * 1e3
+        print(f"{history_length:>8} {time:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: cost of undo depending on the length of the history.
+
+Thanks to the checkpoints of a dataset (see
+:class:`aspecd.dataset.Checkpoints`), undoing the last processing step
+should take about the same time regardless of the length of the history.
+
+Run from the project root::
+
+    python benchmarks/benchmark_undo.py
+
+"""
+
+import timeit
+
+import numpy as np
+
+import aspecd.dataset
+import aspecd.processing
+
+
+def create_dataset(history_length=0, interval=10):
+    """Create dataset with a history of the given length."""
+    dataset = aspecd.dataset.Dataset()
+    dataset.checkpoints.interval = interval
+    dataset.data.data = np.random.random(10000)
+    processing_step = aspecd.processing.ScalarAlgebra()
+    processing_step.parameters = {"kind": "add", "value": 1}
+    processing_step.undoable = False
+    for _ in range(history_length):
+        dataset.process(processing_step)
+    return dataset
+
+
+def undo(dataset):
+    """Undo last step and redo it again to keep the history length."""
+    dataset.undo()
+    dataset.redo()
+
+
+def main():
+    """Time undo for different history lengths with/without checkpoints."""
+    print(f"{'steps':>8} {'checkpoints / ms':>18} {'replay all / ms':>18}")
+    for history_length in [10, 50, 100, 200, 400]:
+        times = []
+        for interval in [10, 0]:
+            dataset = create_dataset(history_length, interval=interval)
+            timer = timeit.Timer(lambda: undo(dataset))
+            number, _ = timer.autorange()
+            times.append(min(timer.repeat(3, number)) / number * 1e3)
+        print(f"{history_length:>8} {times[0]:>18.3f} {times[1]:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
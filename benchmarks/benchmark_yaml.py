@@ -0,0 +1,119 @@
+"""Benchmark: reading and writing YAML files.
+
+Recipes, histories of cooked recipes, and datasets (in ADF files) are all
+stored as YAML files, read and written by :class:`aspecd.utils.Yaml`.
+Its loader and dumper are C-accelerated if PyYAML has been built with
+libyaml (see :class:`aspecd.utils.YamlLoader`). The pure-Python loader
+and dumper with the same resolvers serve as reference.
+
+Run from the project root::
+
+    python benchmarks/benchmark_yaml.py
+
+"""
+
+import timeit
+
+import numpy as np
+import oyaml as yaml
+
+import aspecd.dataset
+import aspecd.processing
+import aspecd.system
+import aspecd.utils
+
+
+class PythonLoader(yaml.SafeLoader):
+    """Pure-Python loader with the resolvers of the YamlLoader."""
+
+    yaml_implicit_resolvers = aspecd.utils.YamlLoader.yaml_implicit_resolvers
+
+
+class PythonDumper(yaml.SafeDumper):
+    """Pure-Python dumper with the resolvers of the YamlDumper."""
+
+    yaml_implicit_resolvers = aspecd.utils.YamlDumper.yaml_implicit_resolvers
+    yaml_representers = aspecd.utils.YamlDumper.yaml_representers
+
+
+def create_recipe(number_of_tasks=500):
+    """Create dict resembling a recipe with the given number of tasks."""
+    tasks = []
+    for number in range(number_of_tasks):
+        tasks.append(
+            {
+                "kind": "processing",
+                "type": "Normalisation",
+                "properties": {
+                    "parameters": {"kind": "amplitude", "range": [0, 1e-3]},
+                    "comment": f"Normalisation {number}",
+                },
+                "apply_to": ["dataset1", "dataset2"],
+                "result": f"normalised{number}",
+            }
+        )
+    return {
+        "format": {"type": "ASpecD recipe", "version": "0.3"},
+        "settings": {"autosave_plots": False},
+        "datasets": ["dataset1", "dataset2"],
+        "tasks": tasks,
+    }
+
+
+def create_history(number_of_tasks=500):
+    """Create dict resembling the history of a cooked recipe."""
+    history = create_recipe(number_of_tasks)
+    history["info"] = {"start": "2021-01-01 00:00:00", "end": ""}
+    history["system_info"] = aspecd.system.SystemInfo().to_dict()
+    return history
+
+
+def create_dataset(history_length=200):
+    """Create dict of a dataset with a history of the given length."""
+    dataset = aspecd.dataset.Dataset()
+    dataset.data.data = np.random.random(50)
+    processing_step = aspecd.processing.ScalarAlgebra()
+    processing_step.parameters = {"kind": "add", "value": 1}
+    for _ in range(history_length):
+        dataset.process(processing_step)
+    yaml_ = aspecd.utils.Yaml()
+    yaml_.dict = dataset.to_dict()
+    yaml_.numpy_array_to_list = True
+    yaml_.serialise_numpy_arrays()
+    return yaml_.dict
+
+
+def time(function):
+    """Return best time of calling the function in ms."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(3, number)) / number * 1e3
+
+
+def main():
+    """Time reading and writing with the C and Python loader/dumper."""
+    print(
+        f"{'file':>8} {'lines':>7} {'read C / ms':>12} {'read Py / ms':>13}"
+        f" {'write C / ms':>13} {'write Py / ms':>14}"
+    )
+    contents = {
+        "recipe": create_recipe(),
+        "history": create_history(),
+        "dataset": create_dataset(),
+    }
+    for name, dict_ in contents.items():
+        stream = yaml.dump(dict_, Dumper=aspecd.utils.YamlDumper)
+        times = [
+            time(lambda: yaml.load(stream, Loader=aspecd.utils.YamlLoader)),
+            time(lambda: yaml.load(stream, Loader=PythonLoader)),
+            time(lambda: yaml.dump(dict_, Dumper=aspecd.utils.YamlDumper)),
+            time(lambda: yaml.dump(dict_, Dumper=PythonDumper)),
+        ]
+        print(
+            f"{name:>8} {stream.count(chr(10)):>7} {times[0]:>12.1f}"
+            f" {times[1]:>13.1f} {times[2]:>13.1f} {times[3]:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -76,6 +76,7 @@ setuptools.setup(
     entry_points={
         "console_scripts": [
             "serve = aspecd.tasks:serve",
+            "adfgc = aspecd.io:adfgc",
         ],
     },
     include_package_data=True,
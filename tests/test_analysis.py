@@ -425,6 +425,57 @@ class TestAggregatedAnalysisStep(unittest.TestCase):
             list(self.analysis.result._origdata.data),
         )
 
+    def test_has_jobs_attribute(self):
+        self.assertTrue(hasattr(self.analysis, "jobs"))
+
+    def test_analyse_adds_analysis_to_each_dataset(self):
+        self.analysis.datasets.append(aspecd.dataset.Dataset())
+        self.analysis.datasets[1].data.data = np.ones(5)
+        self.analysis.analyse()
+        for dataset in self.analysis.datasets:
+            self.assertEqual(1, len(dataset.analyses))
+            self.assertEqual("analysis", dataset.tasks[0]["kind"])
+
+    def test_analyse_records_parameters_in_analyses(self):
+        self.analysis.analyse()
+        self.assertEqual(
+            "min",
+            self.analysis.datasets[0].analyses[0].analysis.parameters["kind"],
+        )
+
+    def test_analyse_does_not_share_parameters_between_datasets(self):
+        self.analysis.parameters["range"] = [0, 2]
+        self.analysis.datasets.append(aspecd.dataset.Dataset())
+        self.analysis.datasets[1].data.data = np.ones(5)
+        self.analysis.analyse()
+        first, second = [
+            dataset.analyses[0].analysis.parameters
+            for dataset in self.analysis.datasets
+        ]
+        self.assertIsNot(first["range"], second["range"])
+
+    def test_analyse_shares_history_in_analyses(self):
+        processing_step = aspecd.processing.ScalarAlgebra()
+        processing_step.parameters = {"kind": "add", "value": 1}
+        self.analysis.datasets[0].process(processing_step)
+        self.analysis.analyse()
+        self.assertIs(
+            self.analysis.datasets[0].history[0],
+            self.analysis.datasets[0].analyses[0].analysis.preprocessing[0],
+        )
+
+    def test_analyse_with_jobs_gives_same_result(self):
+        for number in range(1, 5):
+            self.analysis.datasets.append(aspecd.dataset.Dataset())
+            self.analysis.datasets[number].data.data = np.ones(5) * number
+        self.analysis.jobs = 2
+        self.analysis.analyse()
+        np.testing.assert_allclose(
+            np.arange(5), self.analysis.result.data.data
+        )
+        for dataset in self.analysis.datasets:
+            self.assertEqual(1, len(dataset.analyses))
+
 
 class TestPreprocessing(unittest.TestCase):
     def setUp(self):
@@ -817,7 +868,7 @@ class TestPeakFinding(unittest.TestCase):
         self.assertIn("peak finding", self.analysis.description.lower())
 
     def test_with_nd_dataset_raises(self):
-        self.dataset.data.data = np.random.random([5, 5])
+        self.dataset.data.data = np.random.random([5, 5, 5])
         with self.assertRaises(aspecd.exceptions.NotApplicableToDatasetError):
             self.dataset.analyse(self.analysis)
 
@@ -1010,6 +1061,112 @@ class TestPeakFinding(unittest.TestCase):
             np.stack((result, heights), axis=1), analysis.result
         )
 
+    def test_has_jobs_attribute(self):
+        self.assertTrue(hasattr(self.analysis, "jobs"))
+
+    def test_has_axis_parameter(self):
+        self.assertIn("axis", self.analysis.parameters)
+
+    def test_with_2d_dataset_and_wrong_axis_raises(self):
+        self.dataset.data.data = np.tile(self.dataset.data.data, (3, 1))
+        self.analysis.parameters["axis"] = 2
+        with self.assertRaisesRegex(IndexError, "Axis 2 out of bounds"):
+            self.dataset.analyse(self.analysis)
+
+    def test_analyse_2d_returns_slice_and_peak_positions(self):
+        self.dataset.data.data = np.stack(
+            (self.dataset.data.data, self.noisy_dataset.data.data), axis=1
+        )
+        self.dataset.data.axes[0].values = np.linspace(340, 350, 1000)
+        self.dataset.data.axes[1].values = np.asarray([2.0, 4.0])
+        analysis = self.dataset.analyse(self.analysis)
+        first, _ = scipy.signal.find_peaks(self.dataset.data.data[:, 0])
+        second, _ = scipy.signal.find_peaks(self.dataset.data.data[:, 1])
+        self.assertEqual((len(first) + len(second), 2), analysis.result.shape)
+        np.testing.assert_allclose(
+            [2.0] * len(first) + [4.0] * len(second), analysis.result[:, 0]
+        )
+        np.testing.assert_allclose(
+            self.dataset.data.axes[0].values[np.concatenate((first, second))],
+            analysis.result[:, 1],
+        )
+
+    def test_analyse_2d_along_second_axis(self):
+        self.dataset.data.data = np.tile(self.dataset.data.data, (3, 1))
+        self.analysis.parameters["axis"] = 1
+        analysis = self.dataset.analyse(self.analysis)
+        peaks, _ = scipy.signal.find_peaks(self.dataset.data.data[0])
+        np.testing.assert_allclose(
+            np.repeat(np.arange(3), len(peaks)), analysis.result[:, 0]
+        )
+        np.testing.assert_allclose(np.tile(peaks, 3), analysis.result[:, 1])
+
+    def test_analyse_2d_returns_intensities(self):
+        self.dataset.data.data = np.tile(self.dataset.data.data, (3, 1)).T
+        self.analysis.parameters["return_intensities"] = True
+        analysis = self.dataset.analyse(self.analysis)
+        peaks, _ = scipy.signal.find_peaks(self.dataset.data.data[:, 0])
+        self.assertEqual(3, analysis.result.shape[1])
+        np.testing.assert_allclose(
+            np.tile(self.dataset.data.data[peaks, 0], 3),
+            analysis.result[:, 2],
+        )
+
+    def test_analyse_2d_returns_negative_peaks(self):
+        self.dataset.data.data = np.tile(self.dataset.data.data, (3, 1)).T
+        self.analysis.parameters["negative_peaks"] = True
+        analysis = self.dataset.analyse(self.analysis)
+        positive, _ = scipy.signal.find_peaks(self.dataset.data.data[:, 0])
+        negative, _ = scipy.signal.find_peaks(-self.dataset.data.data[:, 0])
+        result = np.sort(np.concatenate((positive, negative)))
+        np.testing.assert_allclose(np.tile(result, 3), analysis.result[:, 1])
+
+    def test_analyse_2d_returns_indices_and_properties(self):
+        self.dataset.data.data = np.tile(self.dataset.data.data, (3, 1)).T
+        self.analysis.parameters["return_properties"] = True
+        self.analysis.parameters["prominence"] = 0.5
+        analysis = self.dataset.analyse(self.analysis)
+        peaks, properties = scipy.signal.find_peaks(
+            self.dataset.data.data[:, 0], prominence=0.5
+        )
+        indices, result_properties = analysis.result
+        np.testing.assert_array_equal(
+            np.repeat(np.arange(3), len(peaks)), indices[:, 0]
+        )
+        np.testing.assert_array_equal(np.tile(peaks, 3), indices[:, 1])
+        np.testing.assert_allclose(
+            np.tile(properties["prominences"], 3),
+            result_properties["prominences"],
+        )
+
+    def test_analyse_2d_returns_dataset(self):
+        self.dataset.data.data = np.tile(self.dataset.data.data, (3, 1)).T
+        self.analysis.parameters["return_dataset"] = True
+        analysis = self.dataset.analyse(self.analysis)
+        peaks, _ = scipy.signal.find_peaks(self.dataset.data.data[:, 0])
+        self.assertEqual(
+            aspecd.dataset.CalculatedDataset, type(analysis.result)
+        )
+        self.assertEqual(
+            self.dataset.data.data.shape, analysis.result.data.data.shape
+        )
+        self.assertEqual(
+            3 * len(peaks),
+            np.count_nonzero(~np.isnan(analysis.result.data.data)),
+        )
+        np.testing.assert_allclose(
+            self.dataset.data.data[peaks, 1],
+            analysis.result.data.data[peaks, 1],
+        )
+
+    def test_analyse_2d_with_jobs_gives_same_result(self):
+        self.dataset.data.data = np.tile(self.noisy_dataset.data.data, (5, 1))
+        self.analysis.parameters["axis"] = 1
+        reference = self.dataset.analyse(self.analysis)
+        self.analysis.jobs = 2
+        analysis = self.dataset.analyse(self.analysis)
+        np.testing.assert_allclose(reference.result, analysis.result)
+
 
 class TestPowerDensitySpectrum(unittest.TestCase):
     def setUp(self):
@@ -1,7 +1,10 @@
 """Tests for datset."""
 
+import copy
 import unittest
+import unittest.mock
 import os
+import tracemalloc
 
 import numpy as np
 
@@ -240,6 +243,91 @@ class TestDatasetUndo(unittest.TestCase):
         with self.assertRaises(aspecd.exceptions.UndoStepUndoableError):
             self.dataset.undo()
 
+    def test_undo_restores_data(self):
+        self.dataset.data.data = np.arange(5.0)
+        processing_step = processing.ScalarAlgebra()
+        processing_step.parameters = {"kind": "add", "value": 1}
+        processing_step.undoable = False
+        for _ in range(25):
+            self.dataset.process(processing_step)
+        self.dataset.undo()
+        self.dataset.undo()
+        np.testing.assert_allclose(self.dataset.data.data, np.arange(5) + 23)
+
+    def test_undo_to_beginning_restores_initial_data(self):
+        self.dataset.data.data = np.arange(5.0)
+        processing_step = processing.ScalarAlgebra()
+        processing_step.parameters = {"kind": "add", "value": 1}
+        processing_step.undoable = False
+        for _ in range(3):
+            self.dataset.process(processing_step)
+        for _ in range(3):
+            self.dataset.undo()
+        np.testing.assert_allclose(self.dataset.data.data, np.arange(5))
+
+    def test_undo_replays_only_steps_after_checkpoint(self):
+        self.dataset.checkpoints.interval = 5
+        processing_step = processing.SingleProcessingStep()
+        for _ in range(50):
+            self.dataset.process(processing_step)
+        with unittest.mock.patch.object(
+            self.dataset,
+            "_apply_history_record",
+            wraps=self.dataset._apply_history_record,
+        ) as apply:
+            self.dataset.undo()
+        self.assertLess(apply.call_count, 5)
+
+    def test_undo_without_checkpoints_starts_from_origdata(self):
+        self.dataset.checkpoints.interval = 0
+        processing_step = processing.SingleProcessingStep()
+        for _ in range(3):
+            self.dataset.process(processing_step)
+        self.dataset.checkpoints.clear()
+        self.dataset._origdata.data = np.ones(3)
+        self.dataset._origdata_position = 0
+        self.dataset.undo()
+        np.testing.assert_allclose(self.dataset.data.data, np.ones(3))
+
+    def test_undo_after_evicting_checkpoints_restores_data(self):
+        self.dataset.data.data = np.zeros(1)
+        self.dataset.checkpoints.maximum_number = 1
+        processing_step = processing.ScalarAlgebra()
+        processing_step.parameters = {"kind": "add", "value": 1}
+        processing_step.undoable = False
+        for _ in range(25):
+            self.dataset.process(processing_step)
+        for _ in range(6):
+            self.dataset.undo()
+        self.assertEqual(18, self.dataset._history_pointer)
+        np.testing.assert_allclose(self.dataset.data.data, [19.0])
+
+    def test_undo_after_evicting_by_memory_limit_restores_data(self):
+        self.dataset.data.data = np.zeros(1)
+        self.dataset.checkpoints.interval = 1
+        self.dataset.checkpoints.memory_limit = 1
+        processing_step = processing.ScalarAlgebra()
+        processing_step.parameters = {"kind": "add", "value": 1}
+        processing_step.undoable = False
+        for _ in range(5):
+            self.dataset.process(processing_step)
+        for _ in range(3):
+            self.dataset.undo()
+        np.testing.assert_allclose(self.dataset.data.data, [2.0])
+
+    def test_undo_before_imported_history_raises(self):
+        processing_step = processing.SingleProcessingStep()
+        for _ in range(2):
+            self.dataset.process(processing_step)
+        imported_dataset = dataset.Dataset()
+        imported_dataset.history = self.dataset.history
+        imported_dataset._history_pointer = self.dataset._history_pointer
+        imported_dataset.import_from(io.DatasetImporter())
+        with self.assertRaises(
+            aspecd.exceptions.UndoAtBeginningOfHistoryError
+        ):
+            imported_dataset.undo()
+
 
 class TestDatasetRedo(unittest.TestCase):
     def setUp(self):
@@ -271,6 +359,18 @@ class TestDatasetRedo(unittest.TestCase):
         self.dataset.redo()
         self.assertEqual(self.dataset._history_pointer, history_pointer + 1)
 
+    def test_redo_reapplies_processing_step(self):
+        self.dataset.data.data = np.arange(5.0)
+        processing_step = processing.ScalarAlgebra()
+        processing_step.parameters = {"kind": "add", "value": 1}
+        processing_step.undoable = False
+        for _ in range(12):
+            self.dataset.process(processing_step)
+        self.dataset.undo()
+        self.dataset.undo()
+        self.dataset.redo()
+        np.testing.assert_allclose(self.dataset.data.data, np.arange(5) + 11)
+
 
 class TestDatasetIO(unittest.TestCase):
     def setUp(self):
@@ -297,6 +397,22 @@ class TestDatasetIO(unittest.TestCase):
         self.assertTrue(hasattr(self.dataset, "export_to"))
         self.assertTrue(callable(self.dataset.export_to))
 
+    def test_modifying_data_handed_out_keeps_origdata(self):
+        self.dataset.data.data = np.zeros(3)
+        array = self.dataset.data.data
+        self.dataset.process(processing.SingleProcessingStep())
+        array[0] = 42
+        np.testing.assert_allclose(self.dataset._origdata.data, np.zeros(3))
+
+    def test_origdata_shares_data_after_processing(self):
+        self.dataset.data.data = np.random.random(10)
+        self.dataset.process(processing.SingleProcessingStep())
+        self.assertTrue(
+            np.shares_memory(
+                self.dataset.data._data, self.dataset._origdata._data
+            )
+        )
+
     def test_import_from_sets_origdata(self):
         importer = io.DatasetImporter()
         old_origdata = self.dataset._origdata
@@ -307,6 +423,25 @@ class TestDatasetIO(unittest.TestCase):
         self.dataset.save(filename=self.filename)
         self.assertTrue(os.path.exists(self.filename + ".adf"))
 
+    def test_load_shares_preprocessing_records_with_history(self):
+        self.dataset.data.data = np.random.random(10)
+        self.dataset.process(processing.Normalisation())
+        analysis_step = aspecd.analysis.BasicCharacteristics()
+        analysis_step.parameters["kind"] = "max"
+        self.dataset.analyse(analysis_step)
+        self.dataset.plot(aspecd.plotting.SinglePlotter1D())
+        self.dataset.save(filename=self.filename)
+        new_dataset = aspecd.dataset.Dataset()
+        new_dataset.load(filename=self.filename)
+        self.assertIs(
+            new_dataset.history[0],
+            new_dataset.analyses[0].analysis.preprocessing[0],
+        )
+        self.assertIs(
+            new_dataset.history[0],
+            new_dataset.representations[0].plot.preprocessing[0],
+        )
+
     def test_load_sets_data(self):
         self.dataset.data.data = np.random.random(10)
         self.dataset.save(filename=self.filename)
@@ -340,6 +475,16 @@ class TestDatasetProcessingWithHistory(unittest.TestCase):
         self.dataset.strip_history()
         self.dataset.process(self.processingStep)
 
+    def test_stripping_leading_history_discards_checkpoints(self):
+        self.dataset.checkpoints.interval = 1
+        self.dataset.strip_history()
+        for _ in range(3):
+            self.dataset.process(self.processingStep)
+        self.dataset.undo()
+        self.dataset.undo()
+        self.dataset.strip_history()
+        self.assertEqual([-1, 0], self.dataset.checkpoints.positions)
+
 
 class TestDatasetAnalysis(unittest.TestCase):
     def setUp(self):
@@ -376,15 +521,23 @@ class TestDatasetAnalysis(unittest.TestCase):
             len(self.dataset.history), len(analysis_.analysis.preprocessing)
         )
 
-    def test_added_analysis_record_history_is_deepcopy(self):
+    def test_added_analysis_record_history_shares_records(self):
         processing_step = processing.SingleProcessingStep()
         self.dataset.process(processing_step)
         self.dataset.analyse(self.analysis_step)
         analysis_ = self.dataset.analyses[-1]
-        self.assertNotEqual(
-            self.dataset.history, analysis_.analysis.preprocessing
+        self.assertIs(
+            self.dataset.history[0], analysis_.analysis.preprocessing[0]
         )
 
+    def test_added_analysis_record_history_is_not_extended(self):
+        processing_step = processing.SingleProcessingStep()
+        self.dataset.process(processing_step)
+        self.dataset.analyse(self.analysis_step)
+        self.dataset.process(processing_step)
+        analysis_ = self.dataset.analyses[-1]
+        self.assertEqual(1, len(analysis_.analysis.preprocessing))
+
     def test_analyse_returns_analysis_object(self):
         analysis_step = self.dataset.analyse(self.analysis_step)
         self.assertTrue(
@@ -532,6 +685,12 @@ class TestDatasetPlotting(unittest.TestCase):
             self.dataset.tasks[0]["task"], aspecd.history.PlotHistoryRecord
         )
 
+    def test_append_plot_record_adds_record_and_task(self):
+        history_record = aspecd.history.PlotHistoryRecord()
+        self.dataset.append_plot_record(history_record)
+        self.assertIs(history_record, self.dataset.representations[-1])
+        self.assertIs(history_record, self.dataset.tasks[-1]["task"])
+
 
 class TestDatasetTabulating(unittest.TestCase):
     def setUp(self):
@@ -594,15 +753,23 @@ class TestDatasetRepresentations(unittest.TestCase):
             len(self.dataset.history), len(representation.plot.preprocessing)
         )
 
-    def test_added_plot_record_history_is_deepcopy(self):
+    def test_added_plot_record_history_shares_records(self):
         processing_step = processing.SingleProcessingStep()
         self.dataset.process(processing_step)
         self.dataset.plot(self.plotter)
         representation = self.dataset.representations[-1]
-        self.assertNotEqual(
-            self.dataset.history, representation.plot.preprocessing
+        self.assertIs(
+            self.dataset.history[0], representation.plot.preprocessing[0]
         )
 
+    def test_added_plot_record_history_is_not_extended(self):
+        processing_step = processing.SingleProcessingStep()
+        self.dataset.process(processing_step)
+        self.dataset.plot(self.plotter)
+        representation = self.dataset.representations[-1]
+        self.dataset.process(processing_step)
+        self.assertEqual(1, len(representation.plot.preprocessing))
+
     def test_has_delete_representation_method(self):
         self.assertTrue(hasattr(self.dataset, "delete_representation"))
         self.assertTrue(callable(self.dataset.delete_representation))
@@ -722,6 +889,41 @@ class TestDatasetToDict(unittest.TestCase):
         self.dataset.device_data["foo"] = aspecd.dataset.DeviceData()
         self.assertNotIn("_origdata", self.dataset.to_dict()["device_data"])
 
+    def test_to_dict_shares_dicts_of_preprocessing_records(self):
+        processing_step = aspecd.processing.SingleProcessingStep()
+        self.dataset.process(processing_step)
+        self.dataset.analyse(aspecd.analysis.SingleAnalysisStep())
+        self.dataset.plot(aspecd.plotting.SinglePlotter())
+        dict_ = self.dataset.to_dict()
+        self.assertIs(
+            dict_["history"][0],
+            dict_["analyses"][0]["analysis"]["preprocessing"][0],
+        )
+        self.assertIs(
+            dict_["history"][0],
+            dict_["representations"][0]["plot"]["preprocessing"][0],
+        )
+
+    def test_to_dict_shares_dicts_of_task_records(self):
+        processing_step = aspecd.processing.SingleProcessingStep()
+        self.dataset.process(processing_step)
+        self.dataset.analyse(aspecd.analysis.SingleAnalysisStep())
+        dict_ = self.dataset.to_dict()
+        self.assertIs(dict_["history"][0], dict_["tasks"][0]["task"])
+        self.assertIs(dict_["analyses"][0], dict_["tasks"][1]["task"])
+
+    def test_to_dict_writes_shared_records_only_once_to_yaml(self):
+        processing_step = aspecd.processing.SingleProcessingStep()
+        self.dataset.process(processing_step)
+        for _ in range(3):
+            self.dataset.analyse(aspecd.analysis.SingleAnalysisStep())
+        yaml = aspecd.utils.Yaml()
+        yaml.dict = self.dataset.to_dict()
+        yaml.serialise_numpy_arrays()
+        self.assertEqual(
+            1, yaml.write_stream().count("class_name: aspecd.processing")
+        )
+
 
 class TestDatasetFromDict(unittest.TestCase):
     def setUp(self):
@@ -839,6 +1041,14 @@ class TestDatasetFromDict(unittest.TestCase):
             new_dataset.tasks[0]["task"].to_dict(),
         )
 
+    def test_from_dict_shares_records_of_tasks(self):
+        processing_step = processing.SingleProcessingStep()
+        self.dataset.process(processing_step)
+        dataset_dict = self.dataset.to_dict()
+        new_dataset = dataset.Dataset()
+        new_dataset.from_dict(dataset_dict)
+        self.assertIs(new_dataset.history[0], new_dataset.tasks[0]["task"])
+
     def test_from_dict_sets_package_name(self):
         dataset_dict = self.dataset.to_dict()
         dataset_dict["_package_name"] = "foo"
@@ -933,6 +1143,20 @@ class TestDatasetAlgebra(unittest.TestCase):
             self.dataset.data.data, np.zeros([3, 3, 3])
         )
 
+    def test_add_does_not_copy_data_of_dataset(self):
+        self.dataset.data.data = np.zeros([300, 300])
+        _ = self.dataset.data.data
+        tracemalloc.start()
+        try:
+            result = self.dataset + 1
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 1.5 * result.data.data.nbytes)
+        self.assertFalse(
+            np.shares_memory(self.dataset.data.data, result.data.data)
+        )
+
     def test_in_place_add_operates_on_dataset(self):
         scalar = 42
         self.dataset.data.data = np.zeros([3, 3, 3])
@@ -1005,6 +1229,90 @@ class TestDatasetAlgebra(unittest.TestCase):
         self.assertIsNot(self.dataset, result)
         np.testing.assert_allclose(2, self.dataset.data.data)
 
+    def test_in_place_subtract_operates_on_dataset(self):
+        self.dataset.data.data = np.ones([3, 3, 3])
+        dataset_ = self.dataset
+        self.dataset -= 1
+        self.assertIs(dataset_, self.dataset)
+        np.testing.assert_allclose(0, self.dataset.data.data)
+
+    def test_in_place_multiply_with_dataset_operates_on_dataset(self):
+        factor = dataset.Dataset()
+        factor.data.data = np.ones([3, 3]) * 2
+        self.dataset.data.data = np.ones([3, 3])
+        self.dataset *= factor
+        np.testing.assert_allclose(2, self.dataset.data.data)
+
+    def test_in_place_divide_operates_on_dataset(self):
+        self.dataset.data.data = np.ones([3, 3]) * 2
+        dataset_ = self.dataset
+        self.dataset /= 2
+        self.assertIs(dataset_, self.dataset)
+        np.testing.assert_allclose(1, self.dataset.data.data)
+
+    def test_reflected_subtract(self):
+        self.dataset.data.data = np.ones([3, 3])
+        result = 3 - self.dataset
+        self.assertIsInstance(result, dataset.Dataset)
+        np.testing.assert_allclose(2, result.data.data)
+
+    def test_add_shares_history_records(self):
+        processing_step = processing.Normalisation()
+        self.dataset.data.data = np.ones([3, 3])
+        self.dataset.process(processing_step)
+        result = self.dataset + 1
+        self.assertIs(self.dataset.history[0], result.history[0])
+        self.assertIs(self.dataset.tasks[0]["task"], result.tasks[0]["task"])
+
+    def test_processing_result_does_not_extend_history_of_dataset(self):
+        processing_step = processing.Normalisation()
+        self.dataset.data.data = np.ones([3, 3])
+        self.dataset.process(processing_step)
+        result = self.dataset + 1
+        result.process(processing_step)
+        self.assertEqual(1, len(self.dataset.history))
+        self.assertEqual(1, len(self.dataset.tasks))
+
+    def test_add_copies_metadata(self):
+        self.dataset.data.data = np.ones([3, 3])
+        result = self.dataset + 1
+        self.assertIsNot(self.dataset.metadata, result.metadata)
+
+    def test_add_retains_axes(self):
+        self.dataset.data.data = np.ones([3, 3])
+        self.dataset.data.axes[0].quantity = "magnetic field"
+        result = self.dataset + 1
+        self.assertEqual("magnetic field", result.data.axes[0].quantity)
+
+    def test_to_dict_of_result_contains_new_data(self):
+        self.dataset.data.data = np.ones([3, 3])
+        result = self.dataset + 1
+        np.testing.assert_allclose(2, result.to_dict()["data"]["data"])
+
+    def test_add_with_integer_data_and_float_scalar(self):
+        self.dataset.data.data = np.ones([3, 3], dtype=int)
+        result = self.dataset + 0.5
+        np.testing.assert_allclose(1.5, result.data.data)
+
+    def test_ufunc_returns_dataset(self):
+        self.dataset.data.data = np.ones([3, 3]) * 4
+        result = np.sqrt(self.dataset)
+        self.assertIsInstance(result, dataset.Dataset)
+        np.testing.assert_allclose(2, result.data.data)
+        np.testing.assert_allclose(4, self.dataset.data.data)
+
+    def test_ufunc_with_dataset_as_out_operates_on_dataset(self):
+        self.dataset.data.data = np.ones([3, 3]) * 4
+        result = np.sqrt(self.dataset, out=self.dataset)
+        self.assertIs(self.dataset, result)
+        np.testing.assert_allclose(2, self.dataset.data.data)
+
+    def test_ufunc_with_multiple_outputs_returns_datasets(self):
+        self.dataset.data.data = np.ones([3, 3]) * 1.5
+        fraction, integral = np.modf(self.dataset)
+        self.assertIsInstance(fraction, dataset.Dataset)
+        np.testing.assert_allclose(1, integral.data.data)
+
 
 class TestExperimentalDataset(unittest.TestCase):
     def setUp(self):
@@ -1044,6 +1352,97 @@ class TestCalculatedDataset(unittest.TestCase):
         self.assertTrue(self.dataset._origdata.calculated)
 
 
+class TestCheckpoints(unittest.TestCase):
+    def setUp(self):
+        self.checkpoints = dataset.Checkpoints()
+        self.data = dataset.Data(data=np.zeros(100))
+
+    def test_instantiate_class(self):
+        pass
+
+    def test_has_interval_property(self):
+        self.assertTrue(hasattr(self.checkpoints, "interval"))
+
+    def test_has_memory_limit_property(self):
+        self.assertTrue(hasattr(self.checkpoints, "memory_limit"))
+
+    def test_has_maximum_number_property(self):
+        self.assertTrue(hasattr(self.checkpoints, "maximum_number"))
+
+    def test_dataset_has_checkpoints(self):
+        self.assertIsInstance(
+            dataset.Dataset().checkpoints, dataset.Checkpoints
+        )
+
+    def test_add_copies_data(self):
+        self.checkpoints.add(position=0, data=self.data)
+        self.data.data[0] = 42
+        _, data = self.checkpoints.nearest(0)
+        self.assertEqual(0, data.data[0])
+
+    def test_nearest_returns_nearest_preceding_snapshot(self):
+        for position in [-1, 9, 19]:
+            self.checkpoints.add(position=position, data=self.data)
+        position, _ = self.checkpoints.nearest(17)
+        self.assertEqual(9, position)
+
+    def test_nearest_without_snapshot_returns_none(self):
+        self.checkpoints.add(position=9, data=self.data)
+        self.assertEqual((None, None), self.checkpoints.nearest(5))
+
+    def test_due_respects_interval(self):
+        self.checkpoints.interval = 5
+        self.assertFalse(self.checkpoints.due(3))
+        self.assertTrue(self.checkpoints.due(4))
+
+    def test_due_with_zero_interval_returns_false(self):
+        self.checkpoints.interval = 0
+        self.assertFalse(self.checkpoints.due(9))
+
+    def test_maximum_number_evicts_least_recently_used(self):
+        self.checkpoints.maximum_number = 2
+        for position in [-1, 9]:
+            self.checkpoints.add(position=position, data=self.data)
+        self.checkpoints.nearest(-1)
+        self.checkpoints.add(position=19, data=self.data)
+        self.assertEqual([-1, 19], self.checkpoints.positions)
+
+    def test_memory_limit_evicts_snapshots(self):
+        self.checkpoints.memory_limit = 2.5 * self.data.data.nbytes
+        for position in [-1, 9, 19]:
+            self.checkpoints.add(position=position, data=self.data)
+        self.assertLessEqual(
+            self.checkpoints.size, self.checkpoints.memory_limit
+        )
+        self.assertEqual([-1, 19], self.checkpoints.positions)
+
+    def test_maximum_number_never_evicts_initial_snapshot(self):
+        self.checkpoints.maximum_number = 1
+        for position in [-1, 9, 19]:
+            self.checkpoints.add(position=position, data=self.data)
+        self.assertIn(-1, self.checkpoints)
+
+    def test_size_does_not_copy_shared_data(self):
+        self.checkpoints.add(position=-1, data=self.data)
+        _ = self.checkpoints.size
+        _, data = self.checkpoints.nearest(-1)
+        self.assertTrue(np.shares_memory(self.data._data, data._data))
+
+    def test_discard_after_removes_later_snapshots(self):
+        for position in [-1, 9, 19]:
+            self.checkpoints.add(position=position, data=self.data)
+        self.checkpoints.discard_after(9)
+        self.assertEqual([-1, 9], self.checkpoints.positions)
+
+    def test_clear_removes_snapshots(self):
+        self.checkpoints.add(position=-1, data=self.data)
+        self.checkpoints.clear()
+        self.assertEqual(0, len(self.checkpoints))
+
+    def test_checkpoints_not_in_dataset_dict(self):
+        self.assertNotIn("checkpoints", dataset.Dataset().to_dict())
+
+
 class TestDatasetReference(unittest.TestCase):
     def setUp(self):
         self.reference = dataset.DatasetReference()
@@ -1306,6 +1705,122 @@ class TestData(unittest.TestCase):
         self.assertDictEqual(orig_dict, self.data.to_dict())
         # np.testing.assert_allclose(orig_dict["data"], self.data.data)
 
+    def test_deepcopy_shares_data(self):
+        self.data.data = np.random.random(10)
+        new_data = copy.deepcopy(self.data)
+        self.assertTrue(np.shares_memory(self.data._data, new_data._data))
+
+    def test_modifying_copy_does_not_modify_original(self):
+        self.data.data = np.zeros(10)
+        new_data = copy.deepcopy(self.data)
+        new_data.data += 1
+        np.testing.assert_allclose(self.data.data, np.zeros(10))
+        np.testing.assert_allclose(new_data.data, np.ones(10))
+
+    def test_modifying_original_does_not_modify_copy(self):
+        self.data.data = np.zeros(10)
+        new_data = copy.deepcopy(self.data)
+        self.data.data[0] = 42
+        self.assertEqual(0, new_data.data[0])
+
+    def test_last_owner_does_not_copy_data(self):
+        self.data.data = np.zeros(10)
+        new_data = copy.deepcopy(self.data)
+        new_data.data += 1
+        array = self.data._data
+        self.assertIs(array, self.data.data)
+
+    def test_setting_data_of_copy_keeps_original(self):
+        self.data.data = np.zeros(10)
+        new_data = copy.deepcopy(self.data)
+        new_data.data = np.ones(10)
+        np.testing.assert_allclose(self.data.data, np.zeros(10))
+
+    def test_deepcopy_does_not_copy_data_set_before(self):
+        self.data.data = np.zeros(10)
+        new_data = copy.deepcopy(self.data)
+        new_data.data[0] = 42
+        newer_data = copy.deepcopy(new_data)
+        for value in newer_data.__odict__.values():
+            if isinstance(value, np.ndarray):
+                self.assertTrue(np.shares_memory(newer_data._data, value))
+
+    def test_deepcopy_copies_data_handed_out_before(self):
+        self.data.data = np.zeros(3)
+        array = self.data.data
+        new_data = copy.deepcopy(self.data)
+        array[0] = 42
+        np.testing.assert_allclose(new_data.data, np.zeros(3))
+
+    def test_to_dict_does_not_copy_shared_data(self):
+        self.data.data = np.zeros(10)
+        new_data = copy.deepcopy(self.data)
+        self.assertIs(new_data._data, new_data.to_dict()["data"])
+        self.assertIs(self.data._data, new_data._data)
+
+
+class TestDataMemoryMapped(unittest.TestCase):
+    def setUp(self):
+        self.data = dataset.Data()
+        self.filename = "test.npy"
+        np.save(self.filename, np.zeros(10))
+
+    def tearDown(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def memory_map(self, mode="c"):
+        return np.load(self.filename, mmap_mode=mode)
+
+    def test_accessing_unmodified_copy_remaps_file(self):
+        self.data.data = self.memory_map()
+        new_data = copy.deepcopy(self.data)
+        self.assertIsInstance(new_data.data, np.memmap)
+        self.assertFalse(np.shares_memory(self.data._data, new_data.data))
+
+    def test_modified_data_get_copied(self):
+        self.data.data = self.memory_map()
+        self.data.data[0] = 42
+        new_data = copy.deepcopy(self.data)
+        self.assertEqual(42, new_data.data[0])
+        self.assertFalse(np.shares_memory(self.data._data, new_data.data))
+
+    def test_modifying_copy_does_not_modify_file(self):
+        self.data.data = self.memory_map()
+        new_data = copy.deepcopy(self.data)
+        new_data.data[0] = 42
+        self.assertEqual(0, self.data.data[0])
+        self.assertEqual(0, np.load(self.filename)[0])
+
+    def test_read_only_data_get_remapped(self):
+        self.data.data = self.memory_map(mode="r")
+        _ = self.data.data
+        new_data = copy.deepcopy(self.data)
+        self.assertIsInstance(new_data.data, np.memmap)
+
+    def test_read_write_data_get_copied(self):
+        self.data.data = self.memory_map(mode="r+")
+        new_data = copy.deepcopy(self.data)
+        self.data.data[0] = 42
+        self.assertEqual(0, new_data.data[0])
+
+    def test_data_of_removed_file_get_copied(self):
+        self.data.data = self.memory_map()
+        new_data = copy.deepcopy(self.data)
+        os.remove(self.filename)
+        self.assertFalse(np.shares_memory(self.data._data, new_data.data))
+
+    def test_to_dict_does_not_contain_access_flag(self):
+        self.data.data = self.memory_map()
+        _ = self.data.data
+        self.assertNotIn("_data_accessed", self.data.to_dict())
+
+    def test_set_values_of_memory_mapped_axis(self):
+        self.data.data = self.memory_map()
+        self.data.axes[0].values = self.memory_map()
+        self.data.axes[0].values = np.ones(10)
+        np.testing.assert_allclose(np.ones(10), self.data.axes[0].values)
+
 
 class TestAxisSetupInConstructor(unittest.TestCase):
     def setUp(self):
@@ -1511,6 +2026,31 @@ class TestAxis(unittest.TestCase):
     def test_set_values(self):
         self.axis.values = np.zeros(0)
 
+    def test_deepcopy_shares_values(self):
+        self.axis.values = np.linspace(1, 2, 10)
+        new_axis = copy.deepcopy(self.axis)
+        self.assertTrue(np.shares_memory(self.axis._values, new_axis._values))
+
+    def test_modifying_values_of_copy_does_not_modify_original(self):
+        self.axis.values = np.linspace(1, 2, 10)
+        new_axis = copy.deepcopy(self.axis)
+        new_axis.values[0] = 42
+        self.assertEqual(1, self.axis.values[0])
+
+    def test_deepcopy_copies_values_handed_out_before(self):
+        self.axis.values = np.linspace(1, 2, 3)
+        values = self.axis.values
+        new_axis = copy.deepcopy(self.axis)
+        values[0] = 42
+        np.testing.assert_allclose(new_axis.values, np.linspace(1, 2, 3))
+
+    def test_modifying_index_of_copy_does_not_modify_original(self):
+        self.axis.values = np.linspace(1, 2, 3)
+        self.axis.index = ["a", "b", "c"]
+        new_axis = copy.deepcopy(self.axis)
+        new_axis.index[0] = "d"
+        self.assertEqual(["a", "b", "c"], self.axis.index)
+
     def test_set_wrong_type_for_values_fails(self):
         with self.assertRaisesRegex(ValueError, "Wrong type: expected"):
             self.axis.values = "foo"
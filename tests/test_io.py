@@ -2,6 +2,7 @@
 
 import copy
 import os
+import shutil
 import unittest
 import zipfile
 
@@ -595,6 +596,96 @@ class TestAdfExporter(unittest.TestCase):
             readme = zipped_file.read("README")
         self.assertTrue(readme)
 
+    def test_export_stores_members_uncompressed_by_default(self):
+        self.exporter.target = self.target
+        self.dataset.data.data = np.random.random(1001)
+        self.exporter.export_from(self.dataset)
+        with zipfile.ZipFile(
+            self.target + self.extension, "r"
+        ) as zipped_file:
+            compress_types = {
+                info.compress_type for info in zipped_file.infolist()
+            }
+        self.assertSetEqual({zipfile.ZIP_STORED}, compress_types)
+
+    def test_export_with_compression_compresses_members(self):
+        self.exporter.target = self.target
+        self.dataset.data.data = np.random.random(1001)
+        for compression, compress_type in (
+            ("deflate", zipfile.ZIP_DEFLATED),
+            ("lzma", zipfile.ZIP_LZMA),
+        ):
+            with self.subTest(compression=compression):
+                self.exporter.compression = compression
+                self.exporter.export_from(self.dataset)
+                with zipfile.ZipFile(
+                    self.target + self.extension, "r"
+                ) as zipped_file:
+                    info = zipped_file.getinfo("dataset.yaml")
+                    binary_files = [
+                        x
+                        for x in zipped_file.infolist()
+                        if x.filename.endswith(".npy")
+                    ]
+                self.assertEqual(compress_type, info.compress_type)
+                self.assertEqual(compress_type, binary_files[0].compress_type)
+
+    def test_export_with_array_compression_compresses_arrays_only(self):
+        self.exporter.target = self.target
+        self.dataset.data.data = np.random.random(1001)
+        self.exporter.compression = "deflate"
+        self.exporter.array_compression = "stored"
+        self.exporter.export_from(self.dataset)
+        with zipfile.ZipFile(
+            self.target + self.extension, "r"
+        ) as zipped_file:
+            info = zipped_file.getinfo("dataset.yaml")
+            compress_types = {
+                x.compress_type
+                for x in zipped_file.infolist()
+                if x.filename.endswith(".npy")
+            }
+        self.assertEqual(zipfile.ZIP_DEFLATED, info.compress_type)
+        self.assertSetEqual({zipfile.ZIP_STORED}, compress_types)
+
+    def test_export_with_unknown_array_compression_raises(self):
+        self.exporter.target = self.target
+        self.exporter.array_compression = "foo"
+        with self.assertRaisesRegex(ValueError, "compression"):
+            self.exporter.export_from(self.dataset)
+
+    def test_export_with_unknown_compression_raises(self):
+        self.exporter.target = self.target
+        self.exporter.compression = "foo"
+        with self.assertRaisesRegex(ValueError, "compression"):
+            self.exporter.export_from(self.dataset)
+
+    def test_export_writes_binary_files_in_numpy_format(self):
+        self.exporter.target = self.target
+        self.dataset.data.data = np.random.random([11, 101])
+        self.exporter.compression = "deflate"
+        self.exporter.export_from(self.dataset)
+        with zipfile.ZipFile(
+            self.target + self.extension, "r"
+        ) as zipped_file:
+            yaml = utils.Yaml()
+            yaml.read_stream(zipped_file.read("dataset.yaml"))
+            filename = yaml.dict["data"]["data"]["file"]
+            with zipped_file.open("binaryData/" + filename) as file:
+                data = np.load(file)
+        np.testing.assert_array_equal(self.dataset.data.data, data)
+
+    def test_export_stores_system_info_only_once(self):
+        self.exporter.target = self.target
+        for _ in range(3):
+            self.dataset.process(aspecd.processing.SingleProcessingStep())
+        self.exporter.export_from(self.dataset)
+        with zipfile.ZipFile(
+            self.target + self.extension, "r"
+        ) as zipped_file:
+            contents = zipped_file.read("dataset.yaml").decode()
+        self.assertEqual(1, contents.count("packages:"))
+
 
 class TestAdfImporter(unittest.TestCase):
     def setUp(self):
@@ -654,6 +745,175 @@ class TestAdfImporter(unittest.TestCase):
         self.dataset.import_from(self.importer)
         np.testing.assert_allclose(dataset_.data.data, self.dataset.data.data)
 
+    def test_import_lazily_sets_data(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random((20, 30))
+        dataset_.data.axes[0].values = np.linspace(1, 2, 20)
+        dataset_.export_to(self.exporter)
+        self.importer.source = self.source
+        self.importer.parameters["lazy"] = True
+        self.dataset.import_from(self.importer)
+        np.testing.assert_allclose(dataset_.data.data, self.dataset.data.data)
+        np.testing.assert_allclose(
+            dataset_.data.axes[0].values, self.dataset.data.axes[0].values
+        )
+
+    def test_import_lazily_memory_maps_data(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random((20, 30))
+        dataset_.export_to(self.exporter)
+        self.importer.source = self.source
+        self.importer.parameters["lazy"] = True
+        self.dataset.import_from(self.importer)
+        self.assertIsInstance(self.dataset.data._data, np.memmap)
+
+    def test_import_lazily_from_compressed_archive_defers_reading(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random((20, 30))
+        dataset_.export_to(self.exporter)
+        filename = self.source + self.extension
+        with zipfile.ZipFile(filename, "r") as zipped_file:
+            contents = {
+                info.filename: zipped_file.read(info)
+                for info in zipped_file.infolist()
+            }
+        with zipfile.ZipFile(
+            filename, "w", compression=zipfile.ZIP_DEFLATED
+        ) as zipped_file:
+            for name, content in contents.items():
+                zipped_file.writestr(name, content)
+        self.importer.source = self.source
+        self.importer.parameters["lazy"] = True
+        self.dataset.import_from(self.importer)
+        self.assertIsInstance(self.dataset.data._data, utils.LazyArray)
+        np.testing.assert_allclose(dataset_.data.data, self.dataset.data.data)
+
+    def test_has_mmap_mode_parameter(self):
+        self.assertIn("mmap_mode", self.importer.parameters)
+        self.assertIsNone(self.importer.parameters["mmap_mode"])
+
+    def test_import_with_mmap_mode_memory_maps_data_and_axes(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random((200, 30))
+        dataset_.data.axes[0].values = np.linspace(1, 2, 200)
+        dataset_.export_to(self.exporter)
+        self.importer.source = self.source
+        self.importer.parameters["mmap_mode"] = "r"
+        self.dataset.import_from(self.importer)
+        self.assertIsInstance(self.dataset.data.data, np.memmap)
+        self.assertIsInstance(self.dataset.data.axes[0].values, np.memmap)
+        np.testing.assert_allclose(dataset_.data.data, self.dataset.data.data)
+
+    def test_import_with_mmap_mode_and_compressed_metadata(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random((200, 30))
+        self.exporter.compression = "deflate"
+        self.exporter.array_compression = "stored"
+        dataset_.export_to(self.exporter)
+        self.importer.source = self.source
+        self.importer.parameters["mmap_mode"] = "r"
+        self.dataset.import_from(self.importer)
+        self.assertIsInstance(self.dataset.data.data, np.memmap)
+
+    def test_slice_extraction_with_mmap_mode_does_not_read_data(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random((200, 30))
+        dataset_.export_to(self.exporter)
+        self.importer.source = self.source
+        self.importer.parameters["mmap_mode"] = "r"
+        self.dataset.import_from(self.importer)
+        processing_step = aspecd.processing.SliceExtraction()
+        processing_step.parameters["position"] = 2
+        self.dataset.process(processing_step)
+        self.assertIsInstance(self.dataset.data.data, np.memmap)
+        np.testing.assert_allclose(
+            dataset_.data.data[2, :], self.dataset.data.data
+        )
+
+
+class TestAdfBlobStore(unittest.TestCase):
+    def setUp(self):
+        self.exporter = io.AdfExporter()
+        self.exporter.blob_store = "blobs"
+        self.importer = io.AdfImporter()
+        self.importer.parameters["blob_store"] = "blobs"
+        self.dataset = dataset.Dataset()
+        self.dataset.data.data = np.random.random([11, 101])
+        self.targets = ["target1", "target2"]
+        self.extension = ".adf"
+
+    def tearDown(self):
+        for target in self.targets:
+            if os.path.exists(target + self.extension):
+                os.remove(target + self.extension)
+        if os.path.exists("blobs"):
+            shutil.rmtree("blobs")
+
+    def test_export_writes_arrays_to_blob_store(self):
+        self.exporter.target = self.targets[0]
+        self.exporter.export_from(self.dataset)
+        with zipfile.ZipFile(
+            self.targets[0] + self.extension, "r"
+        ) as zipped_file:
+            binary_files = [
+                x for x in zipped_file.namelist() if x.endswith(".npy")
+            ]
+        self.assertFalse(binary_files)
+        self.assertTrue(utils.BlobStore(directory="blobs").filenames())
+
+    def test_export_shares_arrays_between_files(self):
+        for target in self.targets:
+            self.exporter.target = target
+            self.exporter.export_from(self.dataset)
+        # data (identical to origdata) and values of second axis
+        self.assertEqual(2, len(utils.BlobStore(directory="blobs")))
+
+    def test_import_reads_arrays_from_blob_store(self):
+        self.exporter.target = self.targets[0]
+        self.exporter.export_from(self.dataset)
+        self.importer.source = self.targets[0]
+        dataset_ = dataset.Dataset()
+        dataset_.import_from(self.importer)
+        np.testing.assert_array_equal(
+            self.dataset.data.data, dataset_.data.data
+        )
+
+    def test_import_without_blob_store_raises(self):
+        self.exporter.target = self.targets[0]
+        self.exporter.export_from(self.dataset)
+        importer = io.AdfImporter(source=self.targets[0])
+        with self.assertRaises(aspecd.exceptions.MissingBlobStoreError):
+            dataset.Dataset().import_from(importer)
+
+    def test_collect_garbage_keeps_referenced_arrays(self):
+        for target in self.targets:
+            self.exporter.target = target
+            self.exporter.export_from(self.dataset)
+        removed = io.collect_blob_garbage(
+            blob_store="blobs",
+            sources=[x + self.extension for x in self.targets],
+        )
+        self.assertFalse(removed)
+
+    def test_collect_garbage_removes_unreferenced_arrays(self):
+        self.exporter.target = self.targets[0]
+        self.exporter.export_from(self.dataset)
+        self.dataset.data.data = np.random.random([11, 101])
+        self.exporter.target = self.targets[1]
+        self.exporter.export_from(self.dataset)
+        removed = io.collect_blob_garbage(
+            blob_store="blobs", sources=[self.targets[1] + self.extension]
+        )
+        self.assertEqual(1, len(removed))
+
+    def test_collect_garbage_searches_directories(self):
+        self.exporter.target = self.targets[0]
+        self.exporter.export_from(self.dataset)
+        removed = io.collect_blob_garbage(
+            blob_store="blobs", sources=[os.curdir], dry_run=True
+        )
+        self.assertFalse(removed)
+
 
 class TestAsdfExporter(unittest.TestCase):
     def setUp(self):
@@ -728,6 +988,40 @@ class TestAsdfImporter(unittest.TestCase):
             dataset_.history[0].to_dict(), self.dataset.history[0].to_dict()
         )
 
+    def test_has_mmap_mode_parameter(self):
+        self.assertIn("mmap_mode", self.importer.parameters)
+        self.assertIsNone(self.importer.parameters["mmap_mode"])
+
+    def test_import_without_mmap_mode_reads_data(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random((20, 30))
+        dataset_.export_to(self.exporter)
+        self.importer.source = self.source
+        self.dataset.import_from(self.importer)
+        self.assertNotIsInstance(self.dataset.data.data, np.memmap)
+
+    def test_import_with_mmap_mode_memory_maps_data(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random((20, 30))
+        dataset_.export_to(self.exporter)
+        self.importer.source = self.source
+        self.importer.parameters["mmap_mode"] = "c"
+        self.dataset.import_from(self.importer)
+        self.assertIsInstance(self.dataset.data.data, np.memmap)
+        np.testing.assert_allclose(dataset_.data.data, self.dataset.data.data)
+
+    def test_modifying_memory_mapped_data_does_not_modify_file(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random((20, 30))
+        dataset_.export_to(self.exporter)
+        self.importer.source = self.source
+        self.importer.parameters["mmap_mode"] = "c"
+        self.dataset.import_from(self.importer)
+        self.dataset.data.data[0, 0] = 42
+        dataset_ = dataset.Dataset()
+        dataset_.import_from(self.importer)
+        self.assertNotEqual(42, dataset_.data.data[0, 0])
+
 
 class TestTxtImporter(unittest.TestCase):
     def setUp(self):
@@ -198,6 +198,40 @@ class TestPlotter(unittest.TestCase):
         # Cleanup in case anything goes wrong
         dict.update(matplotlib.rcParams, orig_rcparams)
 
+    def test_plot_with_style_applies_style(self):
+        self.plotter.style = "ggplot"
+        self.plotter.plot()
+        self.assertEqual(
+            matplotlib.colors.to_rgba(
+                plt.style.library["ggplot"]["axes.facecolor"]
+            ),
+            self.plotter.axes.get_facecolor(),
+        )
+
+    def test_plot_with_style_caches_style_parameters(self):
+        plotting.clear_style_cache()
+        self.plotter.style = "ggplot"
+        self.plotter.plot()
+        self.assertIn("ggplot", plotting._STYLES)
+
+    def test_plot_with_cached_style_sets_same_parameters_as_matplotlib(self):
+        orig_rcparams = matplotlib.rcParams.copy()
+        self.addCleanup(dict.update, matplotlib.rcParams, orig_rcparams)
+        self.plotter.style = "classic"
+        self.plotter.plot()
+        self.plotter._set_style()
+        rcparams = dict(matplotlib.rcParams)
+        dict.update(matplotlib.rcParams, orig_rcparams)
+        plt.style.use("classic")
+        self.assertEqual(dict(matplotlib.rcParams), rcparams)
+
+    def test_plot_with_style_does_not_change_backend(self):
+        backend = matplotlib.rcParams["backend"]
+        plotting.clear_style_cache()
+        self.plotter.style = "default"
+        self.plotter.plot()
+        self.assertEqual(backend, matplotlib.rcParams["backend"])
+
     def test_plot_adds_zero_lines(self):
         self.plotter.parameters["show_zero_lines"] = True
         self.plotter.plot()
@@ -341,6 +375,17 @@ class TestPlotter(unittest.TestCase):
         self.assertNotEqual(axes_ylim[0], plotter.axes_ylim[0])
         plt.close(plotter.figure)
 
+    def test_update_without_plot_raises(self):
+        with self.assertRaises(aspecd.exceptions.MissingPlotError):
+            self.plotter.update()
+
+    def test_update_after_plot_raises(self):
+        self.plotter.plot()
+        with self.assertRaisesRegex(
+            aspecd.exceptions.UpdateNotSupportedError, "updating"
+        ):
+            self.plotter.update()
+
 
 class TestSinglePlotter(unittest.TestCase):
     def setUp(self):
@@ -705,6 +750,215 @@ class TestSinglePlotter1D(unittest.TestCase):
             self.plotter.plot()
         self.assertIn("Negative values", cm.output[0])
 
+    def test_plot_does_not_decimate_by_default(self):
+        self.dataset.data.data = np.random.random(100000)
+        self.plotter.plot(dataset=self.dataset)
+        self.assertEqual(100000, len(self.plotter.drawing.get_xdata()))
+
+    def test_plot_with_decimation_reduces_number_of_points(self):
+        self.dataset.data.data = np.random.random(100000)
+        self.plotter.parameters["decimate"] = "minmax"
+        self.plotter.plot(dataset=self.dataset)
+        width = self.plotter.axes.get_window_extent().width
+        self.assertLessEqual(
+            len(self.plotter.drawing.get_xdata()), 4 * np.ceil(width) + 4
+        )
+
+    def test_plot_with_minmax_decimation_retains_extrema(self):
+        self.dataset.data.data = np.random.random(100000)
+        self.plotter.parameters["decimate"] = "minmax"
+        self.plotter.parameters["decimation_points"] = 100
+        self.plotter.plot(dataset=self.dataset)
+        ydata = self.plotter.drawing.get_ydata()
+        self.assertEqual(self.dataset.data.data.min(), ydata.min())
+        self.assertEqual(self.dataset.data.data.max(), ydata.max())
+        self.assertLessEqual(len(ydata), 104)
+
+    def test_plot_with_minmax_decimation_retains_first_and_last_point(self):
+        self.dataset.data.data = np.random.random(100001)
+        self.plotter.parameters["decimate"] = "minmax"
+        self.plotter.parameters["decimation_points"] = 100
+        self.plotter.plot(dataset=self.dataset)
+        xdata = self.plotter.drawing.get_xdata()
+        axis = self.dataset.data.axes[0].values
+        self.assertEqual([axis[0], axis[-1]], [xdata[0], xdata[-1]])
+        self.assertTrue(np.all(np.diff(xdata) > 0))
+
+    def test_plot_with_lttb_decimation_retains_number_of_points(self):
+        self.dataset.data.data = np.random.random(100000)
+        self.plotter.parameters["decimate"] = "lttb"
+        self.plotter.parameters["decimation_points"] = 100
+        self.plotter.plot(dataset=self.dataset)
+        xdata = self.plotter.drawing.get_xdata()
+        self.assertEqual(100, len(xdata))
+        self.assertTrue(np.all(np.diff(xdata) > 0))
+
+    def test_plot_with_decimation_and_switched_axes(self):
+        self.dataset.data.data = np.random.random(100000)
+        self.plotter.parameters["decimate"] = "minmax"
+        self.plotter.parameters["decimation_points"] = 100
+        self.plotter.parameters["switch_axes"] = True
+        self.plotter.plot(dataset=self.dataset)
+        self.assertEqual(
+            self.dataset.data.data.max(),
+            self.plotter.drawing.get_xdata().max(),
+        )
+
+    def test_plot_with_decimation_and_xlim_decimates_data_within_limits(self):
+        self.dataset.data.data = np.random.random(100000)
+        self.plotter.parameters["decimate"] = "minmax"
+        self.plotter.parameters["decimation_points"] = 100
+        self.plotter.properties.axes.xlim = [1000, 2000]
+        self.plotter.plot(dataset=self.dataset)
+        xdata = self.plotter.drawing.get_xdata()
+        within_limits = np.logical_and(xdata >= 1000, xdata <= 2000)
+        self.assertGreater(np.count_nonzero(within_limits), 50)
+        self.assertEqual([999, 2001], [xdata[0], xdata[-1]])
+
+    def test_plot_with_decimation_does_not_decimate_short_data(self):
+        self.plotter.parameters["decimate"] = "minmax"
+        self.plotter.plot(dataset=self.dataset)
+        self.assertEqual(5, len(self.plotter.drawing.get_xdata()))
+
+    def test_plot_with_decimation_does_not_decimate_loglog_plot(self):
+        self.dataset.data.data = np.random.random(100000)
+        self.plotter.type = "loglog"
+        self.plotter.parameters["decimate"] = "minmax"
+        self.plotter.parameters["decimation_points"] = 100
+        self.plotter.plot(dataset=self.dataset)
+        self.assertEqual(100000, len(self.plotter.drawing.get_xdata()))
+
+    def test_plot_with_unknown_decimation_raises(self):
+        self.dataset.data.data = np.random.random(100000)
+        self.plotter.parameters["decimate"] = "foo"
+        with self.assertRaisesRegex(ValueError, "Unknown decimation"):
+            self.plotter.plot(dataset=self.dataset)
+
+    def test_update_without_plot_raises(self):
+        with self.assertRaises(aspecd.exceptions.MissingPlotError):
+            self.plotter.update(dataset=self.dataset)
+
+    def test_update_sets_data_of_drawing(self):
+        self.plotter.plot(dataset=self.dataset)
+        self.dataset.data.data = np.random.random(10)
+        self.plotter.update()
+        np.testing.assert_array_equal(
+            self.dataset.data.data, self.plotter.drawing.get_ydata()
+        )
+        np.testing.assert_array_equal(
+            self.dataset.data.axes[0].values, self.plotter.drawing.get_xdata()
+        )
+
+    def test_update_keeps_drawing(self):
+        self.plotter.plot(dataset=self.dataset)
+        drawing = self.plotter.drawing
+        lines = self.plotter.axes.get_lines()
+        self.plotter.update()
+        self.assertIs(drawing, self.plotter.drawing)
+        self.assertEqual(lines, self.plotter.axes.get_lines())
+
+    def test_update_keeps_zero_lines_visible(self):
+        self.plotter.plot(dataset=self.dataset)
+        self.plotter.update()
+        self.assertTrue(
+            all(line.get_visible() for line in self.plotter.axes.get_lines())
+        )
+
+    def test_update_with_dataset_sets_dataset(self):
+        self.plotter.plot(dataset=self.dataset)
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random(10)
+        self.plotter.update(dataset=dataset_)
+        self.assertIs(dataset_, self.plotter.dataset)
+        np.testing.assert_array_equal(
+            dataset_.data.data, self.plotter.drawing.get_ydata()
+        )
+
+    def test_update_does_not_add_history_record(self):
+        self.plotter.plot(dataset=self.dataset)
+        self.plotter.update()
+        self.assertEqual(1, len(self.dataset.representations))
+
+    def test_update_with_switched_axes(self):
+        self.plotter.parameters["switch_axes"] = True
+        self.plotter.plot(dataset=self.dataset)
+        self.dataset.data.data = np.random.random(10)
+        self.plotter.update()
+        np.testing.assert_array_equal(
+            self.dataset.data.data, self.plotter.drawing.get_xdata()
+        )
+
+    def test_update_recomputes_axes_limits(self):
+        self.plotter.plot(dataset=self.dataset)
+        self.dataset.data.data = np.random.random(10) + 10
+        self.plotter.update()
+        self.assertGreater(self.plotter.axes.get_ylim()[0], 9)
+        self.assertGreater(self.plotter.axes.get_xlim()[1], 9)
+
+    def test_update_keeps_axes_limits_set_in_properties(self):
+        self.plotter.properties.axes.ylim = [-1, 1]
+        self.plotter.plot(dataset=self.dataset)
+        self.dataset.data.data = np.random.random(10) + 10
+        self.plotter.update()
+        self.assertEqual((-1, 1), self.plotter.axes.get_ylim())
+
+    def test_update_with_tight_sets_axes_limits(self):
+        self.plotter.parameters["tight"] = "both"
+        self.plotter.plot(dataset=self.dataset)
+        self.dataset.data.data = np.random.random(10) + 10
+        self.plotter.update()
+        self.assertEqual(
+            self.dataset.data.data.max(), self.plotter.axes.get_ylim()[1]
+        )
+
+    def test_update_with_decimation_decimates_data(self):
+        self.plotter.parameters["decimate"] = "minmax"
+        self.plotter.parameters["decimation_points"] = 100
+        self.plotter.plot(dataset=self.dataset)
+        self.dataset.data.data = np.random.random(100000)
+        self.plotter.update()
+        self.assertLessEqual(len(self.plotter.drawing.get_xdata()), 104)
+
+    def test_update_with_same_limits_does_not_draw_figure(self):
+        self.plotter.properties.axes.xlim = [0, 10]
+        self.plotter.properties.axes.ylim = [-1, 1]
+        self.plotter.plot(dataset=self.dataset)
+        self.plotter.update()
+        mock = MagicMock()
+        with patch.object(self.plotter.figure.canvas, "draw", mock):
+            self.plotter.update()
+        mock.assert_not_called()
+
+    def test_update_with_changed_limits_draws_figure(self):
+        self.plotter.plot(dataset=self.dataset)
+        self.plotter.update()
+        self.dataset.data.data = np.random.random(10) + 10
+        mock = MagicMock()
+        with patch.object(self.plotter.figure.canvas, "draw", mock):
+            self.plotter.update()
+        mock.assert_called()
+
+    def test_update_with_blitting_draws_same_figure_as_plot(self):
+        self.plotter.properties.axes.xlim = [0, 10]
+        self.plotter.properties.axes.ylim = [-1, 2]
+        self.plotter.plot(dataset=self.dataset)
+        self.plotter.update()
+        self.dataset.data.data = np.random.random(5)
+        self.plotter.update()
+        updated = np.asarray(self.plotter.figure.canvas.buffer_rgba())
+        plotter = plotting.SinglePlotter1D()
+        plotter.properties.axes.xlim = [0, 10]
+        plotter.properties.axes.ylim = [-1, 2]
+        plotter.plot(dataset=self.dataset)
+        plotter.figure.canvas.draw()
+        plotted = np.asarray(plotter.figure.canvas.buffer_rgba())
+        self.assertLess(np.mean(np.any(updated != plotted, axis=2)), 1e-3)
+
+    def test_update_leaves_drawing_visible_in_saved_figure(self):
+        self.plotter.plot(dataset=self.dataset)
+        self.plotter.update()
+        self.assertFalse(self.plotter.drawing.get_animated())
+
 
 class TestSinglePlotter2D(unittest.TestCase):
     def setUp(self):
@@ -1130,6 +1384,176 @@ class TestSinglePlotter2D(unittest.TestCase):
             plotter.drawing.levels[0], self.plotter.parameters["threshold"]
         )
 
+    def test_plot_imshow_shows_data_without_flipping(self):
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 4])
+        plotter = test_dataset.plot(self.plotter)
+        self.assertEqual("lower", plotter.drawing.origin)
+        np.testing.assert_array_equal(
+            test_dataset.data.data.T, plotter.drawing.get_array()
+        )
+
+    def test_plot_does_not_downsample_by_default(self):
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([2000, 1500])
+        plotter = test_dataset.plot(self.plotter)
+        self.assertEqual((1500, 2000), plotter.drawing.get_array().shape)
+
+    def test_plot_with_downsample_reduces_to_resolution_of_axes(self):
+        self.plotter.parameters["downsample"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([2000, 1500])
+        plotter = test_dataset.plot(self.plotter)
+        extent = plotter.axes.get_window_extent()
+        shape = plotter.drawing.get_array().shape
+        self.assertLess(shape[0], 1500)
+        self.assertLess(shape[1], 2000)
+        self.assertGreaterEqual(shape[0], extent.height)
+        self.assertGreaterEqual(shape[1], extent.width)
+
+    def test_plot_with_downsample_averages_blocks_of_points(self):
+        self.plotter.parameters["downsample"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.ones([2000, 1500])
+        test_dataset.data.data[::2, ::2] = 3
+        plotter = test_dataset.plot(self.plotter)
+        self.assertAlmostEqual(1.5, plotter.drawing.get_array().mean(), 1)
+
+    def test_plot_with_downsample_and_switched_axes(self):
+        self.plotter.parameters["downsample"] = True
+        self.plotter.parameters["switch_axes"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([2000, 1500])
+        plotter = test_dataset.plot(self.plotter)
+        extent = plotter.axes.get_window_extent()
+        shape = plotter.drawing.get_array().shape
+        self.assertLess(shape[0], 2000)
+        self.assertGreaterEqual(shape[0], extent.height)
+        self.assertGreaterEqual(shape[1], extent.width)
+
+    def test_plot_with_downsample_retains_range_of_axes(self):
+        self.plotter.parameters["downsample"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([2000, 1500])
+        test_dataset.data.axes[0].values = np.linspace(5, 10, 2000)
+        test_dataset.data.axes[1].values = np.linspace(50, 100, 1500)
+        plotter = test_dataset.plot(self.plotter)
+        self.assertEqual((5, 10), plotter.axes.get_xlim())
+        self.assertEqual((50, 100), plotter.axes.get_ylim())
+        self.assertEqual([5, 10, 50, 100], list(plotter.drawing.get_extent()))
+
+    def test_plot_with_downsample_does_not_change_small_data(self):
+        self.plotter.parameters["downsample"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 4])
+        plotter = test_dataset.plot(self.plotter)
+        np.testing.assert_array_equal(
+            test_dataset.data.data.T, plotter.drawing.get_array()
+        )
+
+    def test_plot_contour_with_downsample(self):
+        self.plotter.type = "contour"
+        self.plotter.parameters["downsample"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([2000, 1500])
+        plotter = test_dataset.plot(self.plotter)
+        self.assertTrue(plotter.drawing.levels.any())
+
+    def test_plot_does_not_rasterise_contour_by_default(self):
+        self.plotter.type = "contour"
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 5])
+        plotter = test_dataset.plot(self.plotter)
+        self.assertFalse(plotter.drawing.get_rasterized())
+
+    def test_plot_contour_with_rasterise_rasterises_contour(self):
+        self.plotter.type = "contour"
+        self.plotter.parameters["rasterise"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 5])
+        plotter = test_dataset.plot(self.plotter)
+        self.assertTrue(plotter.drawing.get_rasterized())
+
+    def test_plot_contourf_with_rasterise_rasterises_contour_lines(self):
+        self.plotter.type = "contourf"
+        self.plotter.parameters["rasterise"] = True
+        self.plotter.parameters["show_contour_lines"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 5])
+        plotter = test_dataset.plot(self.plotter)
+        self.assertTrue(
+            all(
+                collection.get_rasterized()
+                for collection in plotter.axes.collections
+            )
+        )
+
+    def test_update_without_plot_raises(self):
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 5])
+        with self.assertRaises(aspecd.exceptions.MissingPlotError):
+            self.plotter.update(dataset=test_dataset)
+
+    def test_update_sets_data_of_image(self):
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 4])
+        self.plotter.plot(dataset=test_dataset)
+        test_dataset.data.data = np.random.random([6, 3])
+        self.plotter.update()
+        np.testing.assert_array_equal(
+            test_dataset.data.data.T, self.plotter.drawing.get_array()
+        )
+
+    def test_update_sets_extent_of_image(self):
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 4])
+        self.plotter.plot(dataset=test_dataset)
+        test_dataset.data.data = np.random.random([10, 4])
+        test_dataset.data.axes[0].values = np.linspace(5, 10, 10)
+        self.plotter.update()
+        self.assertEqual(5, self.plotter.drawing.get_extent()[0])
+        self.assertEqual((5, 10), self.plotter.axes.get_xlim())
+
+    def test_update_rescales_colours_of_image(self):
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 4])
+        self.plotter.plot(dataset=test_dataset)
+        test_dataset.data.data = np.random.random([5, 4]) + 10
+        self.plotter.update()
+        self.assertGreater(self.plotter.drawing.get_clim()[0], 9)
+
+    def test_update_keeps_limits_set_in_norm_parameters(self):
+        self.plotter.properties.drawing.norm_parameters = {"vmax": 1}
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 4])
+        self.plotter.plot(dataset=test_dataset)
+        test_dataset.data.data = np.random.random([5, 4]) - 10
+        self.plotter.update()
+        self.assertEqual(
+            test_dataset.data.data.min(), self.plotter.drawing.get_clim()[0]
+        )
+        self.assertEqual(1, self.plotter.drawing.get_clim()[1])
+
+    def test_update_updates_colorbar(self):
+        self.plotter.parameters["show_colorbar"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 4])
+        self.plotter.plot(dataset=test_dataset)
+        test_dataset.data.data = np.random.random([5, 4]) + 10
+        self.plotter.update()
+        self.assertGreater(self.plotter.colorbar.norm.vmin, 9)
+
+    def test_update_contour_replaces_contours(self):
+        self.plotter.type = "contourf"
+        self.plotter.parameters["show_contour_lines"] = True
+        test_dataset = dataset.Dataset()
+        test_dataset.data.data = np.random.random([5, 5])
+        self.plotter.plot(dataset=test_dataset)
+        test_dataset.data.data = np.random.random([5, 5]) + 10
+        self.plotter.update()
+        self.assertEqual(2, len(self.plotter.axes.collections))
+        self.assertGreater(self.plotter.drawing.levels[0], 9)
+
 
 class TestSinglePlotter2DStacked(unittest.TestCase):
     def setUp(self):
@@ -1153,6 +1577,13 @@ class TestSinglePlotter2DStacked(unittest.TestCase):
         with self.assertRaises(aspecd.exceptions.NotApplicableToDatasetError):
             dataset_.plot(self.plotter)
 
+    def test_update_raises(self):
+        dataset_ = aspecd.dataset.CalculatedDataset()
+        dataset_.data.data = np.random.random([5, 10])
+        dataset_.plot(self.plotter)
+        with self.assertRaises(aspecd.exceptions.UpdateNotSupportedError):
+            self.plotter.update()
+
     def test_parameters_have_stacking_dimension_key(self):
         self.assertIn("stacking_dimension", self.plotter.parameters)
 
@@ -1700,6 +2131,19 @@ class TestMultiDeviceDataPlotter1D(unittest.TestCase):
         plotter = self.dataset.plot(self.plotter)
         self.assertEqual(color1, plotter.drawing[0].get_color())
 
+    def test_update_sets_data_of_drawings(self):
+        self.create_dataset()
+        self.plotter.plot(dataset=self.dataset)
+        for device_data in self.dataset.device_data.values():
+            device_data.data = np.random.random(501)
+        self.plotter.update()
+        for drawing, device_data in zip(
+            self.plotter.drawing, self.dataset.device_data.values()
+        ):
+            np.testing.assert_array_equal(
+                device_data.data, drawing.get_ydata()
+            )
+
 
 class TestSingleBarPlotter(unittest.TestCase):
     def setUp(self):
@@ -2299,6 +2743,49 @@ class TestMultiPlotter1D(unittest.TestCase):
             self.plotter.plot()
         self.assertIn("Negative values", cm.output[0])
 
+    def test_plot_with_decimation_decimates_each_dataset(self):
+        self.dataset.data.data = np.random.random(100000)
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = self.dataset.data.data
+        self.plotter.datasets.append(self.dataset)
+        self.plotter.datasets.append(dataset_)
+        self.plotter.parameters["decimate"] = "minmax"
+        self.plotter.parameters["decimation_points"] = 100
+        self.plotter.plot()
+        for drawing in self.plotter.drawings:
+            self.assertLessEqual(len(drawing.get_xdata()), 104)
+            self.assertEqual(
+                self.dataset.data.data.max(), drawing.get_ydata().max()
+            )
+
+    def test_update_without_plot_raises(self):
+        self.plotter.datasets.append(self.dataset)
+        with self.assertRaises(aspecd.exceptions.MissingPlotError):
+            self.plotter.update()
+
+    def test_update_sets_data_of_drawings(self):
+        dataset_ = dataset.Dataset()
+        dataset_.data.data = np.random.random(5)
+        self.plotter.datasets.append(self.dataset)
+        self.plotter.datasets.append(dataset_)
+        self.plotter.plot()
+        self.dataset.data.data = np.random.random(10)
+        dataset_.data.data = np.random.random(20)
+        self.plotter.update()
+        for drawing, dataset__ in zip(
+            self.plotter.drawings, self.plotter.datasets
+        ):
+            np.testing.assert_array_equal(
+                dataset__.data.data, drawing.get_ydata()
+            )
+
+    def test_update_with_changed_number_of_datasets_raises(self):
+        self.plotter.datasets.append(self.dataset)
+        self.plotter.plot()
+        self.plotter.datasets.append(self.dataset)
+        with self.assertRaises(aspecd.exceptions.MissingDrawingError):
+            self.plotter.update()
+
 
 class TestMultiPlotter1DStacked(unittest.TestCase):
     def setUp(self):
@@ -2521,6 +3008,17 @@ class TestMultiPlotter1DStacked(unittest.TestCase):
         dict_ = self.plotter.to_dict()
         self.assertIsInstance(dict_, dict)
 
+    def test_update_keeps_offset_of_drawings(self):
+        self.plotter.plot()
+        offset = self.plotter.parameters["offset"]
+        for dataset_ in self.plotter.datasets:
+            dataset_.data.data = np.zeros(50)
+        self.plotter.update()
+        for idx, drawing in enumerate(self.plotter.drawings):
+            np.testing.assert_array_equal(
+                np.zeros(50) - idx * offset, drawing.get_ydata()
+            )
+
 
 class TestCompositePlotter(unittest.TestCase):
     def setUp(self):
@@ -2559,6 +3057,16 @@ class TestCompositePlotter(unittest.TestCase):
         self.plotter.plot()
         self.assertEqual(1, len(self.plotter.axes))
 
+    def test_update_raises(self):
+        self.plotter.grid_dimensions = [1, 1]
+        self.plotter.subplot_locations = [[0, 0, 1, 1]]
+        single_plotter = plotting.SinglePlotter1D()
+        single_plotter.dataset = self.dataset
+        self.plotter.plotter.append(single_plotter)
+        self.plotter.plot()
+        with self.assertRaises(aspecd.exceptions.UpdateNotSupportedError):
+            self.plotter.update()
+
     def test_plot_operates_on_copies_of_plotters(self):
         self.plotter.grid_dimensions = [1, 1]
         self.plotter.subplot_locations = [[0, 0, 1, 1]]
@@ -5205,3 +5713,15 @@ class TestMarkerProperties(unittest.TestCase):
                     "#000000",
                     getattr(self.annotation, f"get_marker{prop}")(),
                 )
+
+
+class TestClearStyleCache(unittest.TestCase):
+    def tearDown(self):
+        plt.close("all")
+
+    def test_clear_style_cache_determines_style_parameters_anew(self):
+        plotter = plotting.Plotter()
+        plotter.style = "ggplot"
+        plotter.plot()
+        plotting.clear_style_cache()
+        self.assertNotIn("ggplot", plotting._STYLES)
@@ -1,6 +1,8 @@
 """Tests for processing."""
 
 import copy
+import os
+import tracemalloc
 import unittest
 
 import numpy as np
@@ -232,6 +234,141 @@ class TestSingleProcessingStep(unittest.TestCase):
             isinstance(history_record, aspecd.history.ProcessingHistoryRecord)
         )
 
+    def test_has_chunk_size_attribute(self):
+        self.assertTrue(hasattr(self.processing, "chunk_size"))
+
+    def test_process_in_chunks_processes_chunks_along_separable_axis(self):
+        class MyProcessingStep(aspecd.processing.SingleProcessingStep):
+            def __init__(self):
+                super().__init__()
+                self.shapes = []
+
+            def _perform_task(self):
+                self.shapes.append(self.dataset.data.data.shape)
+
+            def _separable_axes(self):
+                return [1]
+
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.zeros([5, 10])
+        processing = MyProcessingStep()
+        processing.chunk_size = 4
+        processing = dataset.process(processing)
+        self.assertEqual([(5, 4), (5, 4), (5, 2)], processing.shapes)
+
+    def test_process_in_chunks_provides_axis_values_of_chunk(self):
+        class MyProcessingStep(aspecd.processing.SingleProcessingStep):
+            def __init__(self):
+                super().__init__()
+                self.values = []
+
+            def _perform_task(self):
+                self.values.append(self.dataset.data.axes[0].values)
+
+            def _separable_axes(self):
+                return [0]
+
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.zeros([5, 10])
+        dataset.data.axes[0].values = np.linspace(1, 5, 5)
+        processing = MyProcessingStep()
+        processing.chunk_size = 3
+        processing = dataset.process(processing)
+        np.testing.assert_allclose([1, 2, 3], processing.values[0])
+        np.testing.assert_allclose([4, 5], processing.values[1])
+        np.testing.assert_allclose(
+            np.linspace(1, 5, 5), dataset.data.axes[0].values
+        )
+
+    def test_process_in_chunks_combines_data_of_chunks(self):
+        class MyProcessingStep(aspecd.processing.SingleProcessingStep):
+            def _perform_task(self):
+                self.dataset.data.data += self.dataset.data.axes[0].values[
+                    :, np.newaxis
+                ]
+
+            def _separable_axes(self):
+                return [0]
+
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.zeros([5, 10])
+        processing = MyProcessingStep()
+        processing.chunk_size = 2
+        dataset.process(processing)
+        np.testing.assert_allclose(
+            np.tile(np.arange(5), (10, 1)).T, dataset.data.data
+        )
+
+    def test_process_in_chunks_without_separable_axes_processes_at_once(self):
+        class MyProcessingStep(aspecd.processing.SingleProcessingStep):
+            def __init__(self):
+                super().__init__()
+                self.shapes = []
+
+            def _perform_task(self):
+                self.shapes.append(self.dataset.data.data.shape)
+
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.zeros([5, 10])
+        processing = MyProcessingStep()
+        processing.chunk_size = 2
+        processing = dataset.process(processing)
+        self.assertEqual([(5, 10)], processing.shapes)
+
+    def test_process_in_chunks_merges_parameters(self):
+        class MyProcessingStep(aspecd.processing.SingleProcessingStep):
+            def _perform_task(self):
+                self.parameters["sum"] = self.dataset.data.data.sum()
+
+            def _separable_axes(self):
+                return [0]
+
+            def _merge_chunk_parameters(self, parameters, axis=0):
+                self.parameters["sum"] = sum(
+                    parameters_["sum"] for parameters_ in parameters
+                )
+
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.ones([5, 10])
+        processing = MyProcessingStep()
+        processing.chunk_size = 2
+        processing = dataset.process(processing)
+        self.assertEqual(50, processing.parameters["sum"])
+
+    def test_process_memory_mapped_data_in_chunks_maps_result(self):
+        filename = "test.npy"
+        self.addCleanup(os.remove, filename)
+        np.save(filename, np.zeros([5, 10]))
+        processing = aspecd.processing.ScalarAlgebra()
+        processing.parameters["kind"] = "plus"
+        processing.chunk_size = 2
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.load(filename, mmap_mode="c")
+        dataset.process(processing)
+        self.assertIsInstance(dataset.data.data, np.memmap)
+        self.assertNotEqual(
+            filename, os.path.basename(dataset.data.data.filename)
+        )
+        np.testing.assert_allclose(np.ones([5, 10]), dataset.data.data)
+        np.testing.assert_allclose(np.zeros([5, 10]), np.load(filename))
+
+    def test_process_memory_mapped_data_in_chunks_reads_only_chunks(self):
+        filename = "test.npy"
+        self.addCleanup(os.remove, filename)
+        np.save(filename, np.zeros([1000, 1000]))
+        processing = aspecd.processing.ScalarAlgebra()
+        processing.parameters["kind"] = "plus"
+        processing.chunk_size = 10
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.load(filename, mmap_mode="c")
+        tracemalloc.start()
+        try:
+            dataset.process(processing)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, dataset.data.data.nbytes / 10)
+
 
 class TestMultiProcessingStep(unittest.TestCase):
     def setUp(self):
@@ -523,6 +660,48 @@ class TestNormalisation(unittest.TestCase):
                 self.dataset.process(self.processing)
                 self.assertEqual("", self.dataset.data.axes[-1].unit)
 
+    def test_process_in_chunks_gives_same_result(self):
+        self.dataset.data.data = np.random.random([50, 20])
+        reference = copy.deepcopy(self.dataset)
+        reference.process(self.processing)
+        self.processing.chunk_size = 7
+        self.dataset.process(self.processing)
+        np.testing.assert_allclose(
+            reference.data.data, self.dataset.data.data
+        )
+
+    def test_normalise_with_reused_step_uses_current_data(self):
+        self.dataset.data.data = np.asarray([1.0, 2.0, 4.0])
+        self.processing.process(self.dataset, from_dataset=True)
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.asarray([1.0, 2.0, 10.0])
+        self.processing.process(dataset, from_dataset=True)
+        np.testing.assert_allclose([0.1, 0.2, 1.0], dataset.data.data)
+
+    def test_normalise_to_area_in_chunks_gives_same_result(self):
+        self.processing.parameters["kind"] = "area"
+        reference = copy.deepcopy(self.dataset)
+        reference.process(self.processing)
+        self.processing.chunk_size = 7
+        self.dataset.process(self.processing)
+        np.testing.assert_allclose(
+            reference.data.data, self.dataset.data.data
+        )
+
+    def test_process_in_chunks_gives_same_axes(self):
+        self.dataset.data.data = np.random.random([50, 20])
+        self.dataset.data.axes[-1].quantity = "intensity"
+        self.dataset.data.axes[-1].unit = "mV"
+        reference = copy.deepcopy(self.dataset)
+        reference.process(self.processing)
+        self.processing.chunk_size = 3
+        self.dataset.process(self.processing)
+        for axis, reference_axis in zip(
+            self.dataset.data.axes, reference.data.axes
+        ):
+            self.assertEqual(reference_axis.quantity, axis.quantity)
+            self.assertEqual(reference_axis.unit, axis.unit)
+
 
 class TestIntegration(unittest.TestCase):
     def setUp(self):
@@ -548,6 +727,16 @@ class TestIntegration(unittest.TestCase):
         self.dataset.process(self.processing)
         self.assertAlmostEqual(0, np.min(self.dataset.data.data))
 
+    def test_process_in_chunks_gives_same_result(self):
+        self.dataset.data.data = np.random.random([50, 20])
+        reference = copy.deepcopy(self.dataset)
+        reference.process(self.processing)
+        self.processing.chunk_size = 7
+        self.dataset.process(self.processing)
+        np.testing.assert_allclose(
+            reference.data.data, self.dataset.data.data
+        )
+
 
 class TestDifferentiation(unittest.TestCase):
     def setUp(self):
@@ -591,6 +780,28 @@ class TestDifferentiation(unittest.TestCase):
             np.shape(original_data), np.shape(self.dataset.data.data)
         )
 
+    def test_process_in_chunks_gives_same_result(self):
+        self.dataset.data.data = np.random.random([50, 20])
+        reference = copy.deepcopy(self.dataset)
+        reference.process(self.processing)
+        self.processing.chunk_size = 7
+        self.dataset.process(self.processing)
+        np.testing.assert_allclose(
+            reference.data.data, self.dataset.data.data
+        )
+
+    def test_process_in_chunks_with_single_slice_in_chunk(self):
+        for shape, chunk_size in (([10, 7], 3), ([10, 7, 4], 1)):
+            with self.subTest(shape=shape, chunk_size=chunk_size):
+                self.dataset.data.data = np.random.random(shape)
+                reference = copy.deepcopy(self.dataset)
+                reference.process(self.processing)
+                self.processing.chunk_size = chunk_size
+                self.dataset.process(self.processing)
+                np.testing.assert_allclose(
+                    reference.data.data, self.dataset.data.data
+                )
+
 
 class TestScalarAlgebra(unittest.TestCase):
     def setUp(self):
@@ -701,6 +912,17 @@ class TestScalarAlgebra(unittest.TestCase):
         self.dataset.process(self.processing)
         self.assertAlmostEqual(0.5, self.dataset.data.data.max(), 5)
 
+    def test_process_in_chunks_gives_same_result(self):
+        self.dataset.data.data = np.random.random([50, 20])
+        self.processing.parameters["kind"] = "plus"
+        reference = copy.deepcopy(self.dataset)
+        reference.process(self.processing)
+        self.processing.chunk_size = 7
+        self.dataset.process(self.processing)
+        np.testing.assert_allclose(
+            reference.data.data, self.dataset.data.data
+        )
+
 
 class TestProjection(unittest.TestCase):
     def setUp(self):
@@ -1432,6 +1654,84 @@ class TestBaselineCorrection(unittest.TestCase):
         dataset.process(self.processing)
         self.assertAlmostEqual(0, dataset.data.data.mean())
 
+    def test_with_2D_dataset_sets_coefficients_for_each_slice(self):
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.ones([100, 5]) * np.arange(5)
+        self.processing.parameters["order"] = 1
+        processing_step = dataset.process(self.processing)
+        self.assertEqual(
+            (2, 5), processing_step.parameters["coefficients"].shape
+        )
+        np.testing.assert_allclose(
+            np.arange(5),
+            processing_step.parameters["coefficients"][0],
+            atol=1e-10,
+        )
+
+    def test_with_2D_dataset_along_second_axis_with_different_shape(self):
+        dataset = aspecd.dataset.Dataset()
+        slope = np.linspace(0, 1, 100)
+        dataset.data.data = np.ones([5, 100]) * slope
+        self.processing.parameters["axis"] = 1
+        self.processing.parameters["order"] = 1
+        processing_step = dataset.process(self.processing)
+        np.testing.assert_allclose(0, dataset.data.data, atol=1e-10)
+        self.assertEqual(
+            (2, 5), processing_step.parameters["coefficients"].shape
+        )
+
+    def test_with_3D_dataset_along_last_axis(self):
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = np.random.random([3, 4, 50])
+        reference = copy.deepcopy(dataset.data.data[1, 2])
+        self.processing.parameters["axis"] = 2
+        self.processing.parameters["order"] = 2
+        processing_step = dataset.process(self.processing)
+        reference_dataset = aspecd.dataset.Dataset()
+        reference_dataset.data.data = reference
+        self.processing.parameters["axis"] = 0
+        reference_dataset.process(self.processing)
+        np.testing.assert_allclose(
+            reference_dataset.data.data, dataset.data.data[1, 2]
+        )
+        self.assertEqual(
+            (3, 3, 4), processing_step.parameters["coefficients"].shape
+        )
+
+    def test_coefficients_equal_polynomial_fit(self):
+        data = np.random.random([50, 3])
+        self.dataset.data.data = copy.deepcopy(data)
+        self.processing.parameters["order"] = 3
+        processing_step = self.dataset.process(self.processing)
+        axis_values = self.dataset.data.axes[0].values
+        fit_indices = np.r_[0:5, 45:50]
+        for idx in range(3):
+            polynomial = np.polynomial.Polynomial.fit(
+                axis_values[fit_indices],
+                data[fit_indices, idx],
+                3,
+            )
+            np.testing.assert_allclose(
+                polynomial.convert().coef,
+                processing_step.parameters["coefficients"][:, idx],
+            )
+
+    def test_process_in_chunks_gives_same_result(self):
+        self.dataset.data.data = np.random.random([50, 20, 3])
+        self.processing.parameters["order"] = 1
+        self.processing.parameters["axis"] = 1
+        reference = copy.deepcopy(self.dataset)
+        reference_step = reference.process(self.processing)
+        self.processing.chunk_size = 7
+        processing_step = self.dataset.process(self.processing)
+        np.testing.assert_allclose(
+            reference.data.data, self.dataset.data.data
+        )
+        np.testing.assert_allclose(
+            reference_step.parameters["coefficients"],
+            processing_step.parameters["coefficients"],
+        )
+
 
 class TestAveraging(unittest.TestCase):
     def setUp(self):
@@ -2423,6 +2723,18 @@ class TestFiltering(unittest.TestCase):
         self.dataset2d.process(self.processing)
         self.assertTrue((filtered_data == self.dataset2d.data.data).all())
 
+    def test_savitzky_golay_filter_in_chunks_gives_same_result(self):
+        self.processing.parameters["type"] = "savitzky-golay"
+        self.processing.parameters["window_length"] = 5
+        self.processing.parameters["order"] = 2
+        reference = copy.deepcopy(self.dataset2d)
+        reference.process(self.processing)
+        self.processing.chunk_size = 3
+        self.dataset2d.process(self.processing)
+        np.testing.assert_allclose(
+            reference.data.data, self.dataset2d.data.data
+        )
+
 
 class TestCommonRangeExtraction(unittest.TestCase):
     def setUp(self):
@@ -3177,9 +3489,9 @@ class TestDenoising1DSVD(unittest.TestCase):
     def test_is_undoable(self):
         self.assertTrue(self.processing.undoable)
 
-    def test_with_nD_dataset_raises(self):
+    def test_with_3D_dataset_raises(self):
         dataset = aspecd.dataset.Dataset()
-        dataset.data.data = np.zeros([5, 5])
+        dataset.data.data = np.zeros([15, 15, 15])
         with self.assertRaises(aspecd.exceptions.NotApplicableToDatasetError):
             dataset.process(self.processing)
 
@@ -3237,3 +3549,112 @@ class TestDenoising1DSVD(unittest.TestCase):
             self.dataset.data.data[20:-20] - trend[20:-20],
             atol=8e-2,
         )
+
+    def test_with_2D_dataset_with_too_few_points_along_axis_raises(self):
+        self.dataset.data.data = np.zeros([10, 50])
+        with self.assertRaisesRegex(ValueError, "Too few data points"):
+            self.dataset.process(self.processing)
+
+    def test_with_axis_out_of_bounds_raises(self):
+        self.processing.parameters["axis"] = 1
+        self.dataset.data.data = self.signal
+        with self.assertRaisesRegex(IndexError, "Axis 1 out of bounds"):
+            self.dataset.process(self.processing)
+
+    def test_with_unknown_solver_raises(self):
+        self.processing.parameters["solver"] = "foo"
+        self.dataset.data.data = self.signal
+        with self.assertRaisesRegex(ValueError, "Unknown solver"):
+            self.dataset.process(self.processing)
+
+    def test_denoise_signal_with_randomised_solver(self):
+        self.processing.parameters["solver"] = "randomised"
+        self.dataset.data.data = self.noisy_signal
+        self.dataset.process(self.processing)
+        np.testing.assert_allclose(
+            self.signal[20:-20], self.dataset.data.data[20:-20], atol=5e-2
+        )
+
+    def test_randomised_solver_determines_same_rank(self):
+        # Ranks may differ for components close to the noise threshold
+        noise = np.random.default_rng(0).normal(scale=0.05, size=1000)
+        self.dataset.data.data = self.signal + noise
+        dataset = copy.deepcopy(self.dataset)
+        processing_step = self.dataset.process(self.processing)
+        self.processing.parameters["solver"] = "randomised"
+        randomised_processing_step = dataset.process(self.processing)
+        self.assertEqual(
+            processing_step.parameters["rank"],
+            randomised_processing_step.parameters["rank"],
+        )
+        np.testing.assert_allclose(
+            self.dataset.data.data, dataset.data.data, atol=1e-3
+        )
+
+    def test_randomised_solver_is_reproducible(self):
+        self.processing.parameters["solver"] = "randomised"
+        self.dataset.data.data = self.noisy_signal
+        dataset = copy.deepcopy(self.dataset)
+        self.dataset.process(self.processing)
+        dataset.process(self.processing)
+        np.testing.assert_array_equal(
+            self.dataset.data.data, dataset.data.data
+        )
+
+    def test_denoise_signal_with_trend_with_randomised_solver(self):
+        self.processing.parameters["solver"] = "randomised"
+        trend = np.linspace(0, 1, self.noisy_signal.size)
+        self.dataset.data.data = self.noisy_signal + trend
+        self.dataset.process(self.processing)
+        np.testing.assert_allclose(
+            self.signal[20:-20],
+            self.dataset.data.data[20:-20] - trend[20:-20],
+            atol=8e-2,
+        )
+
+    def test_denoise_2D_dataset_denoises_each_trace(self):
+        self.dataset.data.data = np.stack(
+            (self.noisy_signal, self.noisy_signal[::-1]), axis=1
+        )
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = self.noisy_signal[::-1]
+        self.dataset.process(self.processing)
+        dataset.process(self.processing)
+        np.testing.assert_allclose(
+            dataset.data.data, self.dataset.data.data[:, 1]
+        )
+
+    def test_denoise_2D_dataset_along_second_axis(self):
+        self.processing.parameters["axis"] = 1
+        self.dataset.data.data = np.stack(
+            (self.noisy_signal, self.noisy_signal[::-1])
+        )
+        dataset = aspecd.dataset.Dataset()
+        dataset.data.data = self.noisy_signal[::-1]
+        self.dataset.process(self.processing)
+        dataset.process(aspecd.processing.Denoising1DSVD())
+        np.testing.assert_allclose(
+            dataset.data.data, self.dataset.data.data[1, :]
+        )
+
+    def test_denoise_2D_dataset_returns_rank_for_each_trace(self):
+        self.dataset.data.data = np.stack(
+            (self.signal, self.noisy_signal), axis=1
+        )
+        processing_step = self.dataset.process(self.processing)
+        self.assertEqual(2, len(processing_step.parameters["rank"]))
+        self.assertTrue(all(processing_step.parameters["rank"]))
+
+    def test_denoise_2D_dataset_in_chunks(self):
+        self.dataset.data.data = np.stack(
+            (self.signal, self.noisy_signal, self.noisy_signal[::-1]), axis=1
+        )
+        dataset = copy.deepcopy(self.dataset)
+        processing_step = self.dataset.process(self.processing)
+        self.processing.chunk_size = 2
+        chunked_processing_step = dataset.process(self.processing)
+        np.testing.assert_allclose(self.dataset.data.data, dataset.data.data)
+        self.assertEqual(
+            processing_step.parameters["rank"],
+            chunked_processing_step.parameters["rank"],
+        )
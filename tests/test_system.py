@@ -103,3 +103,64 @@ class TestSystemInfo(unittest.TestCase):
         system_info = system.SystemInfo()
         system_info.from_dict(orig_dict)
         self.assertDictEqual(orig_dict, system_info.to_dict())
+
+    def test_instances_share_system_info(self):
+        system_info = system.SystemInfo()
+        self.assertIs(self.sysinfo.packages, system_info.packages)
+
+    def test_from_dict_does_not_change_other_instances(self):
+        system_info = system.SystemInfo()
+        system_info.from_dict({"user": {"login": "foo"}})
+        self.assertEqual(getpass.getuser(), self.sysinfo.user["login"])
+
+    def test_to_dict_does_not_share_system_info(self):
+        dict_ = self.sysinfo.to_dict()
+        dict_["packages"]["foo"] = "0.1.0"
+        self.assertNotIn("foo", self.sysinfo.packages)
+
+
+class TestClearCache(unittest.TestCase):
+    def test_clear_cache_collects_system_info_anew(self):
+        sysinfo = system.SystemInfo()
+        system.clear_cache()
+        self.assertIsNot(sysinfo.packages, system.SystemInfo().packages)
+
+
+class TestInternSystemInfo(unittest.TestCase):
+    def setUp(self):
+        self.dict_ = {
+            "history": [
+                {"sysinfo": system.SystemInfo().to_dict()},
+                {"sysinfo": system.SystemInfo().to_dict()},
+            ],
+            "system_info": system.SystemInfo().to_dict(),
+        }
+
+    def test_returns_dict(self):
+        self.assertIs(self.dict_, system.intern_system_info(self.dict_))
+
+    def test_identical_system_info_refers_to_same_object(self):
+        system.intern_system_info(self.dict_)
+        self.assertIs(
+            self.dict_["history"][0]["sysinfo"],
+            self.dict_["history"][1]["sysinfo"],
+        )
+        self.assertIs(
+            self.dict_["history"][0]["sysinfo"], self.dict_["system_info"]
+        )
+
+    def test_different_system_info_is_retained(self):
+        self.dict_["history"][1]["sysinfo"]["user"]["login"] = "foo"
+        system.intern_system_info(self.dict_)
+        self.assertEqual(
+            "foo", self.dict_["history"][1]["sysinfo"]["user"]["login"]
+        )
+        self.assertIsNot(
+            self.dict_["history"][0]["sysinfo"],
+            self.dict_["history"][1]["sysinfo"],
+        )
+
+    def test_yaml_contains_system_info_only_once(self):
+        yaml = utils.Yaml()
+        yaml.dict = system.intern_system_info(self.dict_)
+        self.assertEqual(1, yaml.write_stream().count("packages:"))
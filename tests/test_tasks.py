@@ -1,6 +1,7 @@
 """Tests for tasks."""
 
 import collections
+import concurrent.futures
 import contextlib
 import copy
 import datetime
@@ -9,6 +10,8 @@ import io
 import os
 import shutil
 import subprocess
+import sys
+import textwrap
 import unittest
 from unittest.mock import patch
 import warnings
@@ -92,6 +95,8 @@ class TestRecipe(unittest.TestCase):
                 "autosave_plots",
                 "autosave_datasets",
                 "write_history",
+                "import_workers",
+                "plot_workers",
             ],
             list(self.recipe.settings.keys()),
         )
@@ -223,6 +228,39 @@ class TestRecipe(unittest.TestCase):
                 isinstance(self.recipe.datasets[dataset_], dataset.Dataset)
             )
 
+    def test_has_import_times_property(self):
+        self.assertTrue(hasattr(self.recipe, "import_times"))
+
+    def test_from_dict_with_datasets_sets_import_times(self):
+        dict_ = {"datasets": self.datasets}
+        self.recipe.from_dict(dict_)
+        self.assertEqual(self.datasets, list(self.recipe.import_times.keys()))
+        for import_time in self.recipe.import_times.values():
+            self.assertGreater(import_time, 0)
+
+    def test_from_dict_with_import_workers_retains_order_of_datasets(self):
+        datasets = [f"/foo{number}" for number in range(20)]
+        dict_ = {"datasets": datasets, "settings": {"import_workers": 4}}
+        self.recipe.from_dict(dict_)
+        self.assertEqual(datasets, list(self.recipe.datasets.keys()))
+        for key, dataset_ in self.recipe.datasets.items():
+            self.assertEqual(key, dataset_.id)
+
+    def test_from_dict_with_import_workers_imports_data(self):
+        sources = []
+        for number in range(5):
+            filename = f"{self.dataset_filename}{number}"
+            np.savetxt(filename, np.full(3, number))
+            sources.append({"source": filename, "importer": "TxtImporter"})
+        dict_ = {"datasets": sources, "settings": {"import_workers": 4}}
+        try:
+            self.recipe.from_dict(dict_)
+        finally:
+            for source in sources:
+                os.remove(source["source"])
+        for number, dataset_ in enumerate(self.recipe.datasets.values()):
+            self.assertTrue(all(dataset_.data.data == number))
+
     def test_from_dict_with_dataset_as_dict_sets_dataset(self):
         dict_ = {"datasets": [{"source": self.dataset}]}
         self.recipe.from_dict(dict_)
@@ -977,6 +1015,127 @@ class TestChef(unittest.TestCase):
         for plotter in self.chef.recipe.plotters.values():
             self.assertFalse(plt.fignum_exists(plotter.figure.number))
 
+    def test_has_jobs_property(self):
+        self.assertTrue(hasattr(self.chef, "jobs"))
+
+    def test_cook_with_jobs_performs_tasks(self):
+        recipe = self.recipe
+        recipe_dict = {
+            "datasets": [self.dataset, "bar"],
+            "tasks": [self.processing_task, self.analysis_task],
+        }
+        recipe.from_dict(recipe_dict)
+        self.chef.jobs = 2
+        self.chef.cook(recipe=recipe)
+        for dataset_ in self.chef.recipe.datasets.values():
+            self.assertTrue(dataset_.history)
+            self.assertTrue(dataset_.analyses)
+
+    def test_cook_with_jobs_adds_results_to_recipe(self):
+        recipe = self.recipe
+        self.processing_task["apply_to"] = self.dataset
+        self.processing_task["result"] = "foo"
+        recipe_dict = {
+            "datasets": [self.dataset, "bar"],
+            "tasks": [
+                self.processing_task,
+                {**self.processing_task, "apply_to": "bar", "result": "baz"},
+            ],
+        }
+        recipe.from_dict(recipe_dict)
+        self.chef.jobs = 2
+        wait = concurrent.futures.wait
+
+        def wait_for_all_in_reverse_order(futures, **_):
+            # Tasks finishing in reverse order must not change the order
+            wait(futures)
+            return list(reversed(list(futures))), set()
+
+        with patch(
+            "concurrent.futures.wait",
+            side_effect=wait_for_all_in_reverse_order,
+        ):
+            self.chef.cook(recipe=recipe)
+        self.assertEqual(["foo", "baz"], list(self.chef.recipe.results))
+        self.assertTrue(self.chef.recipe.results["foo"].history)
+
+    def test_cook_with_jobs_performs_dependent_tasks_in_order(self):
+        recipe = self.recipe
+        processing_task = {
+            "kind": "processing",
+            "type": "ScalarAlgebra",
+            "properties": {"parameters": {"kind": "add", "value": 1}},
+        }
+        recipe_dict = {
+            "datasets": ["foo", "bar"],
+            "tasks": [
+                {**processing_task, "apply_to": "foo", "result": "foo1"},
+                {**processing_task, "apply_to": "bar"},
+                {**processing_task, "apply_to": "foo1", "result": "foo2"},
+                {
+                    "kind": "processing",
+                    "type": "DatasetAlgebra",
+                    "properties": {
+                        "parameters": {"kind": "plus", "dataset": "foo2"}
+                    },
+                    "apply_to": "bar",
+                },
+            ],
+        }
+        recipe.from_dict(recipe_dict)
+        for dataset_ in recipe.datasets.values():
+            dataset_.data.data = np.zeros(5)
+        self.chef.jobs = 2
+        self.chef.cook(recipe=recipe)
+        self.assertTrue(all(self.chef.recipe.results["foo2"].data.data == 2))
+        self.assertTrue(all(self.chef.recipe.datasets["bar"].data.data == 3))
+
+    def test_cook_with_jobs_adds_task_history_in_order_of_recipe(self):
+        recipe = self.recipe
+        recipe_dict = {
+            "datasets": [self.dataset, "bar"],
+            "tasks": [
+                {**self.processing_task, "apply_to": "bar"},
+                self.analysis_task,
+                {**self.processing_task, "apply_to": self.dataset},
+                self.annotation_task,
+            ],
+        }
+        recipe.from_dict(recipe_dict)
+        self.chef.cook(recipe=copy.deepcopy(recipe))
+        history = self.chef.history["tasks"]
+        chef = tasks.Chef()
+        chef.jobs = 2
+        chef.cook(recipe=recipe)
+        self.assertEqual(history, chef.history["tasks"])
+
+    def test_cook_with_jobs_skips_skipped_task(self):
+        recipe = self.recipe
+        self.processing_task["skip"] = True
+        recipe_dict = {
+            "datasets": [self.dataset],
+            "tasks": [self.processing_task, self.analysis_task],
+        }
+        recipe.from_dict(recipe_dict)
+        self.chef.jobs = 2
+        self.chef.cook(recipe=recipe)
+        self.assertFalse(self.chef.recipe.datasets[self.dataset].history)
+        self.assertEqual(1, len(self.chef.history["tasks"]))
+
+    def test_cook_with_jobs_performs_plotting_task_after_processing(self):
+        recipe = self.recipe
+        recipe_dict = {
+            "datasets": [self.dataset],
+            "tasks": [self.processing_task, self.plotting_task],
+        }
+        recipe.from_dict(recipe_dict)
+        recipe.settings["autosave_plots"] = False
+        self.chef.jobs = 2
+        self.chef.cook(recipe=recipe)
+        dataset_ = self.chef.recipe.datasets[self.dataset]
+        self.assertTrue(dataset_.history)
+        self.assertTrue(dataset_.representations)
+
 
 class TestTask(unittest.TestCase):
     def setUp(self):
@@ -3211,6 +3370,106 @@ class TestSinglePlotTask(unittest.TestCase):
             task_colormap, dict_["properties"]["properties"]["colormap"]
         )
 
+    def prepare_recipe_with_plot_workers(self, plotter="SinglePlotter1D"):
+        self.plotting_task = {
+            "kind": "singleplot",
+            "type": plotter,
+            "apply_to": self.datasets,
+        }
+        self.figure_filenames = [
+            "".join([name, "_", self.plotting_task["type"], ".pdf"])
+            for name in self.datasets
+        ]
+        self.recipe_dict = {
+            "datasets": self.datasets,
+            "settings": {"plot_workers": 2},
+            "tasks": [self.plotting_task],
+        }
+        self.prepare_recipe()
+        for dataset_ in self.recipe.datasets.values():
+            dataset_.data.data = np.random.random(5)
+        self.task.from_dict(self.plotting_task)
+        self.task.recipe = self.recipe
+
+    def test_perform_task_with_plot_workers_saves_plots(self):
+        self.prepare_recipe_with_plot_workers()
+        self.task.perform()
+        for name in self.figure_filenames:
+            self.assertTrue(os.path.exists(name))
+
+    def test_perform_task_with_plot_workers_adds_records_to_datasets(self):
+        self.prepare_recipe_with_plot_workers()
+        self.task.perform()
+        for dataset_ in self.recipe.datasets.values():
+            self.assertIsInstance(
+                dataset_.representations[0], aspecd.history.PlotHistoryRecord
+            )
+            self.assertEqual(
+                dataset_.label,
+                dataset_.representations[0].plot.properties.drawing.label,
+            )
+
+    def test_perform_task_with_plot_workers_adds_figure_records(self):
+        self.prepare_recipe_with_plot_workers()
+        self.task.perform()
+        self.assertEqual(
+            self.figure_filenames,
+            [figure.filename for figure in self.recipe.figures.values()],
+        )
+
+    def test_perform_task_with_plot_workers_yields_same_history(self):
+        self.prepare_recipe_with_plot_workers()
+        self.task.perform()
+        history = self.task.to_dict()
+        task = tasks.SingleplotTask()
+        task.from_dict(self.plotting_task)
+        task.recipe = self.recipe
+        self.recipe.settings["plot_workers"] = 1
+        self.recipe.figures = {}
+        task.perform()
+        self.assertEqual(task.to_dict(), history)
+
+    def test_perform_task_with_plot_workers_closes_figures(self):
+        self.prepare_recipe_with_plot_workers()
+        self.task.perform()
+        self.assertFalse(plt.get_fignums())
+
+    def test_perform_task_with_plot_workers_and_multiple_device_data(self):
+        self.prepare_recipe_with_plot_workers(
+            plotter="MultiDeviceDataPlotter1D"
+        )
+        devices = ["temperature", "pressure"]
+        for dataset_ in self.recipe.datasets.values():
+            for device in devices:
+                dataset_.device_data[device] = dataset.DeviceData()
+                dataset_.device_data[device].data = np.random.random(5)
+        self.task.properties["parameters"] = {"device_data": devices}
+        self.task.perform()
+        for name in self.figure_filenames:
+            self.assertTrue(os.path.exists(name))
+
+    def test_perform_task_with_plot_workers_and_composite_plotter(self):
+        self.prepare_recipe_with_plot_workers(
+            plotter="SingleCompositePlotter"
+        )
+        for dataset_ in self.recipe.datasets.values():
+            dataset_.device_data["temp"] = dataset.DeviceData()
+            dataset_.device_data["temp"].data = np.random.random(5)
+        plotter = plotting.SinglePlotter1D()
+        plotter.parameters["device_data"] = "temp"
+        self.task.properties["plotter"] = [plotter]
+        self.task.properties["grid_dimensions"] = [1, 1]
+        self.task.properties["subplot_locations"] = [[0, 0, 1, 1]]
+        self.task.perform()
+        for name in self.figure_filenames:
+            self.assertTrue(os.path.exists(name))
+
+    def test_perform_task_with_plot_workers_and_result_keeps_plotters(self):
+        self.prepare_recipe_with_plot_workers()
+        self.task.result = ["plot1", "plot2"]
+        self.task.perform()
+        self.assertEqual(2, len(plt.get_fignums()))
+
 
 class TestMultiPlotTask(unittest.TestCase):
     def setUp(self):
@@ -4884,6 +5143,9 @@ class TestChefDeService(unittest.TestCase):
         self.assertTrue(hasattr(self.chef_de_service, "serve"))
         self.assertTrue(callable(self.chef_de_service.serve))
 
+    def test_has_jobs_property(self):
+        self.assertTrue(hasattr(self.chef_de_service, "jobs"))
+
     def test_serve_without_recipe_raises(self):
         with self.assertRaises(aspecd.exceptions.MissingRecipeError):
             self.chef_de_service.serve()
@@ -4900,6 +5162,14 @@ class TestChefDeService(unittest.TestCase):
         )
         self.assertTrue(os.path.exists(self.figure_filename))
 
+    def test_serve_with_jobs_sets_jobs_of_chef(self):
+        self.create_recipe()
+        self.chef_de_service.jobs = 2
+        self.history_filename = self.chef_de_service.serve(
+            recipe_filename=self.recipe_filename
+        )
+        self.assertEqual(2, self.chef_de_service._chef.jobs)
+
     def test_serve_returns_history_filename(self):
         self.create_recipe()
         self.history_filename = self.chef_de_service.serve(
@@ -5047,6 +5317,17 @@ class TestServe(unittest.TestCase):
         )
         self.assertIn("[-v | -q]", result.stdout)
 
+    def test_has_jobs_argument(self):
+        result = subprocess.run(
+            ["serve", "-h"], capture_output=True, text=True
+        )
+        self.assertIn("--jobs N", result.stdout)
+
+    def test_serve_console_entry_point_with_jobs_cooks_recipe(self):
+        self.create_recipe()
+        subprocess.run(["serve", "--jobs", "2", self.recipe_filename])
+        self.assertTrue(os.path.exists(self.figure_filename))
+
     def test_serve_console_entry_point_cooks_recipe(self):
         self.create_recipe()
         subprocess.run(["serve", self.recipe_filename])
@@ -5102,3 +5383,62 @@ class TestServe(unittest.TestCase):
             text=True,
         )
         self.assertIn("Traceback (most recent call last):", result.stdout)
+
+
+class TestImports(unittest.TestCase):
+    def setUp(self):
+        self.export_target = "exported"
+        self.export_filename = "exported.adf"
+
+    def tearDown(self):
+        if os.path.exists(self.export_filename):
+            os.remove(self.export_filename)
+
+    def imported_modules(self, code="", modules=()):
+        code = textwrap.dedent(code) + textwrap.dedent(f"""
+            import sys
+            modules = {list(modules)!r}
+            print(" ".join(module for module in modules
+                           if module in sys.modules))
+            """)
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.split()
+
+    def test_import_does_not_import_heavy_dependencies(self):
+        modules = self.imported_modules(
+            "import aspecd.tasks",
+            ["matplotlib", "scipy", "jinja2", "asdf", "pkg_resources"],
+        )
+        self.assertEqual([], modules)
+
+    def test_cook_processing_recipe_does_not_import_matplotlib(self):
+        code = f"""
+            import aspecd.tasks
+            recipe = aspecd.tasks.Recipe()
+            recipe.from_dict({{
+                "datasets": ["foo"],
+                "tasks": [
+                    {{
+                        "kind": "processing",
+                        "type": "ScalarAlgebra",
+                        "properties": {{
+                            "parameters": {{"kind": "add", "value": 1}},
+                        }},
+                    }},
+                    {{
+                        "kind": "export",
+                        "type": "AdfExporter",
+                        "properties": {{"target": "{self.export_target}"}},
+                    }},
+                ],
+            }})
+            aspecd.tasks.Chef(recipe=recipe).cook()
+            """
+        modules = self.imported_modules(code, ["matplotlib", "jinja2"])
+        self.assertTrue(os.path.exists(self.export_filename))
+        self.assertEqual([], modules)
@@ -3,10 +3,12 @@
 import collections
 import copy
 import datetime
+import json
 import logging
 import os
 import shutil
 import unittest
+import zipfile
 from unittest.mock import patch
 
 import numpy as np
@@ -30,6 +32,114 @@ class TestObjectFromClassName(unittest.TestCase):
         object_ = utils.object_from_class_name(class_name)
         self.assertTrue(isinstance(object_, dataset.Dataset))
 
+    def test_object_from_class_name_with_registered_class(self):
+        utils.register_class(dataset.CalculatedDataset, name="foo.Bar")
+        object_ = utils.object_from_class_name("foo.Bar")
+        utils.unregister_class("foo.Bar")
+        self.assertTrue(isinstance(object_, dataset.CalculatedDataset))
+
+
+class TestClassFromName(unittest.TestCase):
+    def tearDown(self):
+        utils.unregister_class("foo.Bar")
+        utils.clear_class_cache()
+
+    def test_class_from_name(self):
+        class_ = utils.class_from_name("aspecd.dataset.Dataset")
+        self.assertIs(dataset.Dataset, class_)
+
+    def test_class_from_name_memoises_class(self):
+        utils.class_from_name("aspecd.dataset.Dataset")
+        with patch("importlib.import_module") as import_module:
+            utils.class_from_name("aspecd.dataset.Dataset")
+        import_module.assert_not_called()
+
+    def test_class_from_name_with_missing_module_raises(self):
+        with self.assertRaises(ModuleNotFoundError):
+            utils.class_from_name("foo.Bar")
+
+    def test_class_from_name_with_missing_class_raises(self):
+        with self.assertRaises(AttributeError):
+            utils.class_from_name("aspecd.dataset.Foo")
+
+    def test_class_from_name_memoises_missing_class(self):
+        with self.assertRaises(AttributeError):
+            utils.class_from_name("aspecd.dataset.Foo")
+        with patch("importlib.import_module") as import_module:
+            with self.assertRaises(AttributeError):
+                utils.class_from_name("aspecd.dataset.Foo")
+        import_module.assert_not_called()
+
+    def test_clear_class_cache_resolves_class_name_anew(self):
+        utils.class_from_name("aspecd.dataset.Dataset")
+        utils.clear_class_cache()
+        with patch("importlib.import_module") as import_module:
+            utils.class_from_name("aspecd.dataset.Dataset")
+        import_module.assert_called_once()
+
+    def test_registered_class_takes_precedence(self):
+        utils.register_class(
+            dataset.CalculatedDataset, name="aspecd.dataset.Dataset"
+        )
+        class_ = utils.class_from_name("aspecd.dataset.Dataset")
+        utils.unregister_class("aspecd.dataset.Dataset")
+        self.assertIs(dataset.CalculatedDataset, class_)
+
+    def test_register_class_overrides_missing_class(self):
+        with self.assertRaises(ModuleNotFoundError):
+            utils.class_from_name("foo.Bar")
+        utils.register_class(dataset.Dataset, name="foo.Bar")
+        self.assertIs(dataset.Dataset, utils.class_from_name("foo.Bar"))
+
+    def test_register_class_defaults_to_full_class_name(self):
+        utils.register_class(dataset.Dataset)
+        self.assertIs(
+            dataset.Dataset, utils._CLASS_REGISTRY["aspecd.dataset.Dataset"]
+        )
+        utils.unregister_class("aspecd.dataset.Dataset")
+
+    def test_register_class_returns_class(self):
+        class_ = utils.register_class(dataset.Dataset, name="foo.Bar")
+        self.assertIs(dataset.Dataset, class_)
+
+    def test_unregister_class_removes_class(self):
+        utils.register_class(dataset.Dataset, name="foo.Bar")
+        utils.unregister_class("foo.Bar")
+        with self.assertRaises(ModuleNotFoundError):
+            utils.class_from_name("foo.Bar")
+
+
+class TestLazyModule(unittest.TestCase):
+    def test_instantiate_class(self):
+        utils.LazyModule()
+
+    def test_has_name_property(self):
+        module = utils.LazyModule("json")
+        self.assertEqual("json", module.name)
+
+    def test_access_attribute_returns_attribute_of_module(self):
+        module = utils.LazyModule("json")
+        self.assertIs(json.dumps, module.dumps)
+
+    def test_access_submodule_imports_submodule(self):
+        module = utils.LazyModule("xml")
+        self.assertEqual("xml.dom", module.dom.__name__)
+
+    def test_access_missing_attribute_raises(self):
+        module = utils.LazyModule("json")
+        with self.assertRaises(AttributeError):
+            _ = module.foo
+
+    def test_access_attribute_of_missing_module_raises(self):
+        module = utils.LazyModule("foo")
+        with self.assertRaises(ModuleNotFoundError):
+            _ = module.bar
+
+    def test_instantiate_does_not_import_module(self):
+        with patch("importlib.import_module") as import_module:
+            utils.LazyModule("json")
+        import_module.assert_not_called()
+
 
 class TestToDictMixin(unittest.TestCase):
     def setUp(self):
@@ -304,6 +414,43 @@ class TestToDictMixin(unittest.TestCase):
         obj = Test()
         self.assertEqual(["purpose", "prop"], list(obj.to_dict().keys()))
 
+    def test_numpy_array_is_not_copied(self):
+        self.mixed_in.foo = np.random.random(5)
+        obj_dict = self.mixed_in.to_dict()
+        self.assertIs(self.mixed_in.foo, obj_dict["foo"])
+
+    def test_memory_mapped_array_is_not_traversed(self):
+        np.save("foo.npy", np.random.random(5))
+        self.mixed_in.foo = np.load("foo.npy", mmap_mode="r")
+        obj_dict = self.mixed_in.to_dict()
+        self.assertIsInstance(obj_dict["foo"], np.ndarray)
+        del self.mixed_in.foo, obj_dict
+        os.remove("foo.npy")
+
+    def test_changing_properties_to_exclude_is_respected(self):
+        self.mixed_in.foo = "bar"
+        self.mixed_in.bar = "baz"
+        self.mixed_in.to_dict()
+        self.mixed_in._exclude_from_to_dict = ["bar"]
+        self.assertNotIn("bar", self.mixed_in.to_dict())
+
+    def test_object_with_dict_is_traversed(self):
+        class Test:
+            def __init__(self):
+                self.foo = "bar"
+                self._bar = "baz"
+
+        self.mixed_in.foo = Test()
+        self.assertDictEqual({"foo": {"foo": "bar"}}, self.mixed_in.to_dict())
+
+    def test_list_subclass_with_attributes_is_traversed(self):
+        class Test(list):
+            pass
+
+        self.mixed_in.foo = Test([1, 2])
+        self.mixed_in.foo.bar = "baz"
+        self.assertDictEqual({"foo": {"bar": "baz"}}, self.mixed_in.to_dict())
+
 
 class TestGetAspecdVersion(unittest.TestCase):
     def test_version_not_empty(self):
@@ -471,6 +618,51 @@ class TestYaml(unittest.TestCase):
         os.remove(os.path.join("bar", filename))
         os.rmdir("bar")
 
+    def test_serialise_large_numpy_arrays_collects_binary_arrays(self):
+        array1 = np.random.rand(self.yaml.numpy_array_size_threshold + 1)
+        array2 = np.random.rand(self.yaml.numpy_array_size_threshold + 1)
+        self.yaml.dict = {"foo": array1, "bar": {"baz": [{"foo": array2}]}}
+        self.yaml.serialise_numpy_arrays()
+        filename1 = self.yaml.dict["foo"]["file"]
+        filename2 = self.yaml.dict["bar"]["baz"][0]["foo"]["file"]
+        self.assertListEqual(
+            [filename1, filename2], list(self.yaml.binary_arrays.keys())
+        )
+        self.assertIs(array2, self.yaml.binary_arrays[filename2])
+        os.remove(filename1)
+        os.remove(filename2)
+
+    def test_serialise_identical_numpy_arrays_collects_one_array(self):
+        array = np.random.rand(self.yaml.numpy_array_size_threshold + 1)
+        self.yaml.dict = {"foo": array, "bar": array.copy()}
+        self.yaml.serialise_numpy_arrays()
+        filename = self.yaml.dict["foo"]["file"]
+        self.assertEqual(filename, self.yaml.dict["bar"]["file"])
+        self.assertEqual(1, len(self.yaml.binary_arrays))
+        self.assertEqual(1, len(self.yaml.binary_files))
+        os.remove(filename)
+
+    def test_serialise_without_writing_binary_files_creates_no_file(self):
+        array = np.random.rand(self.yaml.numpy_array_size_threshold + 1)
+        self.yaml.dict = {"foo": array}
+        self.yaml.write_binary_files = False
+        self.yaml.serialise_numpy_arrays()
+        filename = self.yaml.dict["foo"]["file"]
+        self.assertFalse(os.path.exists(filename))
+        self.assertIn(filename, self.yaml.binary_arrays)
+
+    def test_serialise_with_blob_store_adds_arrays_to_store(self):
+        array = np.random.rand(self.yaml.numpy_array_size_threshold + 1)
+        self.yaml.blob_store = utils.BlobStore(directory="blobs")
+        self.yaml.dict = {"foo": array}
+        self.yaml.serialise_numpy_arrays()
+        filename = self.yaml.dict["foo"]["file"]
+        self.assertTrue(self.yaml.dict["foo"]["blob"])
+        self.assertIn(filename, self.yaml.blob_store)
+        self.assertFalse(os.path.exists(filename))
+        self.assertFalse(self.yaml.binary_arrays)
+        shutil.rmtree("blobs")
+
     def test_serialise_numpy_array_in_hierarchical_dict_creates_dict(self):
         array = np.asarray([[0.0, 1.0, 2.0], [1.0, 2.0, 3.0]])
         array_dict = {
@@ -557,6 +749,27 @@ class TestYaml(unittest.TestCase):
         )
         os.remove("foo.npy")
 
+    def test_deserialise_numpy_array_from_blob_store(self):
+        array = np.random.rand(self.yaml.numpy_array_size_threshold + 1)
+        self.yaml.blob_store = utils.BlobStore(directory="blobs")
+        self.yaml.dict = {"foo": array}
+        self.yaml.serialise_numpy_arrays()
+        self.yaml.deserialise_numpy_arrays()
+        shutil.rmtree("blobs")
+        np.testing.assert_array_equal(array, self.yaml.dict["foo"])
+
+    def test_deserialise_from_blob_store_without_store_raises(self):
+        self.yaml.dict = {
+            "foo": {
+                "type": "numpy.ndarray",
+                "dtype": "float64",
+                "file": "foo.npy",
+                "blob": True,
+            }
+        }
+        with self.assertRaises(aspecd.exceptions.MissingBlobStoreError):
+            self.yaml.deserialise_numpy_arrays()
+
     def test_deserialise_large_numpy_array_with_binary_directory(self):
         array = np.random.rand(self.yaml.numpy_array_size_threshold + 1)
         resulting_dict = {"foo": array}
@@ -677,12 +890,258 @@ class TestYaml(unittest.TestCase):
         yaml_object.read_stream(dump)
         self.assertEqual(1e3, yaml_object.dict["foo"])
 
+    def test_instantiation_does_not_modify_global_loader(self):
+        resolvers = copy.deepcopy(yaml.SafeLoader.yaml_implicit_resolvers)
+        aspecd.utils.Yaml()
+        self.assertEqual(resolvers, yaml.SafeLoader.yaml_implicit_resolvers)
+
+    def test_instantiation_does_not_add_resolvers(self):
+        resolvers = copy.copy(self.yaml.loader.yaml_implicit_resolvers["1"])
+        aspecd.utils.Yaml()
+        self.assertEqual(
+            resolvers, self.yaml.loader.yaml_implicit_resolvers["1"]
+        )
+
+    @unittest.skipUnless(hasattr(yaml, "CSafeLoader"), "requires libyaml")
+    def test_loader_and_dumper_are_c_accelerated(self):
+        self.assertTrue(issubclass(self.yaml.loader, yaml.CSafeLoader))
+        self.assertTrue(issubclass(self.yaml.dumper, yaml.CSafeDumper))
+
+    def test_write_stream_quotes_strings_resolving_to_floats(self):
+        self.yaml.dict = {"foo": "1e3"}
+        dump = self.yaml.write_stream()
+        yaml_object = aspecd.utils.Yaml()
+        yaml_object.read_stream(dump)
+        self.assertEqual("1e3", yaml_object.dict["foo"])
+
     def test_write_stream_converts_tuple_to_list(self):
         yaml_dict = {"foo": (1, 2)}
         self.yaml.dict = yaml_dict
         dump = self.yaml.write_stream()
         self.assertNotIn("!!python/tuple", dump)
 
+    def test_deserialise_numpy_arrays_from_archive(self):
+        array = np.random.random(1000)
+        self.yaml.dict = {"foo": array}
+        self.yaml.binary_directory = "binaryData"
+        self.yaml.serialise_numpy_arrays()
+        archive = "test.zip"
+        with zipfile.ZipFile(archive, "w") as zipped_file:
+            for filename in self.yaml.binary_files:
+                zipped_file.write(os.path.join("binaryData", filename))
+        shutil.rmtree("binaryData")
+        yaml_object = aspecd.utils.Yaml()
+        yaml_object.dict = self.yaml.dict
+        yaml_object.binary_archive = archive
+        yaml_object.binary_directory = "binaryData"
+        yaml_object.deserialise_numpy_arrays()
+        os.remove(archive)
+        np.testing.assert_allclose(array, yaml_object.dict["foo"])
+
+
+class TestLazyArray(unittest.TestCase):
+    def setUp(self):
+        self.archive = "test.zip"
+        self.member = "array.npy"
+        self.array = np.random.random((10, 20))
+        with zipfile.ZipFile(
+            self.archive, "w", compression=zipfile.ZIP_DEFLATED
+        ) as zipped_file:
+            with zipped_file.open(self.member, "w") as file:
+                np.save(file, self.array)
+
+    def tearDown(self):
+        if os.path.exists(self.archive):
+            os.remove(self.archive)
+
+    def test_instantiate_class(self):
+        utils.LazyArray()
+
+    def test_reads_shape_and_dtype_without_loading(self):
+        array = utils.LazyArray(archive=self.archive, member=self.member)
+        self.assertEqual(self.array.shape, array.shape)
+        self.assertEqual(self.array.dtype, array.dtype)
+        self.assertEqual(2, array.ndim)
+        self.assertFalse(array.loaded)
+
+    def test_load_returns_array(self):
+        array = utils.LazyArray(archive=self.archive, member=self.member)
+        np.testing.assert_allclose(self.array, array.load())
+        self.assertTrue(array.loaded)
+
+    def test_asarray_returns_array(self):
+        array = utils.LazyArray(archive=self.archive, member=self.member)
+        np.testing.assert_allclose(self.array, np.asarray(array))
+
+    def test_asarray_returns_cached_array(self):
+        array = utils.LazyArray(archive=self.archive, member=self.member)
+        self.assertIs(array.load(), np.asarray(array))
+
+    def test_array_with_copy_returns_copy(self):
+        array = utils.LazyArray(archive=self.archive, member=self.member)
+        copied_array = np.array(array, copy=True)
+        np.testing.assert_allclose(self.array, copied_array)
+        self.assertFalse(np.shares_memory(array.load(), copied_array))
+
+    def test_array_without_copy_returns_cached_array(self):
+        array = utils.LazyArray(archive=self.archive, member=self.member)
+        self.assertIs(array.load(), np.array(array, copy=False))
+
+    def test_array_without_copy_converting_dtype_raises(self):
+        array = utils.LazyArray(archive=self.archive, member=self.member)
+        with self.assertRaises(ValueError):
+            np.array(array, dtype=np.float32, copy=False)
+
+    def test_asarray_converts_dtype(self):
+        array = utils.LazyArray(archive=self.archive, member=self.member)
+        self.assertEqual(np.float32, np.asarray(array, np.float32).dtype)
+
+
+class TestArrayFromZip(unittest.TestCase):
+    def setUp(self):
+        self.archive = "test.zip"
+        self.member = "array.npy"
+        self.array = np.random.random((10, 20))
+
+    def tearDown(self):
+        if os.path.exists(self.archive):
+            os.remove(self.archive)
+
+    def create_archive(self, compression=zipfile.ZIP_STORED):
+        with zipfile.ZipFile(
+            self.archive, "w", compression=compression
+        ) as zipped_file:
+            with zipped_file.open(self.member, "w") as file:
+                np.save(file, self.array)
+
+    def test_returns_array(self):
+        self.create_archive()
+        array = utils.array_from_zip(archive=self.archive, member=self.member)
+        self.assertIsInstance(array, np.ndarray)
+        np.testing.assert_allclose(self.array, array)
+
+    def test_lazy_with_stored_member_returns_memmap(self):
+        self.create_archive()
+        array = utils.array_from_zip(
+            archive=self.archive, member=self.member, lazy=True
+        )
+        self.assertIsInstance(array, np.memmap)
+        np.testing.assert_allclose(self.array, array)
+
+    def test_modifying_memmap_does_not_modify_archive(self):
+        self.create_archive()
+        array = utils.array_from_zip(
+            archive=self.archive, member=self.member, lazy=True
+        )
+        array[0, 0] = 42
+        array = utils.array_from_zip(archive=self.archive, member=self.member)
+        self.assertEqual(self.array[0, 0], array[0, 0])
+
+    def test_lazy_with_compressed_member_returns_lazy_array(self):
+        self.create_archive(compression=zipfile.ZIP_DEFLATED)
+        array = utils.array_from_zip(
+            archive=self.archive, member=self.member, lazy=True
+        )
+        self.assertIsInstance(array, utils.LazyArray)
+        np.testing.assert_allclose(self.array, array.load())
+
+    def test_mmap_mode_with_stored_member_returns_memmap(self):
+        self.create_archive()
+        array = utils.array_from_zip(
+            archive=self.archive, member=self.member, mmap_mode="r"
+        )
+        self.assertIsInstance(array, np.memmap)
+        self.assertEqual("r", array.mode)
+        np.testing.assert_allclose(self.array, array)
+
+    def test_mmap_mode_with_compressed_member_returns_array(self):
+        self.create_archive(compression=zipfile.ZIP_DEFLATED)
+        array = utils.array_from_zip(
+            archive=self.archive, member=self.member, mmap_mode="r"
+        )
+        self.assertNotIsInstance(array, np.memmap)
+        np.testing.assert_allclose(self.array, array)
+
+    def test_invalid_mmap_mode_raises(self):
+        self.create_archive()
+        with self.assertRaisesRegex(ValueError, "Invalid mode"):
+            utils.array_from_zip(
+                archive=self.archive, member=self.member, mmap_mode="w+"
+            )
+
+
+class TestBlobStore(unittest.TestCase):
+    def setUp(self):
+        self.store = utils.BlobStore(directory="blobs")
+        self.array = np.random.random(101)
+        self.filename = "0123abcd.npy"
+
+    def tearDown(self):
+        if os.path.exists(self.store.directory):
+            shutil.rmtree(self.store.directory)
+
+    def test_instantiate_class(self):
+        pass
+
+    def test_add_writes_array_to_subdirectory(self):
+        self.store.add(self.filename, self.array)
+        self.assertTrue(
+            os.path.exists(os.path.join("blobs", "01", self.filename))
+        )
+
+    def test_contains_added_array(self):
+        self.assertNotIn(self.filename, self.store)
+        self.store.add(self.filename, self.array)
+        self.assertIn(self.filename, self.store)
+
+    def test_add_existing_array_does_not_overwrite(self):
+        self.store.add(self.filename, self.array)
+        self.store.add(self.filename, np.zeros(5))
+        np.testing.assert_array_equal(
+            self.array, self.store.load(self.filename)
+        )
+
+    def test_add_leaves_no_temporary_files(self):
+        self.store.add(self.filename, self.array)
+        self.assertListEqual(
+            [self.filename], os.listdir(os.path.join("blobs", "01"))
+        )
+
+    def test_load_returns_array(self):
+        self.store.add(self.filename, self.array)
+        np.testing.assert_array_equal(
+            self.array, self.store.load(self.filename)
+        )
+
+    def test_load_with_mmap_mode_returns_memmap(self):
+        self.store.add(self.filename, self.array)
+        array = self.store.load(self.filename, mmap_mode="r")
+        self.assertIsInstance(array, np.memmap)
+
+    def test_filenames_returns_all_arrays(self):
+        self.store.add(self.filename, self.array)
+        self.store.add("ffff.npy", self.array)
+        self.assertListEqual(
+            [self.filename, "ffff.npy"], self.store.filenames()
+        )
+        self.assertEqual(2, len(self.store))
+
+    def test_filenames_without_directory_returns_empty_list(self):
+        self.assertListEqual([], self.store.filenames())
+
+    def test_collect_garbage_removes_unreferenced_arrays(self):
+        self.store.add(self.filename, self.array)
+        self.store.add("ffff.npy", self.array)
+        removed = self.store.collect_garbage(referenced=[self.filename])
+        self.assertListEqual(["ffff.npy"], removed)
+        self.assertListEqual([self.filename], self.store.filenames())
+
+    def test_collect_garbage_with_dry_run_keeps_arrays(self):
+        self.store.add(self.filename, self.array)
+        removed = self.store.collect_garbage(dry_run=True)
+        self.assertListEqual([self.filename], removed)
+        self.assertIn(self.filename, self.store)
+
 
 class TestReplaceValueInDict(unittest.TestCase):
     def test_replace_value_returns_dict(self):